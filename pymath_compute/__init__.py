@@ -5,4 +5,8 @@ This module provides various imports related to mathematical modeling and solvin
 To better documentation, please refer to the Github Page.
     > https://github.com/ricardoleal20/pymath_compute
 """
-from pymath_compute.model import Variable, MathExpression, MathFunction
+from pymath_compute.model import (
+    Variable, VariableArray, MathExpression, MathFunction, SparsePolynomial, Model,
+    LazyExpression, lazy, IncrementalEvaluator, ExpressionSet, QuadraticForm, quicksum,
+    Constraint, ConstraintMatrix, linear_sum, register_derivative
+)
@@ -0,0 +1,14 @@
+"""
+Evaluation Engine Module.
+
+This module provides the engines that evaluate the expressions over large sets of
+points, using several processes or streaming the points from disk.
+
+Includes:
+    - evaluate_parallel
+    - evaluate_stream
+    - evaluate_to_memmap
+    - iter_chunks
+"""
+from pymath_compute.engine.parallel import evaluate_parallel
+from pymath_compute.engine.streaming import evaluate_stream, evaluate_to_memmap, iter_chunks
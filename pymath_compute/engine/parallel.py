@@ -0,0 +1,136 @@
+"""
+Parallel evaluation module.
+
+This module evaluates an expression (or an ExpressionSet) over a large matrix of points
+using a pool of processes. The points and the output live in shared memory, so each
+worker reads its range of rows and writes its results without copying them through the
+pool. The expression is sent to each worker only once, when the worker starts.
+"""
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Optional
+import numpy as np
+# Local imports
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.expression_set import ExpressionSet
+from pymath_compute.model.variable import Variable
+
+# State of each worker process, set by its initializer
+_WORKER: dict[str, Any] = {}
+
+
+def _attach(name: str, shape: tuple[int, ...]) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Attach to a shared memory block and get the float64 array that uses it"""
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+
+
+def _init_worker(payload: bytes, points: tuple[str, tuple[int, ...]],
+                 output: tuple[str, tuple[int, ...]]) -> None:
+    """Load the expression and attach to the shared memory blocks of the pool"""
+    # The expression and its variables are loaded together, so they share the variables
+    _WORKER["expression"], _WORKER["variables"] = pickle.loads(payload)
+    _WORKER["points_block"], _WORKER["points"] = _attach(*points)
+    _WORKER["output_block"], _WORKER["output"] = _attach(*output)
+
+
+def _evaluate_rows(expression: Any, variables: list[Variable], points: np.ndarray) -> np.ndarray:
+    """Evaluate the expression over a block of points"""
+    if isinstance(expression, ExpressionSet):
+        return expression.evaluate_batch(points)
+    return expression.evaluate_batch(points, variables)
+
+
+def _evaluate_range(start: int, stop: int) -> int:
+    """Evaluate a range of rows of the shared points, into the shared output"""
+    _WORKER["output"][start:stop] = _evaluate_rows(
+        _WORKER["expression"], _WORKER["variables"], _WORKER["points"][start:stop])
+    return stop - start
+
+
+def evaluate_parallel(  # pylint: disable=R0913, R0914
+    expression: MathExpression | ExpressionSet,
+    points: np.ndarray,
+    variables: Optional[list[Variable]] = None,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> np.ndarray:
+    """Evaluate an expression or an ExpressionSet over several points, using a pool
+    of processes. The MathFunctions of the expression should be picklable (such as
+    NumPy ufuncs or functions defined at the module level).
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        expr = x * y + MathFunction(np.sin, x)
+        points = np.random.uniform(0, 10, size=(10_000_000, 2))
+        values = evaluate_parallel(expr, points, workers=8)
+        ```
+
+    Args:
+        expression (MathExpression | ExpressionSet): The expression to evaluate.
+        points (np.ndarray): A 2-D array where each row is a point and each column
+            is a variable.
+        variables (Optional[list[Variable]]): The variable of each column. By default,
+            it uses the variables of the expression (or of the set).
+        workers (Optional[int]): The number of processes. By default, it uses the
+            number of CPUs. With a single worker, it is evaluated in this process.
+        chunk_size (Optional[int]): The number of rows of each task. By default,
+            the rows are split in four tasks per worker.
+
+    Returns:
+        np.ndarray: The value for each point. For an ExpressionSet, it is a 2-D array
+            with a row per point and a column per expression.
+    """
+    if not isinstance(expression, (MathExpression, ExpressionSet)):
+        raise TypeError("We're expecting a MathExpression or an ExpressionSet," +
+                        f" but instead we got {type(expression)}.")
+    points = np.asarray(points, dtype=np.float64)
+    if isinstance(expression, ExpressionSet):
+        if variables is not None and list(variables) != expression.variables:
+            expression = ExpressionSet(expression.expressions, list(variables))
+        variables = expression.variables
+        shape: tuple[int, ...] = (points.shape[0], len(expression))
+    else:
+        variables = expression.variables if variables is None else list(variables)
+        shape = (points.shape[0],)
+    if points.ndim != 2 or points.shape[1] != len(variables):
+        raise ValueError(
+            f"We're expecting a 2-D array with {len(variables)} columns," +
+            f" but instead we got an array with shape {points.shape}.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"The number of workers should be positive, but it is {workers}.")
+    rows = points.shape[0]
+    if workers == 1 or rows == 0:
+        return _evaluate_rows(expression, variables, points)
+    chunk_size = chunk_size or max(1, -(-rows // (workers * 4)))
+
+    points_block = shared_memory.SharedMemory(create=True, size=max(1, points.nbytes))
+    output_block = shared_memory.SharedMemory(
+        create=True, size=max(1, int(np.prod(shape)) * 8))
+    try:
+        np.ndarray(points.shape, dtype=np.float64, buffer=points_block.buf)[:] = points
+        output = np.ndarray(shape, dtype=np.float64, buffer=output_block.buf)
+        payload = pickle.dumps((expression, variables))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(payload, (points_block.name, points.shape), (output_block.name, shape))
+        ) as pool:
+            tasks = [pool.submit(_evaluate_range, start, min(start + chunk_size, rows))
+                     for start in range(0, rows, chunk_size)]
+            for task in tasks:
+                task.result()
+        result = output.copy()
+        del output
+        return result
+    finally:
+        points_block.close()
+        points_block.unlink()
+        output_block.close()
+        output_block.unlink()
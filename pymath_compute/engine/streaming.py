@@ -0,0 +1,192 @@
+"""
+Streaming evaluation module.
+
+This module evaluates an expression (or an ExpressionSet) over datasets that don't fit
+in memory. The points are read chunk by chunk from a memory-mapped `.npy` file, an
+array or any iterator of 2-D chunks, and each chunk is evaluated with the vectorized
+path. Only a chunk of points and its results are in memory at the same time.
+"""
+import os
+from typing import Iterable, Iterator, Optional
+import numpy as np
+# Local imports
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.expression_set import ExpressionSet
+from pymath_compute.model.variable import Variable
+
+# Source of points: a path to a `.npy` file, an array (or memmap), or an iterator of chunks
+PointsSource = str | os.PathLike | np.ndarray | Iterable[np.ndarray]
+
+
+def _open_source(source: PointsSource) -> np.ndarray | Iterable[np.ndarray]:
+    """Open the `.npy` files as read-only memmaps, so the rows are read on demand"""
+    if isinstance(source, (str, os.PathLike)):
+        return np.load(source, mmap_mode="r")
+    return source
+
+
+def iter_chunks(source: PointsSource, chunk_size: int = 1_000_000) -> Iterator[np.ndarray]:
+    """Iterate over the rows of a source of points, by chunks.
+
+    Args:
+        source (PointsSource): A path to a `.npy` file, a 2-D array (or memmap) or an
+            iterator of 2-D chunks. The chunks of an iterator are yielded as they are.
+        chunk_size (int): The number of rows of each chunk, for the paths and arrays.
+
+    Returns:
+        Iterator[np.ndarray]: The 2-D chunks of points.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size should be positive, but it is {chunk_size}.")
+    source = _open_source(source)
+    if isinstance(source, np.ndarray):
+        if source.ndim != 2:
+            raise ValueError("We're expecting a 2-D array of points," +
+                             f" but instead we got an array with shape {source.shape}.")
+        for start in range(0, source.shape[0], chunk_size):
+            yield source[start:start + chunk_size]
+        return
+    for chunk in source:
+        chunk = np.asarray(chunk)
+        if chunk.ndim != 2:
+            raise ValueError("We're expecting 2-D chunks of points," +
+                             f" but instead we got a chunk with shape {chunk.shape}.")
+        yield chunk
+
+
+class _ChunkEvaluator:
+    """Evaluate the chunks of points of a source, where the columns are mapped to the
+    variables only once"""
+    __slots__ = ["expression", "variables", "width"]
+
+    def __init__(
+        self,
+        expression: MathExpression | ExpressionSet,
+        variables: Optional[list[Variable]]
+    ) -> None:
+        if isinstance(expression, ExpressionSet):
+            if variables is not None and list(variables) != expression.variables:
+                expression = ExpressionSet(expression.expressions, list(variables))
+            self.variables = expression.variables
+            self.width: Optional[int] = len(expression)
+        elif isinstance(expression, MathExpression):
+            self.variables = expression.variables if variables is None else list(variables)
+            slots = set(self.variables)
+            missing = [var.name for var in expression.variables if var not in slots]
+            if missing:
+                raise ValueError(
+                    f"In the given variables, we're missing the following: {missing}.")
+            self.width = None
+        else:
+            raise TypeError("We're expecting a MathExpression or an ExpressionSet," +
+                            f" but instead we got {type(expression)}.")
+        self.expression = expression
+
+    def shape(self, rows: int) -> tuple[int, ...]:
+        """Get the shape of the results for a number of points"""
+        return (rows,) if self.width is None else (rows, self.width)
+
+    def __call__(self, chunk: np.ndarray) -> np.ndarray:
+        if chunk.shape[1] != len(self.variables):
+            raise ValueError(
+                f"We're expecting chunks with {len(self.variables)} columns," +
+                f" but instead we got a chunk with shape {chunk.shape}.")
+        if self.width is not None:
+            return self.expression.evaluate_batch(chunk)
+        return self.expression.evaluate_batch(chunk, self.variables)
+
+
+def evaluate_stream(
+    expression: MathExpression | ExpressionSet,
+    source: PointsSource,
+    variables: Optional[list[Variable]] = None,
+    chunk_size: int = 1_000_000
+) -> Iterator[np.ndarray]:
+    """Evaluate an expression or an ExpressionSet over a source of points, one chunk
+    at a time. The results of each chunk are yielded as soon as they are computed.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        for values in evaluate_stream(x * y + x, "points.npy", chunk_size=500_000):
+            best = min(best, values.min())
+        ```
+
+    Args:
+        expression (MathExpression | ExpressionSet): The expression to evaluate.
+        source (PointsSource): A path to a `.npy` file, a 2-D array (or memmap) or an
+            iterator of 2-D chunks, where each column is a variable.
+        variables (Optional[list[Variable]]): The variable of each column. By default,
+            it uses the variables of the expression (or of the set).
+        chunk_size (int): The number of rows of each chunk, for the paths and arrays.
+
+    Returns:
+        Iterator[np.ndarray]: The values of each chunk of points. For an ExpressionSet,
+            each chunk is a 2-D array with a column per expression.
+    """
+    evaluator = _ChunkEvaluator(expression, variables)
+    for chunk in iter_chunks(source, chunk_size):
+        yield evaluator(chunk)
+
+
+def evaluate_to_memmap(
+    expression: MathExpression | ExpressionSet,
+    source: PointsSource,
+    output: str | os.PathLike | np.ndarray,
+    variables: Optional[list[Variable]] = None,
+    chunk_size: int = 1_000_000
+) -> np.ndarray:
+    """Evaluate an expression or an ExpressionSet over a source of points, writing the
+    results into an output array, usually a memmap.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        values = evaluate_to_memmap(x * y + x, "points.npy", "values.npy")
+        ```
+
+    Args:
+        expression (MathExpression | ExpressionSet): The expression to evaluate.
+        source (PointsSource): A path to a `.npy` file, a 2-D array (or memmap) or an
+            iterator of 2-D chunks, where each column is a variable.
+        output (str | os.PathLike | np.ndarray): The path of the `.npy` file to create,
+            or an array with a row per point. A path needs a source with a known number
+            of rows (a path or an array).
+        variables (Optional[list[Variable]]): The variable of each column. By default,
+            it uses the variables of the expression (or of the set).
+        chunk_size (int): The number of rows of each chunk, for the paths and arrays.
+
+    Returns:
+        np.ndarray: The output array, with the values of each point.
+
+    Raises:
+        ValueError: If the number of rows of the source doesn't match the output.
+    """
+    evaluator = _ChunkEvaluator(expression, variables)
+    source = _open_source(source)
+    if isinstance(output, (str, os.PathLike)):
+        if not isinstance(source, np.ndarray):
+            raise ValueError("To create the output file, the number of rows of the source" +
+                             " should be known. Give the output array instead.")
+        output = np.lib.format.open_memmap(
+            output, mode="w+", dtype=np.float64, shape=evaluator.shape(source.shape[0]))
+    elif not isinstance(output, np.ndarray):
+        raise TypeError("We're expecting a path or an array as output," +
+                        f" but instead we got {type(output)}.")
+    start = 0
+    for chunk in iter_chunks(source, chunk_size):
+        stop = start + chunk.shape[0]
+        if stop > output.shape[0]:
+            raise ValueError(f"The output has {output.shape[0]} rows, but the source" +
+                             " has more points.")
+        output[start:stop] = evaluator(chunk)
+        start = stop
+    if start != output.shape[0]:
+        raise ValueError(f"The output has {output.shape[0]} rows, but the source" +
+                         f" has {start} points.")
+    if isinstance(output, np.memmap):
+        output.flush()
+    return output
+
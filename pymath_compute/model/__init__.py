@@ -8,8 +8,31 @@ import key classes used for mathematical computations.
 Includes:
     - MathFunction
     - Variable
+    - VariableArray
     - MathExpression
+    - LazyExpression
+    - lazy
+    - IncrementalEvaluator
+    - ExpressionSet
+    - QuadraticForm
+    - Constraint
+    - ConstraintMatrix
+    - Model
+    - SparsePolynomial
+    - quicksum
+    - linear_sum
+    - register_derivative
 """
 from pymath_compute.model.function import MathFunction
 from pymath_compute.model.variable import Variable
+from pymath_compute.model.variable_array import VariableArray
 from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.lazy import LazyExpression, lazy
+from pymath_compute.model.incremental import IncrementalEvaluator
+from pymath_compute.model.expression_set import ExpressionSet
+from pymath_compute.model.forms import QuadraticForm
+from pymath_compute.model.constraint import Constraint, ConstraintMatrix
+from pymath_compute.model.polynomial import SparsePolynomial
+from pymath_compute.model.registry import Model
+from pymath_compute.model.summation import quicksum, linear_sum
+from pymath_compute.model.derivatives import register_derivative
@@ -0,0 +1,99 @@
+"""
+Asynchronous evaluation module.
+
+This module evaluates the expressions whose MathFunctions are slow, such as black-box
+simulations or calls to other processes. The polynomial part of the expression is
+computed directly, and the function terms are called concurrently: the coroutine
+functions are awaited and the other callables are run in an executor, so the time of an
+evaluation approaches the time of its slowest function instead of their sum.
+"""
+import asyncio
+import inspect
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, TYPE_CHECKING
+# Local imports
+from pymath_compute.model.compiler import term_factors
+
+if TYPE_CHECKING:
+    from pymath_compute.model.variable import Variable
+    from pymath_compute.model.types import MathematicalTerms
+
+
+async def call_function(
+    function: Callable[..., Any],
+    value: float,
+    limit: Optional[asyncio.Semaphore] = None,
+    executor: Optional[Executor] = None
+) -> float:
+    """Call a function of a MathFunction without blocking the event loop.
+
+    Args:
+        function (Callable[..., Any]): A coroutine function, or a callable that is run
+            in the executor. If the callable returns an awaitable, it is also awaited.
+        value (float): The value of the variable.
+        limit (Optional[asyncio.Semaphore]): The semaphore that limits the number of
+            calls running at the same time.
+        executor (Optional[Executor]): The executor of the callables. By default, it
+            uses the default executor of the event loop.
+
+    Returns:
+        float: The result of the function.
+    """
+    if limit is None:
+        return await _call(function, value, executor)
+    async with limit:
+        return await _call(function, value, executor)
+
+
+async def _call(function: Callable[..., Any], value: float,
+                executor: Optional[Executor]) -> float:
+    """Await or offload a single call of the function"""
+    if inspect.iscoroutinefunction(function):
+        result = await function(value)
+    else:
+        result = await asyncio.get_running_loop().run_in_executor(executor, function, value)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def evaluate_terms_async(
+    terms: 'MathematicalTerms',
+    point: dict['Variable', float],
+    limit: Optional[asyncio.Semaphore] = None,
+    executor: Optional[Executor] = None
+) -> float:
+    """Evaluate the terms of an expression at a point, calling its functions concurrently.
+    A function applied to the same variable in several terms is called only once.
+
+    Args:
+        terms (MathematicalTerms): The terms of the expression.
+        point (dict[Variable, float]): The value of each variable.
+        limit (Optional[asyncio.Semaphore]): The semaphore that limits the number of
+            function calls running at the same time.
+        executor (Optional[Executor]): The executor of the callables that are not
+            coroutine functions.
+
+    Returns:
+        float: The value of the expression.
+    """
+    result = 0.0
+    calls: dict[tuple[int, 'Variable'], Any] = {}
+    coefficients: list[tuple[tuple[int, 'Variable'], float]] = []
+    for term, coef in terms.items():
+        if type(term).__name__ == "MathFunction":
+            key = (id(term.function), term.variable)
+            if key not in calls:
+                calls[key] = call_function(term.function, point[term.variable],
+                                           limit, executor)
+            coefficients.append((key, coef))
+            continue
+        product = coef
+        for factor, exp in term_factors(term):
+            product *= point[factor] if exp == 1 else point[factor] ** exp
+        result += product
+    if calls:
+        values = dict(zip(calls, await asyncio.gather(*calls.values())))
+        for key, coef in coefficients:
+            result += coef * values[key]
+    return result
@@ -0,0 +1,99 @@
+"""
+Column sources module.
+
+This module reads the values of the variables from column-oriented sources: mappings
+(or mapping-like objects) of columns, NumPy structured arrays and objects that expose
+their memory through the buffer protocol (`memoryview`, `array.array`, Arrow-like
+buffers). Each column is resolved once per evaluation by the name of its variable, and
+it is wrapped as a NumPy array over the same memory, without copying it.
+"""
+from typing import Any, Mapping, Sequence, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from pymath_compute.model.variable import Variable
+
+
+def is_column_source(source: Any) -> bool:
+    """Check if an object is a source of columns, indexed by the variable names.
+
+    Args:
+        source (Any): The object to check.
+
+    Returns:
+        bool: If it is a mapping, a mapping-like object (with `keys` and `__getitem__`)
+            or a structured array (or record).
+    """
+    if isinstance(source, Mapping):
+        return True
+    if isinstance(source, (np.ndarray, np.void)):
+        return source.dtype.names is not None
+    return hasattr(source, "keys") and hasattr(source, "__getitem__")
+
+
+def as_column(item: Any) -> np.ndarray:
+    """Get the float64 array of a column. Arrays and buffer-protocol objects are read
+    in place, so the column is only copied if its type is not float64.
+
+    Args:
+        item (Any): A number, an array or an object that supports the buffer protocol.
+            The type of the values is taken from the format of the buffer, so raw
+            `bytes` should be cast first (e.g. `memoryview(data).cast("d")`).
+
+    Returns:
+        np.ndarray: The values of the column.
+    """
+    if not isinstance(item, np.ndarray):
+        try:
+            item = np.asarray(memoryview(item))
+        except TypeError:
+            pass
+    return np.asarray(item, dtype=np.float64)
+
+
+def resolve_columns(
+    source: Any,
+    variables: Sequence['Variable']
+) -> tuple[dict['Variable', np.ndarray], int | None]:
+    """Get the column of each variable from a column source.
+
+    Args:
+        source (Any): A mapping-like object or a structured array, that uses the
+            variable name as key (or field).
+        variables (Sequence[Variable]): The variables to read.
+
+    Returns:
+        tuple[dict[Variable, np.ndarray], int | None]: The column of each variable, and
+            the number of points, or None if every column is a single number.
+
+    Raises:
+        ValueError: If some variable is missing, or if the columns have different sizes.
+    """
+    names = source.dtype.names if isinstance(source, (np.ndarray, np.void)) else None
+    columns: dict['Variable', np.ndarray] = {}
+    for var in variables:
+        if names is not None:
+            if var.name not in names:
+                raise ValueError(
+                    "In the given values, we're missing the" +
+                    f" following variable '{var.name}'."
+                )
+            # A field of a structured array is a strided view of its memory
+            columns[var] = as_column(source[var.name])
+            continue
+        try:
+            item = source[var.name]
+        except KeyError as error:
+            raise ValueError(
+                "In the given values, we're missing the" +
+                f" following variable '{var.name}'."
+            ) from error
+        columns[var] = as_column(item)
+    shapes = {column.shape for column in columns.values()}
+    if not shapes and names is not None:
+        shapes = {np.shape(source)}
+    if len(shapes) > 1 or any(len(shape) > 1 for shape in shapes):
+        raise ValueError(
+            "We're expecting 1-D arrays with the same length for every variable.")
+    shape = shapes.pop() if shapes else ()
+    return columns, shape[0] if shape else None
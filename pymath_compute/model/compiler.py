@@ -0,0 +1,689 @@
+"""
+Expression compiler module.
+
+This module turns the terms of a `MathExpression` into a generated Python function.
+All the work that `MathExpression.evaluate` repeats on every call (classifying each
+term, finding the value of each variable and validating the input) is done only once
+here, and the result is a plain function that receives a positional vector of values.
+The same is done for the gradient and the sparse Hessian of the expression.
+"""
+from itertools import count
+from math import isfinite
+from typing import Any, Callable, Iterator, Sequence, TYPE_CHECKING
+import numpy as np
+import scipy.sparse as sp
+# Local imports
+from pymath_compute.model.monomial import Monomial
+from pymath_compute.model.derivatives import function_derivative
+
+if TYPE_CHECKING:
+    from pymath_compute.model.variable import Variable
+    from pymath_compute.model.types import MathematicalTerms
+
+
+class CompiledExpression:
+    """Callable evaluator generated from the terms of a `MathExpression`.
+
+    Attributes:
+        function (Callable[[Sequence[float]], float]): The generated function. It can be
+            called directly to skip the small overhead of `__call__`.
+        variables (list[Variable]): The order of the variables in the value vector.
+        source (str): The generated source code, useful for debugging.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        evaluator = (x + 2*y).compile()
+        evaluator([1, 2])  # <- Values in the order of evaluator.variables
+        ```
+    """
+    function: Callable[[Sequence[float]], float]
+    variables: list['Variable']
+    source: str
+    __slots__ = ["function", "variables", "source"]
+
+    def __init__(
+        self,
+        function: Callable[[Sequence[float]], float],
+        variables: list['Variable'],
+        source: str
+    ) -> None:
+        self.function = function
+        self.variables = variables
+        self.source = source
+
+    def __call__(self, values: Sequence[float]) -> float:
+        return self.function(values)
+
+    def evaluate(self, values: dict[str, int | float]) -> float:
+        """Evaluate the compiled expression using a dict of values, as it is done
+        in `MathExpression.evaluate`.
+
+        Args:
+            values: dict[str, int | float]: A dict of values using the variable name as key
+                and the value to set as the corresponding item for that key
+        """
+        try:
+            return self.function([values[var.name] for var in self.variables])
+        except KeyError as error:
+            raise ValueError(
+                "In the given values, we're missing the" +
+                f" following variable '{error.args[0]}'."
+            ) from error
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({', '.join(v.name for v in self.variables)})"
+
+
+class CompiledGradient(CompiledExpression):
+    """Callable evaluator of the gradient of a `MathExpression`. It receives a positional
+    vector of values and returns a float64 array with the partial derivative of each
+    variable of the order.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        grad = (x * y + 2*x).compile_gradient()
+        grad([1, 2])  # <- array([4., 1.])
+        ```
+    """
+    __slots__: list[str] = []
+
+    def __repr__(self) -> str:
+        return f"CompiledGradient({', '.join(v.name for v in self.variables)})"
+
+
+def term_factors(term: Any) -> list[tuple[Any, int]]:
+    """Get the factors of a single term, with their exponents.
+
+    Args:
+        term (Any): The term of the expression.
+
+    Returns:
+        list[tuple[Any, int]]: The Variables and MathFunctions that are multiplied
+            in this term, with the exponent of each one. The "const" term has no factors.
+    """
+    if isinstance(term, Monomial):
+        return list(zip(term.variables, term.exponents))
+    if isinstance(term, str):
+        return []
+    return [(term, 1)]
+
+
+def term_variables(term: Any) -> list['Variable']:
+    """Get the variables involved in a single term.
+
+    Args:
+        term (Any): The term of the expression.
+
+    Returns:
+        list[Variable]: The variables used by that term.
+    """
+    if isinstance(term, Monomial):
+        return list(term.variables)
+    if isinstance(term, str):
+        return []
+    if type(term).__name__ == "MathFunction":
+        return [term.variable]
+    return [term]
+
+
+class _CodeBuilder:
+    """Helper that keeps the state of the generated source code: the slot of each
+    variable, the names of the values read from the vector, the functions and
+    constants of the namespace and the lines of the body."""
+    __slots__ = ["variables", "slots", "used", "namespace", "functions", "lines", "source"]
+
+    def __init__(self, variables: list['Variable']) -> None:
+        self.variables = list(variables)
+        self.slots = {var: i for i, var in enumerate(self.variables)}
+        self.used: dict[int, str] = {}
+        self.namespace: dict[str, Any] = {}
+        self.functions: dict[int, str] = {}
+        self.lines: list[str] = []
+        self.source = ""
+
+    def slot(self, var: 'Variable') -> int:
+        """Get the slot of a variable in the value vector"""
+        if var not in self.slots:
+            raise ValueError(
+                f"The variable '{getattr(var, 'name', var)}' is not" +
+                " part of the given variables order."
+            )
+        return self.slots[var]
+
+    def value(self, var: 'Variable') -> str:
+        """Get the name of the local that stores the value of a variable"""
+        slot = self.slot(var)
+        return self.used.setdefault(slot, f"v{slot}")
+
+    def function(self, function: Callable[..., Any]) -> str:
+        """Get the name of a function in the namespace"""
+        if id(function) not in self.functions:
+            name = f"f{len(self.functions)}"
+            self.functions[id(function)] = name
+            self.namespace[name] = function
+        return self.functions[id(function)]
+
+    def literal(self, value: Any) -> str:
+        """Return the source code that represents a coefficient. Finite numbers are
+        written as literals, and everything else is stored in the namespace."""
+        if type(value) in (int, float) and isfinite(value):
+            return repr(value)
+        name = f"_k{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def power(self, var: 'Variable', exp: int) -> str:
+        """Get the source code of a variable raised to a power"""
+        if exp == 1:
+            return self.value(var)
+        return f"{self.value(var)}**{exp}"
+
+    def scaled(self, coef: Any, product: str) -> str:
+        """Get the source code of a coefficient multiplied by a product"""
+        if not product:
+            return self.literal(coef)
+        return product if coef == 1 else f"{self.literal(coef)}*{product}"
+
+    def build(self, name: str, unpack: bool) -> Callable[..., Any]:
+        """Compile the body into a function that receives the value vector"""
+        if unpack and self.variables:
+            header = ["    " + ", ".join(f"v{i}" for i in range(len(self.variables))) +
+                      ("," if len(self.variables) == 1 else "") + " = x"]
+        else:
+            header = [f"    {local} = x[{slot}]" for slot, local in sorted(self.used.items())]
+        self.source = "\n".join([f"def {name}(x):"] + header + self.lines)
+        exec(compile(self.source, "<pymath_compute>", "exec"), self.namespace)  # pylint: disable=W0122
+        return self.namespace[name]
+
+
+def _term_products(builder: _CodeBuilder, terms: 'MathematicalTerms') -> tuple[Any, list[str]]:
+    """Generate the source of each scaled term product. The constant terms are
+    accumulated apart and returned with the products.
+
+    Raises:
+        ValueError: If some term uses a variable outside of `variables`, or if
+            a term has a type that cannot be evaluated.
+    """
+    products: list[str] = []
+    constant: Any = 0.0
+    for term, coef in terms.items():
+        if isinstance(term, str):
+            if term != "const":
+                raise ValueError(f"The term {term} is not supported.")
+            constant += coef
+            continue
+        factors: list[str] = []
+        for factor, exp in term_factors(term):
+            if type(factor).__name__ == "MathFunction":
+                factors.append(f"{builder.function(factor.function)}" +
+                               f"({builder.value(factor.variable)})")
+            else:
+                # Any other factor should be one of the variables of the order
+                factors.append(builder.power(factor, exp))
+        if not factors:
+            constant += coef
+            continue
+        products.append(builder.scaled(coef, "*".join(factors)))
+    return constant, products
+
+
+def compile_terms(
+    terms: 'MathematicalTerms',
+    variables: list['Variable'],
+    unpack: bool = False
+) -> CompiledExpression:
+    """Generate the evaluator function for the given terms.
+
+    Args:
+        terms (MathematicalTerms): The terms of the expression.
+        variables (list[Variable]): The order of the variables in the value vector.
+        unpack (bool): If True, the value vector is unpacked at once, which also
+            validates its length. This is only valid when every slot is used.
+
+    Returns:
+        CompiledExpression: The callable evaluator.
+
+    Raises:
+        ValueError: If some term uses a variable outside of `variables`, or if
+            a term has a type that cannot be evaluated.
+    """
+    builder = _CodeBuilder(variables)
+    constant, products = _term_products(builder, terms)
+    body = [f"    r += {product}" for product in products]
+    builder.lines = [f"    r = {builder.literal(float(constant))}"] + body + ["    return r"]
+    function = builder.build("_evaluate", unpack)
+    return CompiledExpression(function, builder.variables, builder.source)
+
+
+def _product_partials(
+    builder: _CodeBuilder,
+    factors: list[tuple['Variable', int]],
+    temps: Iterator[int]
+) -> list[tuple['Variable', int, str]]:
+    """Generate the partial derivatives of a product of variables, without the
+    coefficient. The products of the other factors are shared between the partials
+    using prefix and suffix products, so a term of k factors needs O(k) products.
+
+    Returns:
+        list[tuple[Variable, int, str]]: The variable, the exponent that multiplies
+            the partial, and the source of the rest of the partial.
+    """
+    def temp(source: str) -> str:
+        name = f"t{next(temps)}"
+        builder.lines.append(f"    {name} = {source}")
+        return name
+
+    powers = [builder.value(var) if exp == 1 else temp(builder.power(var, exp))
+              for var, exp in factors]
+    size = len(factors)
+    # prefix[i] is the product of powers[:i] and suffix[i] of powers[i+1:]
+    prefix = [""] * size
+    suffix = [""] * size
+    for i in range(1, size):
+        prefix[i] = powers[0] if i == 1 else temp(f"{prefix[i - 1]}*{powers[i - 1]}")
+    for i in range(size - 2, -1, -1):
+        suffix[i] = powers[-1] if i == size - 2 else temp(f"{powers[i + 1]}*{suffix[i + 1]}")
+    partials = []
+    for i, (var, exp) in enumerate(factors):
+        derivative = builder.power(var, exp - 1) if exp > 1 else ""
+        product = "*".join(part for part in (derivative, prefix[i], suffix[i]) if part)
+        partials.append((var, exp, product))
+    return partials
+
+
+def compile_gradient_terms(
+    terms: 'MathematicalTerms',
+    variables: list['Variable'],
+    unpack: bool = False
+) -> CompiledGradient:
+    """Generate the evaluator of the gradient for the given terms. The whole gradient
+    is computed in one pass over the terms.
+
+    Args:
+        terms (MathematicalTerms): The terms of the expression.
+        variables (list[Variable]): The order of the variables in the value vector.
+        unpack (bool): If True, the value vector is unpacked at once, which also
+            validates its length. This is only valid when every slot is used.
+
+    Returns:
+        CompiledGradient: The callable evaluator of the gradient.
+
+    Raises:
+        ValueError: If some term uses a variable outside of `variables`.
+    """
+    builder = _CodeBuilder(variables)
+    accumulators: dict[int, str] = {}
+    temps = count()
+
+    def accumulate(var: 'Variable', coef: Any, product: str) -> None:
+        slot = builder.slot(var)
+        name = accumulators.setdefault(slot, f"g{slot}")
+        builder.lines.append(f"    {name} += {builder.scaled(coef, product)}")
+
+    for term, coef in terms.items():
+        if isinstance(term, str):
+            continue
+        if type(term).__name__ == "MathFunction":
+            derivative = builder.function(function_derivative(term.function))
+            accumulate(term.variable, coef, f"{derivative}({builder.value(term.variable)})")
+            continue
+        for var, exp, product in _product_partials(builder, term_factors(term), temps):
+            accumulate(var, coef * exp, product)
+
+    # Initialize the accumulators and build the output array
+    init = [f"    {name} = 0.0" for name in accumulators.values()]
+    builder.namespace["_array"] = np.array
+    if unpack:
+        values = ", ".join(accumulators.get(i, "0.0") for i in range(len(builder.variables)))
+        output = [f"    return _array([{values}], dtype=float)"]
+    else:
+        slots = sorted(accumulators)
+        builder.namespace["_zeros"] = np.zeros
+        builder.namespace["_slots"] = np.array(slots, dtype=np.int64)
+        output = [f"    g = _zeros({len(builder.variables)})"]
+        if slots:
+            output.append(f"    g[_slots] = ({', '.join(accumulators[i] for i in slots)},)")
+        output.append("    return g")
+    builder.lines = init + builder.lines + output
+    function = builder.build("_gradient", unpack)
+    return CompiledGradient(function, builder.variables, builder.source)
+
+
+class CompiledHessian:
+    """Sparse Hessian of a `MathExpression`. The sparsity pattern is computed once from
+    the terms of the expression, and the generated evaluator only fills the data array
+    of that pattern for a given point.
+
+    Attributes:
+        function (Callable[[Sequence[float]], np.ndarray]): The generated function, that
+            returns the data array of the Hessian in CSR order.
+        variables (list[Variable]): The order of the variables in the value vector,
+            and of the rows and columns of the Hessian.
+        indices (np.ndarray): The CSR column indices of the pattern.
+        indptr (np.ndarray): The CSR row pointers of the pattern.
+        source (str): The generated source code, useful for debugging.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        hessian = (x**2 * y).hessian()
+        hessian([1, 2]).toarray()  # <- array([[4., 2.], [2., 0.]])
+        ```
+    """
+    function: Callable[[Sequence[float]], np.ndarray]
+    variables: list['Variable']
+    indices: np.ndarray
+    indptr: np.ndarray
+    source: str
+    __slots__ = ["function", "variables", "indices", "indptr", "source"]
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        function: Callable[[Sequence[float]], np.ndarray],
+        variables: list['Variable'],
+        indices: np.ndarray,
+        indptr: np.ndarray,
+        source: str
+    ) -> None:
+        self.function = function
+        self.variables = variables
+        self.indices = indices
+        self.indptr = indptr
+        self.source = source
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Get the shape of the Hessian.
+
+        Returns:
+            tuple[int, int]: The number of variables, for the rows and the columns.
+        """
+        return (len(self.variables), len(self.variables))
+
+    @property
+    def nnz(self) -> int:
+        """Get the number of structural nonzeros of the Hessian.
+
+        Returns:
+            int: The size of the data array.
+        """
+        return self.indices.size
+
+    @property
+    def pattern(self) -> sp.csr_matrix:
+        """Get the sparsity pattern of the Hessian, with a one in each structural nonzero.
+
+        Returns:
+            sp.csr_matrix: The sparsity pattern.
+        """
+        return sp.csr_matrix((np.ones(self.nnz), self.indices, self.indptr), shape=self.shape)
+
+    def data(self, values: Sequence[float]) -> np.ndarray:
+        """Evaluate only the data array of the Hessian, in the CSR order of the pattern.
+
+        Args:
+            values (Sequence[float]): The value of each variable, in the order of `variables`.
+
+        Returns:
+            np.ndarray: The data array.
+        """
+        return self.function(values)
+
+    def __call__(self, values: Sequence[float]) -> sp.csr_matrix:
+        return sp.csr_matrix((self.function(values), self.indices, self.indptr),
+                             shape=self.shape, copy=False)
+
+    def __repr__(self) -> str:
+        return f"CompiledHessian({len(self.variables)} variables, {self.nnz} nonzeros)"
+
+
+def compile_hessian_terms(  # pylint: disable=R0914
+    terms: 'MathematicalTerms',
+    variables: list['Variable'],
+    unpack: bool = False
+) -> CompiledHessian:
+    """Generate the sparse Hessian for the given terms. Only the upper triangle is
+    computed, and each value is written in both symmetric positions of the data array.
+
+    Args:
+        terms (MathematicalTerms): The terms of the expression.
+        variables (list[Variable]): The order of the variables in the value vector.
+        unpack (bool): If True, the value vector is unpacked at once, which also
+            validates its length. This is only valid when every slot is used.
+
+    Returns:
+        CompiledHessian: The sparse Hessian with its evaluator.
+
+    Raises:
+        ValueError: If some term uses a variable outside of `variables`.
+    """
+    builder = _CodeBuilder(variables)
+    accumulators: dict[tuple[int, int], str] = {}
+    temps = count()
+
+    def accumulate(first: 'Variable', second: 'Variable', coef: Any, product: str) -> None:
+        i, j = sorted((builder.slot(first), builder.slot(second)))
+        name = accumulators.setdefault((i, j), f"h{len(accumulators)}")
+        builder.lines.append(f"    {name} += {builder.scaled(coef, product)}")
+
+    for term, coef in terms.items():
+        if isinstance(term, str):
+            continue
+        if type(term).__name__ == "MathFunction":
+            derivative = builder.function(function_derivative(term.function, order=2))
+            accumulate(term.variable, term.variable, coef,
+                       f"{derivative}({builder.value(term.variable)})")
+            continue
+        factors = term_factors(term)
+        powers = [builder.value(var) if exp == 1 else builder.power(var, exp)
+                  for var, exp in factors]
+        if len(factors) > 2:
+            # Store the powers that are shared between several second derivatives
+            for i, power in enumerate(powers):
+                if factors[i][1] > 1:
+                    powers[i] = f"t{next(temps)}"
+                    builder.lines.append(f"    {powers[i]} = {power}")
+        for i, (first, first_exp) in enumerate(factors):
+            others = powers[:i] + powers[i + 1:]
+            if first_exp > 1:
+                product = [builder.power(first, first_exp - 2)] if first_exp > 2 else []
+                accumulate(first, first, coef * first_exp * (first_exp - 1),
+                           "*".join(product + others))
+            for j in range(i + 1, len(factors)):
+                second, second_exp = factors[j]
+                product = [builder.power(var, exp - 1) for var, exp in
+                           ((first, first_exp), (second, second_exp)) if exp > 1]
+                product += powers[:i] + powers[i + 1:j] + powers[j + 1:]
+                accumulate(first, second, coef * first_exp * second_exp, "*".join(product))
+
+    # Build the CSR pattern with both triangles
+    positions = sorted(set(accumulators) | {(j, i) for i, j in accumulators})
+    size = len(builder.variables)
+    rows = np.array([i for i, _ in positions], dtype=np.int64)
+    indices = np.array([j for _, j in positions], dtype=np.int32)
+    indptr = np.zeros(size + 1, dtype=np.int32)
+    np.add.at(indptr, rows + 1, 1)
+    indptr = np.cumsum(indptr, dtype=np.int32)
+    data = ", ".join(accumulators[(i, j) if i <= j else (j, i)] for i, j in positions)
+    builder.namespace["_array"] = np.array
+    builder.lines = [f"    {name} = 0.0" for name in accumulators.values()] + \
+        builder.lines + [f"    return _array([{data}], dtype=float)"]
+    function = builder.build("_hessian", unpack)
+    return CompiledHessian(function, builder.variables, indices, indptr, builder.source)
+
+
+class CompiledSystem:
+    """Residuals and sparse Jacobian of a system of `MathExpression` equations. The
+    sparsity pattern of the Jacobian is computed once from the terms of the equations,
+    and the generated evaluator only fills the data array of that pattern, in CSC order,
+    for a given point.
+
+    Attributes:
+        residuals (Callable[[Sequence[float]], np.ndarray]): The generated function that
+            returns the value of each equation.
+        function (Callable[[Sequence[float]], np.ndarray]): The generated function that
+            returns the data array of the Jacobian in CSC order.
+        variables (list[Variable]): The order of the variables in the value vector,
+            and of the columns of the Jacobian.
+        indices (np.ndarray): The CSC row indices of the pattern.
+        indptr (np.ndarray): The CSC column pointers of the pattern.
+        source (str): The generated source code, useful for debugging.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        system = compile_system_terms([(x**2 + y).terms, (x - y).terms], [x, y])
+        system.residuals([1, 2])  # <- array([3., -1.])
+        system.jacobian([1, 2]).toarray()  # <- array([[2., 1.], [1., -1.]])
+        ```
+    """
+    residuals: Callable[[Sequence[float]], np.ndarray]
+    function: Callable[[Sequence[float]], np.ndarray]
+    variables: list['Variable']
+    indices: np.ndarray
+    indptr: np.ndarray
+    source: str
+    __slots__ = ["residuals", "function", "variables", "indices", "indptr", "source",
+                 "num_equations"]
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        residuals: Callable[[Sequence[float]], np.ndarray],
+        function: Callable[[Sequence[float]], np.ndarray],
+        variables: list['Variable'],
+        indices: np.ndarray,
+        indptr: np.ndarray,
+        source: str,
+        num_equations: int
+    ) -> None:
+        self.residuals = residuals
+        self.function = function
+        self.variables = variables
+        self.indices = indices
+        self.indptr = indptr
+        self.source = source
+        self.num_equations = num_equations
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Get the shape of the Jacobian.
+
+        Returns:
+            tuple[int, int]: The number of equations and the number of variables.
+        """
+        return (self.num_equations, len(self.variables))
+
+    @property
+    def nnz(self) -> int:
+        """Get the number of structural nonzeros of the Jacobian.
+
+        Returns:
+            int: The size of the data array.
+        """
+        return self.indices.size
+
+    @property
+    def pattern(self) -> sp.csc_matrix:
+        """Get the sparsity pattern of the Jacobian, with a one in each structural nonzero.
+
+        Returns:
+            sp.csc_matrix: The sparsity pattern.
+        """
+        return sp.csc_matrix((np.ones(self.nnz), self.indices, self.indptr), shape=self.shape)
+
+    def data(self, values: Sequence[float]) -> np.ndarray:
+        """Evaluate only the data array of the Jacobian, in the CSC order of the pattern.
+
+        Args:
+            values (Sequence[float]): The value of each variable, in the order of `variables`.
+
+        Returns:
+            np.ndarray: The data array.
+        """
+        return self.function(values)
+
+    def jacobian(self, values: Sequence[float]) -> sp.csc_matrix:
+        """Evaluate the sparse Jacobian.
+
+        Args:
+            values (Sequence[float]): The value of each variable, in the order of `variables`.
+
+        Returns:
+            sp.csc_matrix: The Jacobian, with a row per equation and a column per variable.
+        """
+        return sp.csc_matrix((self.function(values), self.indices, self.indptr),
+                             shape=self.shape, copy=False)
+
+    def __repr__(self) -> str:
+        return (f"CompiledSystem({self.num_equations} equations, " +
+                f"{len(self.variables)} variables, {self.nnz} nonzeros)")
+
+
+def compile_system_terms(
+    equations: Sequence['MathematicalTerms'],
+    variables: list['Variable']
+) -> CompiledSystem:
+    """Generate the residuals and the sparse Jacobian of a system of equations. All
+    the equations are evaluated by a single generated function, so the cost of each
+    call grows with the number of terms and not with the number of equations squared.
+
+    Args:
+        equations (Sequence[MathematicalTerms]): The terms of each equation.
+        variables (list[Variable]): The order of the variables in the value vector.
+
+    Returns:
+        CompiledSystem: The residuals and the Jacobian with their evaluators.
+
+    Raises:
+        ValueError: If some term uses a variable outside of `variables`.
+    """
+    # Residuals of every equation
+    residuals = _CodeBuilder(variables)
+    for row, terms in enumerate(equations):
+        constant, products = _term_products(residuals, terms)
+        # One line per term, since a single long sum exceeds the recursion limit
+        # of the Python compiler
+        residuals.lines.append(f"    r{row} = {residuals.literal(float(constant))}")
+        residuals.lines.extend(f"    r{row} += {product}" for product in products)
+    residuals.namespace["_array"] = np.array
+    values = ", ".join(f"r{row}" for row in range(len(equations)))
+    residuals.lines.append(f"    return _array([{values}], dtype=float)")
+    residuals_function = residuals.build("_residuals", False)
+    # Jacobian of every equation, accumulated by (row, column)
+    builder = _CodeBuilder(variables)
+    accumulators: dict[tuple[int, int], str] = {}
+    temps = count()
+    for row, terms in enumerate(equations):
+        for term, coef in terms.items():
+            if isinstance(term, str):
+                continue
+            if type(term).__name__ == "MathFunction":
+                derivative = builder.function(function_derivative(term.function))
+                partials = [(term.variable, 1, f"{derivative}({builder.value(term.variable)})")]
+            else:
+                partials = _product_partials(builder, term_factors(term), temps)
+            for var, exp, product in partials:
+                name = accumulators.setdefault((builder.slot(var), row),
+                                               f"j{len(accumulators)}")
+                builder.lines.append(f"    {name} += {builder.scaled(coef * exp, product)}")
+
+    # Build the CSC pattern, sorted by column and then by row
+    positions = sorted(accumulators)
+    columns = np.array([col for col, _ in positions], dtype=np.int64)
+    indices = np.array([row for _, row in positions], dtype=np.int32)
+    indptr = np.zeros(len(builder.variables) + 1, dtype=np.int32)
+    np.add.at(indptr, columns + 1, 1)
+    indptr = np.cumsum(indptr, dtype=np.int32)
+    data = ", ".join(accumulators[position] for position in positions)
+    builder.namespace["_array"] = np.array
+    builder.lines = [f"    {name} = 0.0" for name in accumulators.values()] + \
+        builder.lines + [f"    return _array([{data}], dtype=float)"]
+    function = builder.build("_jacobian", False)
+    return CompiledSystem(residuals_function, function, builder.variables, indices, indptr,
+                          residuals.source + "\n\n" + builder.source, len(equations))
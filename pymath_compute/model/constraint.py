@@ -0,0 +1,292 @@
+"""
+Constraint implementation module.
+
+This module provides the `Constraint` objects, created by comparing Variables and
+MathExpressions (`x + y <= 10`, `2*x == y`), and the `ConstraintMatrix`, that streams
+many linear constraints into a single sparse matrix with the vectors of lower and upper
+bounds, ready for `scipy.optimize.linprog` or `scipy.optimize.milp`.
+"""
+from typing import Any, Iterable, Literal, Optional, TYPE_CHECKING
+import numpy as np
+import scipy.sparse as sp
+from scipy import optimize
+# Local imports
+from pymath_compute.model.monomial import Monomial
+
+if TYPE_CHECKING:
+    from pymath_compute.model.variable import Variable
+    from pymath_compute.model.expression import MathExpression
+
+ConstraintSense = Literal["<=", ">=", "=="]
+
+
+class Constraint:
+    """Represents a constraint as `expression <sense> 0`, where the expression is the
+    left side minus the right side of the comparison.
+
+    The `==` comparison also returns a Constraint. To keep the identity comparisons
+    working (such as `x in [x, y]`), the truth value of an equality is True only if
+    both sides are the same object. The truth value of an inequality is ambiguous,
+    so it raises an error.
+
+    The constraints of a comparison only store both sides, and the expression is built
+    when it is first used, so the identity comparisons don't build any expression.
+
+    Attributes:
+        expression (MathExpression): The left side minus the right side.
+        sense (str): The sense of the constraint: "<=", ">=" or "==".
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        constraint = 2 * x + y <= 10
+        constraint.lower, constraint.upper  # <- (-inf, 10.0)
+        ```
+    """
+    sense: ConstraintSense
+    __slots__ = ["sense", "_expression", "_operands"]
+
+    def __init__(
+        self,
+        expression: Optional['MathExpression'],
+        sense: ConstraintSense,
+        operands: Optional[tuple[Any, Any]] = None
+    ) -> None:
+        if sense not in ("<=", ">=", "=="):
+            raise ValueError(f"The sense {sense} is not supported.")
+        if expression is None and operands is None:
+            raise ValueError("The constraint needs an expression or both of its sides.")
+        self._expression = expression
+        self.sense = sense
+        self._operands = operands
+
+    @property
+    def expression(self) -> 'MathExpression':
+        """Get the expression of the constraint, built from both sides on the first use.
+
+        Returns:
+            MathExpression: The left side minus the right side.
+        """
+        if self._expression is None:
+            assert self._operands is not None
+            left, right = self._operands
+            self._expression = left - right
+        return self._expression
+
+    @property
+    def constant(self) -> float:
+        """Get the constant of the expression of the constraint.
+
+        Returns:
+            float: The constant term.
+        """
+        return self.expression.terms.get("const", 0.0)
+
+    @property
+    def lower(self) -> float:
+        """Get the lower bound of the constraint, for the expression without its constant.
+
+        Returns:
+            float: The lower bound, or -inf for the "<=" constraints.
+        """
+        return -np.inf if self.sense == "<=" else -self.constant
+
+    @property
+    def upper(self) -> float:
+        """Get the upper bound of the constraint, for the expression without its constant.
+
+        Returns:
+            float: The upper bound, or inf for the ">=" constraints.
+        """
+        return np.inf if self.sense == ">=" else -self.constant
+
+    def is_satisfied(
+        self,
+        values: Optional[dict[str, int | float]] = None,
+        tolerance: float = 1e-9
+    ) -> bool:
+        """Check if the constraint is satisfied.
+
+        Args:
+            values (Optional[dict[str, int | float]]): A dict of values using the
+                variable name as key. By default, it uses the `value` of each variable.
+            tolerance (float): The allowed violation.
+
+        Returns:
+            bool: If the constraint is satisfied.
+        """
+        value = float(self.expression.evaluate(values))
+        if self.sense == "<=":
+            return value <= tolerance
+        if self.sense == ">=":
+            return value >= -tolerance
+        return abs(value) <= tolerance
+
+    def __bool__(self) -> bool:
+        if self.sense == "==" and self._operands is not None:
+            return self._operands[0] is self._operands[1]
+        raise TypeError(
+            "The truth value of a constraint is ambiguous. Use `is_satisfied` instead.")
+
+    def __repr__(self) -> str:
+        return f"Constraint({self.expression} {self.sense} 0)"
+
+
+# Classes that can be compared to build a constraint
+_OPERANDS = {"Variable", "MathExpression", "MathFunction"}
+# Cache of the types that can be compared, so each comparison is a single lookup
+_SUPPORTED: dict[type, bool] = {}
+_new_constraint = object.__new__
+
+
+def compare(left: Any, right: Any, sense: ConstraintSense) -> Any:
+    """Build the constraint of a comparison between a Variable or a MathExpression
+    and another value.
+
+    Args:
+        left (Any): The left side of the comparison.
+        right (Any): The right side of the comparison.
+        sense (ConstraintSense): The sense of the comparison.
+
+    Returns:
+        Constraint: The constraint `left - right <sense> 0`, whose expression is built
+            on its first use, or NotImplemented if the right side can't be part of an
+            expression, so Python falls back to the default comparison (the identity,
+            for `==`).
+    """
+    supported = _SUPPORTED.get(type(right))
+    if supported is None:
+        supported = _SUPPORTED[type(right)] = isinstance(right, (int, float)) or \
+            any(cls.__name__ in _OPERANDS for cls in type(right).__mro__)
+    if not supported:
+        return NotImplemented
+    # The sense is already valid, so the constraint is built without the checks of
+    # its __init__, since it runs for each identity comparison (such as `x in list`)
+    constraint = _new_constraint(Constraint)
+    constraint.sense = sense
+    constraint._expression = None  # pylint: disable=W0212
+    constraint._operands = (left, right)  # pylint: disable=W0212
+    return constraint
+
+
+class ConstraintMatrix:
+    """Sparse matrix of linear constraints, as `lower <= A x <= upper`.
+
+    Attributes:
+        matrix (sp.csr_matrix | sp.coo_matrix): The matrix A, with a row per constraint
+            and a column per variable.
+        lower (np.ndarray): The lower bound of each constraint.
+        upper (np.ndarray): The upper bound of each constraint.
+        variables (list[Variable]): The variable of each column.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        constraints = ConstraintMatrix.from_constraints([x + y <= 10, x - y == 1])
+        scipy.optimize.milp(c, constraints=constraints.to_scipy())
+        ```
+    """
+    matrix: sp.csr_matrix | sp.coo_matrix
+    lower: np.ndarray
+    upper: np.ndarray
+    variables: list['Variable']
+    __slots__ = ["matrix", "lower", "upper", "variables"]
+
+    def __init__(
+        self,
+        matrix: sp.csr_matrix | sp.coo_matrix,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        variables: list['Variable']
+    ) -> None:
+        self.matrix = matrix
+        self.lower = lower
+        self.upper = upper
+        self.variables = variables
+
+    @classmethod
+    def from_constraints(
+        cls,
+        constraints: Iterable[Constraint],
+        variables: Optional[list['Variable']] = None,
+        sparse_format: Literal["csr", "coo"] = "csr"
+    ) -> 'ConstraintMatrix':
+        """Build the matrix of linear constraints in a single pass over the constraints,
+        so they can be given by a generator.
+
+        Args:
+            constraints (Iterable[Constraint]): The linear constraints.
+            variables (Optional[list[Variable]]): The variable of each column. By default,
+                the variables are added in order of appearance.
+            sparse_format (Literal["csr", "coo"]): The format of the matrix.
+
+        Returns:
+            ConstraintMatrix: The matrix with the bounds of each constraint.
+
+        Raises:
+            ValueError: If the sparse format is not supported, if some constraint is not
+                linear, or if it uses a variable outside of the given variables.
+        """
+        if sparse_format not in ("csr", "coo"):
+            raise ValueError(f"The sparse format {sparse_format!r} is not supported." +
+                             " Use 'csr' or 'coo'.")
+        discover = variables is None
+        columns: list['Variable'] = [] if variables is None else list(variables)
+        slots = {var: i for i, var in enumerate(columns)}
+        indices: list[int] = []
+        data: list[float] = []
+        indptr: list[int] = [0]
+        lower: list[float] = []
+        upper: list[float] = []
+        for row, constraint in enumerate(constraints):
+            if not isinstance(constraint, Constraint):
+                raise TypeError(
+                    f"We're expecting Constraints, but instead we got {type(constraint)}.")
+            for term, coef in constraint.expression.terms.items():
+                if isinstance(term, str):
+                    continue
+                if isinstance(term, Monomial) or type(term).__name__ == "MathFunction":
+                    raise ValueError(f"The constraint {row} has the non linear term {term}.")
+                slot = slots.get(term)
+                if slot is None:
+                    if not discover:
+                        raise ValueError(
+                            f"The variable '{term.name}' of the constraint {row} is not" +
+                            " part of the given variables order.")
+                    slot = slots[term] = len(columns)
+                    columns.append(term)
+                indices.append(slot)
+                data.append(coef)
+            indptr.append(len(indices))
+            lower.append(constraint.lower)
+            upper.append(constraint.upper)
+        matrix = sp.csr_matrix(
+            (np.array(data, dtype=np.float64), np.array(indices, dtype=np.int32),
+             np.array(indptr, dtype=np.int32)), shape=(len(lower), len(columns)))
+        if sparse_format == "coo":
+            matrix = matrix.tocoo()
+        return cls(matrix, np.array(lower, dtype=np.float64),
+                   np.array(upper, dtype=np.float64), columns)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Get the shape of the matrix.
+
+        Returns:
+            tuple[int, int]: The number of constraints and the number of variables.
+        """
+        return self.matrix.shape
+
+    def to_scipy(self) -> optimize.LinearConstraint:
+        """Get the constraints in the format of `scipy.optimize.milp` and
+        `scipy.optimize.minimize(method="trust-constr")`.
+
+        Returns:
+            optimize.LinearConstraint: The linear constraints.
+        """
+        return optimize.LinearConstraint(self.matrix, self.lower, self.upper)
+
+    def __repr__(self) -> str:
+        return f"ConstraintMatrix({self.shape[0]} constraints, {self.shape[1]} variables)"
@@ -0,0 +1,335 @@
+"""
+Derivatives module.
+
+This module provides the exact derivatives of the terms of a `MathExpression`. The
+polynomial terms (Variables, Monomials and constants) are differentiated symbolically.
+The `MathFunction` terms use the derivative registry, that maps the common NumPy ufuncs
+(and any callable registered by the user) to their exact derivative. Only the unknown
+functions fall back to a central finite difference of their callable.
+"""
+import math
+from typing import Any, Callable, Optional, TYPE_CHECKING
+import numpy as np
+# Local imports
+from pymath_compute.model.monomial import Monomial, make_term
+if TYPE_CHECKING:
+    from pymath_compute.model.variable import Variable
+    from pymath_compute.model.types import MathematicalTerms
+
+
+class NumericDerivative:
+    """Derivative of a callable of one variable, computed with a central
+    finite difference. It accepts scalars and NumPy arrays.
+
+    Attributes:
+        function (Callable): The function to differentiate.
+        order (int): The order of the derivative, 1 or 2.
+        step (float): The relative step of the finite difference.
+    """
+    __slots__ = ["function", "order", "step", "__name__"]
+
+    def __init__(
+        self,
+        function: Callable[..., Any],
+        order: int = 1,
+        step: Optional[float] = None
+    ) -> None:
+        if order not in (1, 2):
+            raise ValueError(f"The order should be 1 or 2, but instead it is {order}.")
+        self.function = function
+        self.order = order
+        # Use the optimal step for the truncation and the rounding errors
+        self.step = step if step is not None else (1e-6 if order == 1 else 1e-4)
+        self.__name__ = "d" * order + f"_{getattr(function, '__name__', 'function')}"
+
+    def __call__(self, value: Any) -> Any:
+        step = self.step * np.maximum(1.0, np.abs(value))
+        if self.order == 1:
+            return (self.function(value + step) - self.function(value - step)) / (2 * step)
+        return (self.function(value + step) - 2 * self.function(value) +
+                self.function(value - step)) / (step * step)
+
+
+# ============================================= #
+#              DERIVATIVE FUNCTIONS             #
+# ============================================= #
+# Derivatives that are not a NumPy ufunc by themselves. They are defined at the module
+# level, so they have a readable name and they can be pickled.
+
+def negative_sin(value: Any) -> Any:
+    """Derivative of cos(x)"""
+    return -np.sin(value)
+
+
+def negative_cos(value: Any) -> Any:
+    """Derivative of -sin(x)"""
+    return -np.cos(value)
+
+
+def sec_squared(value: Any) -> Any:
+    """Derivative of tan(x)"""
+    return 1.0 / np.cos(value) ** 2
+
+
+def reciprocal(value: Any) -> Any:
+    """Derivative of log(x)"""
+    return 1.0 / value
+
+
+def negative_reciprocal_squared(value: Any) -> Any:
+    """Derivative of 1/x"""
+    return -1.0 / (value * value)
+
+
+def half_reciprocal_sqrt(value: Any) -> Any:
+    """Derivative of sqrt(x)"""
+    return 0.5 / np.sqrt(value)
+
+
+def reciprocal_ln2(value: Any) -> Any:
+    """Derivative of log2(x)"""
+    return 1.0 / (value * math.log(2))
+
+
+def reciprocal_ln10(value: Any) -> Any:
+    """Derivative of log10(x)"""
+    return 1.0 / (value * math.log(10))
+
+
+def reciprocal_plus_one(value: Any) -> Any:
+    """Derivative of log1p(x)"""
+    return 1.0 / (1.0 + value)
+
+
+def sech_squared(value: Any) -> Any:
+    """Derivative of tanh(x)"""
+    return 1.0 - np.tanh(value) ** 2
+
+
+def arctan_derivative(value: Any) -> Any:
+    """Derivative of arctan(x)"""
+    return 1.0 / (1.0 + value * value)
+
+
+def arcsin_derivative(value: Any) -> Any:
+    """Derivative of arcsin(x)"""
+    return 1.0 / np.sqrt(1.0 - value * value)
+
+
+def arccos_derivative(value: Any) -> Any:
+    """Derivative of arccos(x)"""
+    return -1.0 / np.sqrt(1.0 - value * value)
+
+
+def double(value: Any) -> Any:
+    """Derivative of square(x)"""
+    return 2.0 * value
+
+
+# Derivatives of the derivative functions above, so the second derivatives (the
+# Hessians) are exact too
+
+def sec_squared_derivative(value: Any) -> Any:
+    """Derivative of sec(x)**2"""
+    return 2.0 * np.tan(value) / np.cos(value) ** 2
+
+
+def reciprocal_cubed_double(value: Any) -> Any:
+    """Derivative of -1/x**2"""
+    return 2.0 / (value * value * value)
+
+
+def half_reciprocal_sqrt_derivative(value: Any) -> Any:
+    """Derivative of 0.5/sqrt(x)"""
+    return -0.25 / (value * np.sqrt(value))
+
+
+def reciprocal_ln2_derivative(value: Any) -> Any:
+    """Derivative of 1/(x*ln(2))"""
+    return -1.0 / (value * value * math.log(2))
+
+
+def reciprocal_ln10_derivative(value: Any) -> Any:
+    """Derivative of 1/(x*ln(10))"""
+    return -1.0 / (value * value * math.log(10))
+
+
+def reciprocal_plus_one_derivative(value: Any) -> Any:
+    """Derivative of 1/(1+x)"""
+    return -1.0 / ((1.0 + value) * (1.0 + value))
+
+
+def sech_squared_derivative(value: Any) -> Any:
+    """Derivative of 1-tanh(x)**2"""
+    tanh = np.tanh(value)
+    return -2.0 * tanh * (1.0 - tanh * tanh)
+
+
+def arctan_second_derivative(value: Any) -> Any:
+    """Derivative of 1/(1+x**2)"""
+    return -2.0 * value / ((1.0 + value * value) * (1.0 + value * value))
+
+
+def arcsin_second_derivative(value: Any) -> Any:
+    """Derivative of 1/sqrt(1-x**2)"""
+    return value / (1.0 - value * value) ** 1.5
+
+
+def arccos_second_derivative(value: Any) -> Any:
+    """Derivative of -1/sqrt(1-x**2)"""
+    return -value / (1.0 - value * value) ** 1.5
+
+
+def two(value: Any) -> Any:
+    """Derivative of 2*x"""
+    return np.full_like(value, 2.0, dtype=np.float64)[()]
+
+
+def zero(value: Any) -> Any:
+    """Derivative of sign(x), out of x=0"""
+    return np.zeros_like(value, dtype=np.float64)[()]
+
+
+# Registry of the exact derivative of each function
+_DERIVATIVES: dict[Callable[..., Any], Callable[..., Any]] = {
+    np.sin: np.cos,
+    np.cos: negative_sin,
+    negative_sin: negative_cos,
+    negative_cos: np.sin,
+    np.tan: sec_squared,
+    np.exp: np.exp,
+    np.expm1: np.exp,
+    np.log: reciprocal,
+    reciprocal: negative_reciprocal_squared,
+    np.reciprocal: negative_reciprocal_squared,
+    negative_reciprocal_squared: reciprocal_cubed_double,
+    np.log2: reciprocal_ln2,
+    np.log10: reciprocal_ln10,
+    np.log1p: reciprocal_plus_one,
+    np.sqrt: half_reciprocal_sqrt,
+    np.sinh: np.cosh,
+    np.cosh: np.sinh,
+    np.tanh: sech_squared,
+    np.arctan: arctan_derivative,
+    np.arcsin: arcsin_derivative,
+    np.arccos: arccos_derivative,
+    np.square: double,
+    np.abs: np.sign,
+    sec_squared: sec_squared_derivative,
+    half_reciprocal_sqrt: half_reciprocal_sqrt_derivative,
+    reciprocal_ln2: reciprocal_ln2_derivative,
+    reciprocal_ln10: reciprocal_ln10_derivative,
+    reciprocal_plus_one: reciprocal_plus_one_derivative,
+    sech_squared: sech_squared_derivative,
+    arctan_derivative: arctan_second_derivative,
+    arcsin_derivative: arcsin_second_derivative,
+    arccos_derivative: arccos_second_derivative,
+    double: two,
+    np.sign: zero,
+    math.sin: np.cos,
+    math.cos: negative_sin,
+    math.tan: sec_squared,
+    math.exp: np.exp,
+    math.expm1: np.exp,
+    math.log: reciprocal,
+    math.log2: reciprocal_ln2,
+    math.log10: reciprocal_ln10,
+    math.log1p: reciprocal_plus_one,
+    math.sqrt: half_reciprocal_sqrt,
+    math.sinh: np.cosh,
+    math.cosh: np.sinh,
+    math.tanh: sech_squared,
+    math.atan: arctan_derivative,
+    math.asin: arcsin_derivative,
+    math.acos: arccos_derivative,
+    abs: np.sign,
+}
+
+
+def register_derivative(function: Callable[..., Any], derivative: Callable[..., Any]) -> None:
+    """Register the exact derivative of a function, so the MathFunction terms that use
+    it are differentiated exactly instead of using finite differences.
+
+    The derivatives are read when a gradient or a Hessian is compiled, so the
+    function should be registered before that.
+
+    Example:
+        ```
+        def cube(value):
+            return value ** 3
+
+        def cube_derivative(value):
+            return 3 * value ** 2
+
+        register_derivative(cube, cube_derivative)
+        ```
+
+    Args:
+        function (Callable): The function of one variable.
+        derivative (Callable): Its derivative. It should accept the same values
+            as the function, including NumPy arrays if the function accepts them.
+
+    Raises:
+        TypeError: If the function or the derivative are not callables.
+    """
+    if not callable(function) or not callable(derivative):
+        raise TypeError("The function and its derivative should be callables.")
+    _DERIVATIVES[function] = derivative
+
+
+def function_derivative(function: Callable[..., Any], order: int = 1) -> Callable[..., Any]:
+    """Get the derivative of the callable of a MathFunction. The registered derivatives
+    are exact, and the unknown functions use a central finite difference.
+
+    Args:
+        function (Callable): The function to differentiate.
+        order (int): The order of the derivative, 1 or 2.
+
+    Returns:
+        Callable: The derivative of the function.
+    """
+    try:
+        derivative = _DERIVATIVES.get(function)
+    except TypeError:
+        # The unhashable callables can't be registered
+        derivative = None
+    if derivative is None:
+        return NumericDerivative(function, order)
+    if order == 2:
+        return function_derivative(derivative)
+    return derivative
+
+
+def differentiate(terms: 'MathematicalTerms', variable: 'Variable') -> 'MathematicalTerms':
+    """Differentiate the terms of an expression with respect to a variable.
+
+    Args:
+        terms (MathematicalTerms): The terms of the expression.
+        variable (Variable): The variable of the derivative.
+
+    Returns:
+        MathematicalTerms: The terms of the derivative.
+    """
+    derivative: dict[Any, Any] = {}
+    for term, coef in terms.items():
+        if isinstance(term, str):
+            continue
+        if isinstance(term, Monomial):
+            powers = term.powers
+            if variable not in powers:
+                continue
+            exp = powers[variable]
+            powers[variable] = exp - 1
+            new_term, new_coef = make_term(powers), coef * exp
+        elif type(term).__name__ == "MathFunction":
+            if term.variable is not variable:
+                continue
+            # Use the class of the term to build the derivative function
+            new_term = type(term)(function_derivative(term.function), variable)
+            new_coef = coef
+        elif term is variable:
+            new_term, new_coef = "const", coef
+        else:
+            continue
+        derivative[new_term] = derivative.get(new_term, 0) + new_coef
+    return {term: coef for term, coef in derivative.items() if coef != 0}
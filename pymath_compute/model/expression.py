@@ -5,8 +5,23 @@ This module provides the implementation of the `MathExpression` class, which all
 the creation and manipulation of mathematical expressions involving variables, constants,
 and functions. The expressions can be evaluated given a set of variable values.
 """
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Iterable, Mapping, Optional, Sequence
+import numpy as np
+import scipy.sparse as sp
 # Local import
-from pymath_compute.model.types import PosibleOperators, MathematicalTerms
+from pymath_compute.model.types import PosibleOperators, MathematicalTerms, defers_to
+from pymath_compute.model.compiler import CompiledExpression, CompiledGradient, \
+    CompiledHessian, compile_terms, compile_gradient_terms, compile_hessian_terms, \
+    term_factors, term_variables
+from pymath_compute.model.derivatives import differentiate
+from pymath_compute.model.forms import linear_form, quadratic_form
+from pymath_compute.model.constraint import Constraint, compare
+from pymath_compute.model.columns import is_column_source, resolve_columns
+from pymath_compute.model.asynchronous import evaluate_terms_async
+from pymath_compute.model.monomial import Monomial, canonical_term, multiply_terms, \
+    term_degree
 
 
 class MathExpression:
@@ -15,74 +30,579 @@ class MathExpression:
 
     Attributes:
         terms (MathematicalTerms): The terms of the mathematical expression.
+        variables (list[Variable]): The variables used in the expression, in
+            order of appearance.
     """
-    terms: MathematicalTerms
-    __slots__ = ["terms"]
+    _terms: MathematicalTerms
+    _variables: Optional[list['Variable']]
+    _compiled: Optional[CompiledExpression]
+    _compiled_gradient: Optional[CompiledGradient]
+    _compiled_hessian: Optional[CompiledHessian]
+    _powers: Optional[dict[int, 'MathExpression']]
+    __slots__ = ["_terms", "_variables", "_compiled", "_compiled_gradient",
+                 "_compiled_hessian", "_powers"]
 
     def __init__(self, terms: MathematicalTerms) -> None:
+        self._powers = None
         self.terms = terms
 
-    def evaluate(self, values: dict[str, int | float]) -> float:
+    @property
+    def terms(self) -> MathematicalTerms:
+        """Get the terms of the mathematical expression.
+
+        Returns:
+            MathematicalTerms: The terms as {TERM: COEFFICIENT}.
+        """
+        return self._terms
+
+    @terms.setter
+    def terms(self, new_terms: MathematicalTerms) -> None:
+        """Set new terms for the expression. This discards everything that was
+        cached from the previous terms, such as the compiled evaluator.
+
+        The product tuples, such as `(x, y)`, are converted into canonical Monomial keys.
+
+        Args:
+            - new_terms (MathematicalTerms): The new terms of the expression.
+        """
+        if any(isinstance(term, tuple) for term in new_terms):
+            canonical: MathematicalTerms = {}
+            for term, coef in new_terms.items():
+                term = canonical_term(term)
+                canonical[term] = canonical.get(term, 0) + coef
+            new_terms = canonical
+        self._terms = new_terms
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        """Discard everything that was computed from the current terms. It should be
+        called every time the terms are modified in place."""
+        self._variables = None
+        self._compiled = None
+        self._compiled_gradient = None
+        self._compiled_hessian = None
+        if self._powers:
+            self._powers = {}
+
+    @property
+    def variables(self) -> list['Variable']:
+        """Get the variables used in the expression, in order of appearance.
+
+        Returns:
+            list[Variable]: The unique variables of the expression.
+        """
+        if self._variables is None:
+            seen: dict['Variable', None] = {}
+            for term in self._terms:
+                for var in term_variables(term):
+                    seen[var] = None
+            self._variables = list(seen)
+        return self._variables
+
+    def compile(self, variables: Optional[list['Variable']] = None) -> CompiledExpression:
+        """Compile the expression into a callable evaluator that receives a positional
+        vector of values. The classification of the terms and the mapping between
+        variables and positions are done only once, so the evaluator is much faster
+        than `evaluate` when the same expression is evaluated several times.
+
+        The evaluator of the default order is cached on the expression and it is
+        discarded when the terms change.
+
+        Example:
+            ```
+            x = Variable(name="x", lower_bound=0, upper_bound=10)
+            y = Variable(name="y", lower_bound=0, upper_bound=10)
+            evaluator = (x * y + 2).compile()
+            evaluator([3, 4]) <- Values in the order of `evaluator.variables`
+            ```
+
+        Args:
+            variables (Optional[list[Variable]]): The order of the variables in the value
+                vector. It can include variables that are not used in the expression.
+                By default, it uses the order of `MathExpression.variables`.
+
+        Returns:
+            CompiledExpression: The callable evaluator.
+        """
+        if variables is not None:
+            return compile_terms(self._terms, variables)
+        if self._compiled is None:
+            self._compiled = compile_terms(self._terms, self.variables, unpack=True)
+        return self._compiled
+
+    # ============================================= #
+    #               DERIVATIVES SECTION             #
+    # ============================================= #
+
+    def derivative(self, variable: 'Variable') -> 'MathExpression':
+        """Get the exact derivative of the expression with respect to a variable.
+
+        Example:
+            ```
+            x = Variable(name="x", lower_bound=0, upper_bound=10)
+            y = Variable(name="y", lower_bound=0, upper_bound=10)
+            (x**2 * y + 3*x).derivative(x) <- Expression: 2*x*y + 3
+            ```
+
+        Args:
+            variable (Variable): The variable of the derivative.
+
+        Returns:
+            MathExpression: The derivative expression.
+        """
+        return MathExpression(differentiate(self._terms, variable))
+
+    def gradient(
+        self,
+        variables: Optional[list['Variable']] = None
+    ) -> dict['Variable', 'MathExpression']:
+        """Get the derivative expression of each variable.
+
+        Args:
+            variables (Optional[list[Variable]]): The variables of the gradient. By
+                default, it uses `MathExpression.variables`.
+
+        Returns:
+            dict[Variable, MathExpression]: The derivative of each variable.
+        """
+        if variables is None:
+            variables = self.variables
+        return {var: self.derivative(var) for var in variables}
+
+    def compile_gradient(self, variables: Optional[list['Variable']] = None) -> CompiledGradient:
+        """Compile the gradient of the expression into a callable that receives a
+        positional vector of values and returns the array of partial derivatives.
+        The whole gradient is computed in one pass, and the products of each term
+        are shared between its partial derivatives.
+
+        The evaluator of the default order is cached on the expression and it is
+        discarded when the terms change.
+
+        Example:
+            ```
+            x = Variable(name="x", lower_bound=0, upper_bound=10)
+            y = Variable(name="y", lower_bound=0, upper_bound=10)
+            grad = (x * y + 2*x).compile_gradient()
+            grad([1, 2]) <- array([4., 1.])
+            ```
+
+        Args:
+            variables (Optional[list[Variable]]): The order of the variables in the value
+                vector and in the gradient. By default, it uses `MathExpression.variables`.
+
+        Returns:
+            CompiledGradient: The callable evaluator of the gradient.
+        """
+        if variables is not None:
+            return compile_gradient_terms(self._terms, variables)
+        if self._compiled_gradient is None:
+            self._compiled_gradient = compile_gradient_terms(
+                self._terms, self.variables, unpack=True)
+        return self._compiled_gradient
+
+    def grad(self, values: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Evaluate the gradient on a point, using the cached compiled gradient.
+
+        Args:
+            values (Sequence[float] | np.ndarray): The value of each variable, in
+                the order of `MathExpression.variables`.
+
+        Returns:
+            np.ndarray: The partial derivative of each variable.
+        """
+        return self.compile_gradient().function(values)
+
+    def hessian(self, variables: Optional[list['Variable']] = None) -> CompiledHessian:
+        """Get the sparse Hessian of the expression. The sparsity pattern is computed
+        once from the product terms, and the returned object has a fast evaluator
+        that only fills the data array of that pattern, so the same pattern can be
+        reused across the iterations of a second-order method.
+
+        The Hessian of the default order is cached on the expression and it is
+        discarded when the terms change.
+
+        Example:
+            ```
+            x = Variable(name="x", lower_bound=0, upper_bound=10)
+            y = Variable(name="y", lower_bound=0, upper_bound=10)
+            hessian = (x**2 * y).hessian()
+            hessian.pattern <- The scipy.sparse pattern
+            hessian([1, 2]) <- The scipy.sparse matrix for the point
+            hessian.data([1, 2]) <- Only the data array of the pattern
+            ```
+
+        Args:
+            variables (Optional[list[Variable]]): The order of the variables in the value
+                vector and in the rows and columns of the Hessian. By default, it uses
+                `MathExpression.variables`.
+
+        Returns:
+            CompiledHessian: The sparse Hessian with its evaluator.
+        """
+        if variables is not None:
+            return compile_hessian_terms(self._terms, variables)
+        if self._compiled_hessian is None:
+            self._compiled_hessian = compile_hessian_terms(
+                self._terms, self.variables, unpack=True)
+        return self._compiled_hessian
+
+    # ============================================= #
+    #                 FORMS SECTION                 #
+    # ============================================= #
+
+    def to_linear(
+        self,
+        variables: Optional[list['Variable']] = None
+    ) -> tuple[sp.csr_matrix, float]:
+        """Get the linear form of the expression, as `c x + k`.
+
+        Example:
+            ```
+            x = Variable(name="x", lower_bound=0, upper_bound=10)
+            y = Variable(name="y", lower_bound=0, upper_bound=10)
+            row, constant = (2*x - y + 3).to_linear()
+            row.toarray()  # <- array([[ 2., -1.]])
+            ```
+
+        Args:
+            variables (Optional[list[Variable]]): The order of the columns. By default,
+                it uses the order of `MathExpression.variables`.
+
+        Returns:
+            tuple[sp.csr_matrix, float]: The 1 x n row of coefficients and the constant.
+
+        Raises:
+            ValueError: If the expression is not linear.
+        """
+        return linear_form(self._terms, self.variables if variables is None else variables)
+
+    def to_quadratic(
+        self,
+        variables: Optional[list['Variable']] = None
+    ) -> tuple[sp.csr_matrix, np.ndarray, float]:
+        """Get the quadratic form of the expression, as `x^T Q x + c x + k`, where
+        Q is a symmetric sparse matrix.
+
+        Example:
+            ```
+            x = Variable(name="x", lower_bound=0, upper_bound=10)
+            y = Variable(name="y", lower_bound=0, upper_bound=10)
+            Q, c, k = (x**2 + 2*x*y + y + 1).to_quadratic()
+            Q.toarray()  # <- array([[1., 1.], [1., 0.]])
+            ```
+
+        Args:
+            variables (Optional[list[Variable]]): The order of the variables. By default,
+                it uses the order of `MathExpression.variables`.
+
+        Returns:
+            tuple[sp.csr_matrix, np.ndarray, float]: The matrix Q, the linear
+                coefficients c and the constant k.
+
+        Raises:
+            ValueError: If the expression has terms with a degree greater than 2.
+        """
+        return quadratic_form(self._terms, self.variables if variables is None else variables)
+
+    # ============================================= #
+    #               EVALUATION SECTION              #
+    # ============================================= #
+
+    def evaluate(self, values: Optional[dict[str, int | float] | Any] = None) -> Any:
         """From a passed dictionary of values, we'll evaluate the current terms
         expression with that value.
 
+        Without values, the expression is evaluated with the current value of each
+        variable, using the cached list of variables and the compiled evaluator, so
+        no dict is built.
+
+        The values can also be a column source: a mapping-like object of columns, a
+        NumPy structured array (or record) or columns that expose their memory with
+        the buffer protocol. The column of each variable is resolved once, reading the
+        memory in place, and the expression is evaluated for every point.
+
         Example:
             ```
             x = Variable(name="x", lower_bound: 0, upper_bound: 10)
             expr = x + 2
             expr.evaluate({"x": 1}) <- We're setting the value for the name variable defined
+            x.value = 1
+            expr.evaluate() <- We're using the value stored in the variable
+            points = np.array([(1.0,), (2.0,)], dtype=[("x", "f8")])
+            expr.evaluate(points) <- array([3., 4.]), reading the field "x"
             ```
 
         Args:
-            values: dict[str, int | float]: A dict of values using the variable name as key
-                and the value to set as the corresponding item for that key
+            values: Optional[dict[str, int | float] | Any]: A dict of values using the
+                variable name as key and the value to set as the corresponding item for
+                that key, or a column source. By default, it uses the `value` of
+                each variable.
+
+        Returns:
+            float | np.ndarray: The value of the expression, or the value for each point
+                of a column source.
         """
-        if not isinstance(values, dict):
-            raise TypeError("We're expecting a dict as {VAR_NAME: MATH_VALUE}," +
-                            f" but instead we got {type(values)}.")
+        if values is None:
+            return self.compile().function([var.value for var in self.variables])
+        # The dicts of numbers are evaluated directly, and any other source by columns.
+        # Only the value of the first variable is checked, so the choice is O(1)
+        variables = self.variables
+        if not isinstance(values, dict) or variables and not isinstance(
+                values.get(variables[0].name, 0.0), (int, float, np.number)):
+            if not is_column_source(values):
+                raise TypeError("We're expecting a dict as {VAR_NAME: MATH_VALUE}" +
+                                " or a column source, but instead we got" +
+                                f" {type(values)}.")
+            columns, size = resolve_columns(values, self.variables)
+            if size is None:
+                return self.compile().function(
+                    [float(columns[var]) for var in self.variables])
+            return self._evaluate_columns(columns, size)
         # Initialize the result variable
         result: float = 0.0
-        for var, coef in self.terms.items():
-            # If the var is a constant, don't do
-            # anything but adding them to the result
-            if var == "const":
+        try:
+            for var, coef in self.terms.items():
+                # If the var is a constant, don't do
+                # anything but adding them to the result
+                if isinstance(var, str):
+                    result += coef
+                elif isinstance(var, Variable):
+                    result += coef*values[var.name]
+                elif type(var).__name__ == "MathFunction":
+                    result += coef * var.evaluate(values)
+                else:
+                    # Multiply the coef for the value of each factor
+                    sub_term = coef
+                    for v, exp in zip(var.variables, var.exponents):
+                        sub_term *= values[v.name] if exp == 1 else values[v.name] ** exp
+                    result += sub_term
+        except KeyError as error:
+            raise ValueError(
+                "In the given values, we're missing the" +
+                f" following variable '{error.args[0]}'."
+            ) from error
+        # In the end, return the result
+        return result
+
+    def evaluate_batch(
+        self,
+        values: Mapping[str, np.ndarray] | np.ndarray,
+        variables: Optional[list['Variable']] = None
+    ) -> np.ndarray:
+        """Evaluate the expression over several points at once. Every term is computed
+        as a whole-array NumPy operation, instead of one `evaluate` call per point.
+
+        Example:
+            ```
+            x = Variable(name="x", lower_bound=0, upper_bound=10)
+            y = Variable(name="y", lower_bound=0, upper_bound=10)
+            expr = x * y + 2
+            expr.evaluate_batch({"x": np.array([1, 2]), "y": np.array([3, 4])})
+            expr.evaluate_batch(np.array([[1, 3], [2, 4]]), variables=[x, y])
+            expr.evaluate_batch(np.array([(1, 3), (2, 4)], dtype=[("x", "f8"), ("y", "f8")]))
+            ```
+
+        Args:
+            values (Mapping[str, np.ndarray] | np.ndarray): A mapping (or mapping-like
+                object) that uses the variable name as key and a 1-D array or buffer of
+                values as item, a structured array with a field per variable, or a 2-D
+                array where each row is a point and each column is a variable.
+            variables (Optional[list[Variable]]): The variable of each column. It is only
+                used (and required) when `values` is a 2-D array.
+
+        Returns:
+            np.ndarray: The value of the expression for each point.
+        """
+        return self._evaluate_columns(*self._batch_columns(values, variables))
+
+    def _evaluate_columns(self, columns: dict['Variable', np.ndarray], size: int) -> np.ndarray:
+        """Evaluate the expression from the array of values of each variable"""
+        result = np.zeros(size, dtype=np.float64)
+        for term, coef in self.terms.items():
+            product = None
+            for factor, exp in term_factors(term):
+                if type(factor).__name__ == "MathFunction":
+                    column = factor.apply(columns[factor.variable])
+                else:
+                    column = columns[factor] if exp == 1 else columns[factor] ** exp
+                product = column if product is None else product * column
+            if product is None:
                 result += coef
-            elif type(var).__name__ == "Variable":
-                if var.name not in values:
-                    raise ValueError(
-                        "In the given values, we're missing the" +
-                        f" following variable '{var.name}'."
-                    )
-                result += coef*values[var.name]
-            elif type(var).__name__ == "MathFunction":
-                result += coef * var.evaluate(values)
+            elif coef == 1:
+                result += product
             else:
-                # Define a sub term for this
-                sub_term = 1
-                for v in var:
-                    sub_term *= values[v.name]
-                # In this situation, multiply the coef for the appended value
-                result += coef * sub_term
-        # In the end, return the result
+                result += coef * product
         return result
 
+    def _batch_columns(
+        self,
+        values: Mapping[str, np.ndarray] | np.ndarray,
+        variables: Optional[list['Variable']]
+    ) -> tuple[dict['Variable', np.ndarray], int]:
+        """Get the array of values of each variable of the expression, and the number
+        of points to evaluate."""
+        if isinstance(values, np.ndarray) and values.dtype.names is None:
+            if values.ndim != 2 or variables is None:
+                raise ValueError(
+                    "When the values are an array, we're expecting a 2-D array" +
+                    " of points and the variable of each column.")
+            if values.shape[1] != len(variables):
+                raise ValueError(
+                    f"The array has {values.shape[1]} columns, but there are" +
+                    f" {len(variables)} variables.")
+            slots = {var: i for i, var in enumerate(variables)}
+            missing = [var.name for var in self.variables if var not in slots]
+            if missing:
+                raise ValueError(
+                    f"In the given variables, we're missing the following: {missing}.")
+            data = np.asarray(values, dtype=np.float64)
+            return {var: data[:, slots[var]] for var in self.variables}, values.shape[0]
+        if not is_column_source(values):
+            raise TypeError("We're expecting a mapping as {VAR_NAME: ARRAY} or" +
+                            f" a 2-D array, but instead we got {type(values)}.")
+        columns, size = resolve_columns(values, self.variables)
+        if size is None:
+            if columns:
+                raise ValueError(
+                    "We're expecting 1-D arrays with the same length for every variable.")
+            # Without variables, the size is taken from any column of the values
+            keys = values.dtype.names if isinstance(values, np.void) else values.keys()
+            sizes = {np.shape(values[key]) for key in keys}
+            if len(sizes) > 1 or any(len(shape) != 1 for shape in sizes):
+                raise ValueError(
+                    "We're expecting 1-D arrays with the same length for every variable.")
+            size = sizes.pop()[0] if sizes else 1
+        return columns, size
+
+    # ============================================= #
+    #           ASYNC EVALUATION SECTION            #
+    # ============================================= #
+
+    async def evaluate_async(
+        self,
+        values: Optional[Mapping[str, int | float]] = None,
+        max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> float:
+        """Evaluate the expression calling its MathFunctions concurrently. The coroutine
+        functions are awaited, and the other callables are run in the executor, so the
+        time of the evaluation approaches the time of the slowest function.
+
+        Example:
+            ```
+            async def simulate(value: float) -> float:
+                ...  # <- A slow call to another process
+            x = Variable(name="x", lower_bound=0, upper_bound=10)
+            y = Variable(name="y", lower_bound=0, upper_bound=10)
+            expr = MathFunction(simulate, x) + MathFunction(time_consuming, y) + x * y
+            await expr.evaluate_async({"x": 1, "y": 2}, max_concurrency=8)
+            ```
+
+        Args:
+            values (Optional[Mapping[str, int | float]]): A dict of values using the
+                variable name as key. By default, it uses the `value` of each variable.
+            max_concurrency (Optional[int]): The maximum number of function calls running
+                at the same time. By default, there's no limit.
+            executor (Optional[Executor]): The executor of the callables that are not
+                coroutine functions. By default, the default executor of the event loop.
+
+        Returns:
+            float: The value of the expression.
+        """
+        limit = None if max_concurrency is None else asyncio.Semaphore(max_concurrency)
+        return await evaluate_terms_async(self.terms, self._point(values), limit, executor)
+
+    async def evaluate_batch_async(
+        self,
+        points: Iterable[Optional[Mapping[str, int | float]]],
+        max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> list[float]:
+        """Evaluate the expression at several points, calling the MathFunctions of all
+        the points concurrently under the same concurrency limit.
+
+        Args:
+            points (Iterable[Optional[Mapping[str, int | float]]]): A dict of values for
+                each point, using the variable name as key.
+            max_concurrency (Optional[int]): The maximum number of function calls running
+                at the same time, for all the points. By default, there's no limit.
+            executor (Optional[Executor]): The executor of the callables that are not
+                coroutine functions. By default, the default executor of the event loop.
+
+        Returns:
+            list[float]: The value of the expression at each point.
+        """
+        limit = None if max_concurrency is None else asyncio.Semaphore(max_concurrency)
+        evaluations = [evaluate_terms_async(self.terms, self._point(values), limit, executor)
+                       for values in points]
+        return list(await asyncio.gather(*evaluations))
+
+    def _point(self, values: Optional[Mapping[str, int | float]]) -> dict['Variable', float]:
+        """Get the value of each variable of the expression"""
+        if values is None:
+            return {var: var.value for var in self.variables}
+        if not isinstance(values, Mapping):
+            raise TypeError("We're expecting a dict as {VAR_NAME: MATH_VALUE}," +
+                            f" but instead we got {type(values)}.")
+        point: dict['Variable', float] = {}
+        for var in self.variables:
+            if var.name not in values:
+                raise ValueError(
+                    "In the given values, we're missing the" +
+                    f" following variable '{var.name}'."
+                )
+            point[var] = values[var.name]
+        return point
+
+    # ============================================= #
+    #              SERIALIZATION SECTION            #
+    # ============================================= #
+
+    def __getstate__(self) -> tuple[list['Variable'], list[Any], list[float]]:
+        """Get the compact state of the expression. Each variable is stored once, and
+        the terms refer to them by index: a Variable is its index, a Monomial is the
+        flat tuple of (index, exponent) pairs and the constant is "const". The cached
+        evaluators are not stored."""
+        variables = self.variables
+        slots = {var: i for i, var in enumerate(variables)}
+        keys: list[Any] = []
+        for term in self._terms:
+            if isinstance(term, str):
+                keys.append(term)
+            elif isinstance(term, Monomial):
+                keys.append(tuple(value for var, exp in zip(term.variables, term.exponents)
+                                  for value in (slots[var], exp)))
+            elif isinstance(term, Variable):
+                keys.append(slots[term])
+            else:
+                # The MathFunctions keep a reference to their (shared) variable
+                keys.append(term)
+        return (variables, keys, list(self._terms.values()))
+
+    def __setstate__(self, state: tuple[list['Variable'], list[Any], list[float]]) -> None:
+        variables, keys, coefficients = state
+        terms: MathematicalTerms = {}
+        for key, coef in zip(keys, coefficients):
+            if isinstance(key, int):
+                key = variables[key]
+            elif isinstance(key, tuple):
+                key = Monomial.from_powers(
+                    {variables[key[i]]: key[i + 1] for i in range(0, len(key), 2)})
+            terms[key] = coef
+        self._powers = None
+        self.terms = terms
+
     def __repr__(self) -> str:
         expression: str = "Expression: "
         # Add the terms to print in the representation
         printable_terms: list[str] = []
         for var, coef in self.terms.items():
-            if var == "const":
+            if isinstance(var, str):
                 printable_terms.append(str(coef))
-            elif type(var).__name__ == "Variable":
+            elif isinstance(var, Variable):
                 printable_terms.append(f"{coef}*{var.name}")
-            elif type(var).__name__ == "MathFunction":
-                printable_terms.append(f"{coef}*{var}")
             else:
-                # Define the str of the term
-                # type: ignore
-                term_str = '*'.join(v.name for v in var if not isinstance(v, str))
-                # Define the printable terms here
-                printable_terms.append(f"{coef}*{term_str}")
+                printable_terms.append(f"{coef}*{var}")
         # Return the expression with a join
         return expression + " + ".join(printable_terms)
 
@@ -93,36 +613,37 @@ class MathExpression:
     # ////////////////////////// #
     #         ADD METHODS        #
     # ////////////////////////// #
-    def __add__(self, other: PosibleOperators) -> 'MathExpression':  # pylint: disable=R0912
-        # Obtain the new terms
-        new_terms = self.terms.copy()
-        if type(other).__name__ == "Variable":
-            if other in new_terms:
-                new_terms[other] += 1
-            else:
-                new_terms[other] = 1
+    def __add__(self, other: PosibleOperators) -> 'MathExpression':
+        # Obtain a copy of the terms and add the other param to them
+        return MathExpression(self.terms.copy()).__iadd__(other)
+
+    def __iadd__(self, other: PosibleOperators) -> 'MathExpression':
+        # Add the other param directly in the terms of this expression. This avoids
+        # copying all the terms on each addition when building large expressions
+        terms = self._terms
+        if isinstance(other, Variable) or type(other).__name__ == "MathFunction":
+            terms[other] = terms.get(other, 0) + 1
         elif isinstance(other, MathExpression):
-            for var, coef in other.terms.items():
-                if var in new_terms:
-                    new_terms[var] += coef
+            for var, coef in list(other.terms.items()) if other is self \
+                    else other.terms.items():
+                if var in terms:
+                    terms[var] += coef
+                    # Remove the like terms that cancel each other
+                    if terms[var] == 0:
+                        del terms[var]
                 else:
-                    new_terms[var] = coef
-        elif type(other).__name__ == "MathFunction":
-            if other in new_terms:
-                new_terms[other] += 1
-            else:
-                new_terms[other] = 1
+                    terms[var] = coef
         elif isinstance(other, (int, float)):
-            if 'const' in new_terms:
-                new_terms['const'] += other
-            else:
-                new_terms['const'] = other
+            terms['const'] = terms.get('const', 0) + other
+        # Let the other objects of the package (such as the lazy nodes) handle it
+        elif defers_to(other, "__radd__"):
+            return NotImplemented
         # If add is not on the expected params
         else:
             raise ValueError(
                 f"The param {other} of type {type(other)} is not supported.")
-        # Return the new MathExpression
-        return MathExpression(new_terms)
+        self._clear_cache()
+        return self
 
     def __radd__(self, other: PosibleOperators) -> 'MathExpression':
         return self.__add__(other)
@@ -141,29 +662,31 @@ class MathExpression:
                 for var, coef in self.terms.items()
             }
             return MathExpression(new_terms)  # type: ignore
-        if type(other).__name__ == "Variable":
-            new_terms = {}
-            for term, coef in self.terms.items():
-                if isinstance(term, tuple):
-                    new_terms[term + (other,)] = coef  # type: ignore
-                else:
-                    new_terms[(term, other)] = coef
-            return MathExpression(new_terms)
+        if isinstance(other, Variable):
+            return self.__mul__(MathExpression({other: 1}))
         if type(other).__name__ == "MathFunction":
-            new_terms = self.terms.copy()
-            if other in new_terms:
-                new_terms[other] += 1
-            else:
-                new_terms[other] = 1
-            return MathExpression(new_terms)
+            # Only the constant terms can multiply a MathFunction
+            return self.__mul__(MathExpression({other: 1}))
         if isinstance(other, MathExpression):
             # Get the new terms
             new_terms = {}
-            # Iterate over the terms of this expression
+            # Iterate over the terms of this expression. The product of two terms
+            # is a canonical key, so the like terms are merged here
             for o_term, o_coef in other.terms.items():
                 for term, coef in self.terms.items():
-                    new_terms[(term, o_term)] = coef*o_coef
-            return MathExpression(new_terms)
+                    if type(term).__name__ == "MathFunction" and not isinstance(o_term, str) or \
+                            type(o_term).__name__ == "MathFunction" and not isinstance(term, str):
+                        raise ValueError(
+                            "The product of a MathFunction with other terms is not supported.")
+                    new_term = multiply_terms(term, o_term)
+                    new_terms[new_term] = new_terms.get(new_term, 0) + coef*o_coef
+            # Remove the like terms that cancel each other
+            return MathExpression({
+                term: coef for term, coef in new_terms.items() if coef != 0
+            })
+        # Let the other objects of the package (such as the lazy nodes) handle it
+        if defers_to(other, "__rmul__"):
+            return NotImplemented
         # If add is not on the expected params
         raise ValueError(
             f"The param {other} of type {type(other)} is not supported.")
@@ -171,24 +694,116 @@ class MathExpression:
     def __rmul__(self, other: PosibleOperators) -> 'MathExpression':
         return self.__mul__(other)
 
+    def __imul__(self, other: PosibleOperators) -> 'MathExpression':
+        # The constants scale the coefficients in place. For the rest of the params
+        # the product is expanded and it replaces the terms of this expression
+        if isinstance(other, (int, float)):
+            terms = self._terms
+            for var in terms:
+                terms[var] *= other
+            self._clear_cache()
+            return self
+        product = self.__mul__(other)
+        if product is NotImplemented:
+            return NotImplemented
+        self._terms = product.terms
+        self._clear_cache()
+        return self
+
+    def multiply(
+        self,
+        other: PosibleOperators,
+        max_degree: Optional[int] = None,
+        drop_below: Optional[float] = None
+    ) -> 'MathExpression':
+        """Multiply the expression by another value, skipping the cross terms that are
+        not needed while the product is generated, instead of filtering them after.
+        This keeps the size of iterative products (such as series approximations) fixed.
+
+        Example:
+            ```
+            x = Variable(name="x", lower_bound=-1, upper_bound=1)
+            series = 1 + x
+            for _ in range(10):
+                series = series.multiply(1 + x, max_degree=3)  # <- At most 4 terms
+            ```
+
+        Args:
+            other (PosibleOperators): The value to multiply.
+            max_degree (Optional[int]): The maximum total degree of the terms of the
+                product. The MathFunction terms have degree 0.
+            drop_below (Optional[float]): The terms whose absolute coefficient is below
+                this tolerance are skipped, and so are the merged terms below it.
+
+        Returns:
+            MathExpression: A new expression with the truncated product.
+
+        Raises:
+            ValueError: If a MathFunction term is multiplied by a non constant term, since
+                the products only hold Variables and Monomials.
+        """
+        if isinstance(other, (int, float)):
+            other = MathExpression({"const": other})
+        elif isinstance(other, Variable) or type(other).__name__ == "MathFunction":
+            other = MathExpression({other: 1})
+        elif not isinstance(other, MathExpression):
+            raise ValueError(
+                f"The param {other} of type {type(other)} is not supported.")
+        # Sort the terms of the other expression by degree, so the inner loop can
+        # stop at the first term that exceeds the maximum degree
+        others = sorted(((term_degree(term), term, coef) for term, coef in
+                         other.terms.items()), key=lambda item: item[0])
+        new_terms: MathematicalTerms = {}
+        for term, coef in self.terms.items():
+            degree = term_degree(term)
+            for o_degree, o_term, o_coef in others:
+                if max_degree is not None and degree + o_degree > max_degree:
+                    break
+                value = coef * o_coef
+                if drop_below is not None and abs(value) < drop_below:
+                    continue
+                if type(term).__name__ == "MathFunction" and not isinstance(o_term, str) or \
+                        type(o_term).__name__ == "MathFunction" and not isinstance(term, str):
+                    raise ValueError(
+                        "The product of a MathFunction with other terms is not supported.")
+                new_term = multiply_terms(term, o_term)
+                new_terms[new_term] = new_terms.get(new_term, 0) + value
+        tolerance = 0 if drop_below is None else drop_below
+        # Remove the like terms that cancel each other or are below the tolerance
+        return MathExpression({
+            term: coef for term, coef in new_terms.items() if coef != 0 and abs(coef) >= tolerance
+        })
+
     # ////////////////////////// #
     #     SUBTRACT METHODS       #
     # ////////////////////////// #
 
     def __sub__(self, other: PosibleOperators) -> 'MathExpression':
-        print(
-            type(other).__name__,
-            type(other).__name__ in ["Variable", "MathFunction"],
-            type(other).__name__ == "Variable"
-        )
         # Evaluate that the other parameter is a valid expression
         if not isinstance(other, (int, float, MathExpression)) \
-                and not type(other).__name__ in ["Variable", "MathFunction"]:
+                and not isinstance(other, Variable) \
+                and not type(other).__name__ == "MathFunction":
+            # Let the other objects of the package (such as the lazy nodes) handle it
+            if defers_to(other, "__rsub__"):
+                return NotImplemented
             raise ValueError(
                 f"The param {other} of type {type(other)} is not supported.")
 
         return self.__add__(-other)  # type: ignore
 
+    def __isub__(self, other: PosibleOperators) -> 'MathExpression':
+        # Evaluate that the other parameter is a valid expression
+        if not isinstance(other, (int, float, MathExpression)) \
+                and not isinstance(other, Variable) \
+                and not type(other).__name__ == "MathFunction":
+            # Let the other objects of the package (such as the lazy nodes) handle it
+            if defers_to(other, "__rsub__"):
+                return NotImplemented
+            raise ValueError(
+                f"The param {other} of type {type(other)} is not supported.")
+
+        return self.__iadd__(-other)  # type: ignore
+
     def __rsub__(self, other: PosibleOperators) -> 'MathExpression':
         # The (-self) invoques the __neg__ method and returns which value
         # we'll expect from it. Since we define the __neg__ method here, we already
@@ -208,18 +823,108 @@ class MathExpression:
     #         POW METHODS        #
     # ////////////////////////// #
     def __pow__(self, other: int) -> 'MathExpression':
-        if not isinstance(other, int):
+        return self.power(other)
+
+    def power(self, exponent: int, cache: bool = False) -> 'MathExpression':
+        """Raise the expression to a power, using exponentiation by squaring. Each
+        product merges the like terms, so only O(log(exponent)) products are expanded.
+
+        With `cache=True`, the powers computed on the way are stored on the expression,
+        so `expr.power(2, cache=True)`, `expr.power(4, cache=True)` and
+        `expr.power(8, cache=True)` reuse each other. The cache is discarded when the
+        terms of the expression change.
+
+        Example:
+            ```
+            x = Variable(name="x", lower_bound=0, upper_bound=10)
+            y = Variable(name="y", lower_bound=0, upper_bound=10)
+            expr = x + y + 1
+            expr.power(4, cache=True)  # <- Stores the squares and the fourth power
+            expr.power(8, cache=True)  # <- Only squares the fourth power
+            ```
+
+        Args:
+            exponent (int): The power, greater or equal to zero.
+            cache (bool): If True, the computed powers are stored on the expression and
+                reused by the next calls that also use the cache.
+
+        Returns:
+            MathExpression: A new expression with the power.
+
+        Raises:
+            ValueError: If the exponent is not an integer greater or equal to zero, or
+                if the expression has MathFunction terms and other non constant terms.
+        """
+        if not isinstance(exponent, int):
             raise ValueError(
-                f"The param {other} of type {type(other)} is not supported.")
-        if other < 0:
+                f"The param {exponent} of type {type(exponent)} is not supported.")
+        if exponent < 0:
             raise ValueError("The power has to be greater or equal to zero.")
-        if other == 0:
-            # Make everything 1
-            self.terms = {"const": 1}
-            return self
-        # Multiply the self instance n times
-        new_expr: MathExpression = self
-        for _ in range(other):
-            new_expr = self * self
-        # Return it
-        return new_expr
+        if exponent == 0:
+            return MathExpression({"const": 1})
+        powers: dict[int, MathExpression] = {}
+        if cache:
+            if self._powers is None:
+                self._powers = {}
+            powers = self._powers
+            if exponent in powers:
+                return MathExpression(powers[exponent].terms.copy())
+        result: Optional[MathExpression] = None
+        base: MathExpression = self
+        step, remaining = 1, exponent
+        while remaining:
+            if remaining & 1:
+                result = base if result is None else result * base
+            remaining >>= 1
+            if remaining:
+                # Square the base, or reuse the square computed before
+                step *= 2
+                if step not in powers:
+                    powers[step] = base._square()  # pylint: disable=W0212
+                base = powers[step]
+        assert result is not None
+        if cache and result is not self:
+            powers[exponent] = result
+        # The result can be the expression itself or a cached power, so return a copy
+        return MathExpression(result.terms.copy()) if cache or result is self else result
+
+    def _square(self) -> 'MathExpression':
+        """Multiply the expression by itself. Each pair of different terms is only
+        multiplied once, so it needs half of the products of `self * self`."""
+        items = list(self.terms.items())
+        new_terms: MathematicalTerms = {}
+        for i, (term, coef) in enumerate(items):
+            for o_term, o_coef in items[i:]:
+                if (type(term).__name__ == "MathFunction" or
+                        type(o_term).__name__ == "MathFunction") and \
+                        not isinstance(term, str) and not isinstance(o_term, str):
+                    raise ValueError(
+                        "The product of a MathFunction with other terms is not supported.")
+                new_term = multiply_terms(term, o_term)
+                value = coef * o_coef if o_term is term else 2 * coef * o_coef
+                new_terms[new_term] = new_terms.get(new_term, 0) + value
+        # Remove the like terms that cancel each other
+        return MathExpression({
+            term: coef for term, coef in new_terms.items() if coef != 0
+        })
+
+    # ////////////////////////// #
+    #     COMPARISON METHODS     #
+    # ////////////////////////// #
+
+    # The comparisons build constraints, so the hash is still the identity of the object
+    __hash__ = object.__hash__
+
+    def __eq__(self, other: object) -> 'Constraint':  # type: ignore[override]
+        return compare(self, other, "==")
+
+    def __le__(self, other: PosibleOperators) -> 'Constraint':
+        return compare(self, other, "<=")
+
+    def __ge__(self, other: PosibleOperators) -> 'Constraint':
+        return compare(self, other, ">=")
+
+
+# The Variable module imports this one, so the Variable class is imported at the end,
+# once the MathExpression class has been defined
+from pymath_compute.model.variable import Variable  # pylint: disable=C0413,R0401
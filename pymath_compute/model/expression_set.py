@@ -0,0 +1,206 @@
+"""
+ExpressionSet implementation module.
+
+This module provides the `ExpressionSet`, that evaluates several expressions at the same
+point. The unique monomials and function terms of all the expressions are collected once,
+so a term shared by many expressions is computed only once per point. Every output is
+then the product of a sparse matrix of coefficients by the vector of term values.
+"""
+from typing import Any, Iterable, Mapping, Optional, Sequence
+import numpy as np
+import scipy.sparse as sp
+# Local imports
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.compiler import _CodeBuilder, term_factors, term_variables
+
+
+class ExpressionSet:
+    """Represents a group of expressions that are evaluated together.
+
+    Attributes:
+        expressions (list[MathExpression]): The expressions of the set. Their terms are
+            read when the set is created, so it should be created again if they change.
+        variables (list[Variable]): The order of the variables in the value vector.
+        terms (list[Any]): The unique non constant terms of all the expressions.
+        coefficients (sp.csr_matrix): The coefficient of each term (column) in
+            each expression (row).
+        constants (np.ndarray): The constant of each expression.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        expressions = ExpressionSet([x * y + 1, 2 * x * y - x, x * y + y])
+        expressions.evaluate([1, 2])  # <- array([3., 3., 4.]), x*y computed once
+        ```
+    """
+    expressions: list[MathExpression]
+    variables: list[Variable]
+    terms: list[Any]
+    coefficients: sp.csr_matrix
+    constants: np.ndarray
+    __slots__ = ["expressions", "variables", "terms", "coefficients", "constants",
+                 "_term_values"]
+
+    def __init__(
+        self,
+        expressions: Iterable[MathExpression],
+        variables: Optional[list[Variable]] = None
+    ) -> None:
+        self.expressions = list(expressions)
+        positions: dict[Any, int] = {}
+        self.terms = []
+        rows: list[int] = []
+        columns: list[int] = []
+        data: list[float] = []
+        self.constants = np.zeros(len(self.expressions), dtype=np.float64)
+        for row, expression in enumerate(self.expressions):
+            if not isinstance(expression, MathExpression):
+                raise TypeError(
+                    f"We're expecting MathExpressions, but instead we got {type(expression)}.")
+            for term, coef in expression.terms.items():
+                if isinstance(term, str):
+                    self.constants[row] += coef
+                    continue
+                # The functions are shared when they apply the same callable to the
+                # same variable, even if they are different MathFunction objects
+                key = (id(term.function), term.variable) \
+                    if type(term).__name__ == "MathFunction" else term
+                if key not in positions:
+                    positions[key] = len(self.terms)
+                    self.terms.append(term)
+                rows.append(row)
+                columns.append(positions[key])
+                data.append(coef)
+        self.coefficients = sp.csr_matrix(
+            (np.array(data, dtype=np.float64), (rows, columns)),
+            shape=(len(self.expressions), len(self.terms)))
+        if variables is None:
+            seen: dict[Variable, None] = {}
+            for term in self.terms:
+                for var in term_variables(term):
+                    seen[var] = None
+            variables = list(seen)
+        self.variables = list(variables)
+        self._term_values = self._compile_terms()
+
+    def _compile_terms(self) -> Any:
+        """Generate the function that computes the value of each unique term"""
+        builder = _CodeBuilder(self.variables)
+        values: list[str] = []
+        for term in self.terms:
+            factors: list[str] = []
+            for factor, exp in term_factors(term):
+                if type(factor).__name__ == "MathFunction":
+                    factors.append(f"{builder.function(factor.function)}" +
+                                   f"({builder.value(factor.variable)})")
+                else:
+                    factors.append(builder.power(factor, exp))
+            values.append("*".join(factors))
+        builder.namespace["_array"] = np.array
+        builder.lines = [f"    return _array([{', '.join(values)}], dtype=float)"]
+        return builder.build("_terms", False)
+
+    def __len__(self) -> int:
+        return len(self.expressions)
+
+    def __getstate__(self) -> tuple[list[MathExpression], list[Variable]]:
+        # The generated function can't be pickled, so it is generated again
+        return (self.expressions, self.variables)
+
+    def __setstate__(self, state: tuple[list[MathExpression], list[Variable]]) -> None:
+        self.__init__(*state)  # type: ignore[misc]  # pylint: disable=C2801
+
+    # ============================================= #
+    #               EVALUATION SECTION              #
+    # ============================================= #
+
+    def term_values(
+        self,
+        values: Optional[Mapping[str, int | float] | Sequence[float] | np.ndarray] = None
+    ) -> np.ndarray:
+        """Compute the value of each unique term at a single point.
+
+        Args:
+            values (Optional[Mapping[str, int | float] | Sequence[float] | np.ndarray]):
+                A dict of values using the variable name as key, or a vector of values in
+                the order of `variables`. By default, it uses the `value` of each variable.
+
+        Returns:
+            np.ndarray: The value of each term, in the order of `terms`.
+        """
+        return self._term_values(self._vector(values))
+
+    def evaluate(
+        self,
+        values: Optional[Mapping[str, int | float] | Sequence[float] | np.ndarray] = None
+    ) -> np.ndarray:
+        """Evaluate all the expressions at a single point.
+
+        Args:
+            values (Optional[Mapping[str, int | float] | Sequence[float] | np.ndarray]):
+                A dict of values using the variable name as key, or a vector of values in
+                the order of `variables`. By default, it uses the `value` of each variable.
+
+        Returns:
+            np.ndarray: The value of each expression.
+        """
+        return self.coefficients @ self.term_values(values) + self.constants
+
+    def evaluate_batch(self, points: np.ndarray) -> np.ndarray:
+        """Evaluate all the expressions over several points at once. Each unique term
+        is computed as a whole-array NumPy operation.
+
+        Args:
+            points (np.ndarray): A 2-D array where each row is a point and each column
+                is a variable, in the order of `variables`.
+
+        Returns:
+            np.ndarray: A 2-D array with a row per point and a column per expression.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] != len(self.variables):
+            raise ValueError(
+                f"We're expecting a 2-D array with {len(self.variables)} columns," +
+                f" but instead we got an array with shape {points.shape}.")
+        slots = {var: i for i, var in enumerate(self.variables)}
+        term_values = np.empty((points.shape[0], len(self.terms)), dtype=np.float64)
+        for position, term in enumerate(self.terms):
+            product: Optional[np.ndarray] = None
+            for factor, exp in term_factors(term):
+                if type(factor).__name__ == "MathFunction":
+                    column = factor.apply(points[:, slots[factor.variable]])
+                else:
+                    column = points[:, slots[factor]]
+                    column = column if exp == 1 else column ** exp
+                product = column if product is None else product * column
+            term_values[:, position] = product
+        return np.asarray(self.coefficients @ term_values.T).T + self.constants
+
+    def _vector(
+        self,
+        values: Optional[Mapping[str, int | float] | Sequence[float] | np.ndarray]
+    ) -> Sequence[float]:
+        """Get the value vector, in the order of the variables, as Python floats"""
+        if values is None:
+            return [var.value for var in self.variables]
+        if isinstance(values, Mapping):
+            try:
+                return [values[var.name] for var in self.variables]
+            except KeyError as error:
+                raise ValueError(
+                    "In the given values, we're missing the" +
+                    f" following variable '{error.args[0]}'."
+                ) from error
+        if len(values) != len(self.variables):
+            raise ValueError(
+                f"We're expecting a vector of {len(self.variables)} values," +
+                f" but instead we got {len(values)} values.")
+        if isinstance(values, np.ndarray):
+            return values.tolist()
+        return values
+
+    def __repr__(self) -> str:
+        return (f"ExpressionSet({len(self.expressions)} expressions, " +
+                f"{len(self.terms)} unique terms)")
@@ -0,0 +1,213 @@
+"""
+Linear and quadratic forms module.
+
+This module extracts the matrices of the linear and quadratic expressions, that are
+written as `x^T Q x + c x + k`. The terms are scanned only once to build the sparse
+matrices, and the `QuadraticForm` evaluates the expression with sparse matrix-vector
+products, which is also the format expected by the LP and QP solvers.
+"""
+from typing import Optional, Sequence, TYPE_CHECKING
+import numpy as np
+import scipy.sparse as sp
+# Local imports
+from pymath_compute.model.monomial import Monomial
+
+if TYPE_CHECKING:
+    from pymath_compute.model.variable import Variable
+    from pymath_compute.model.expression import MathExpression
+    from pymath_compute.model.types import MathematicalTerms
+
+
+def _slots(variables: Sequence['Variable']) -> dict['Variable', int]:
+    """Get the position of each variable in the value vector"""
+    return {var: i for i, var in enumerate(variables)}
+
+
+def _slot(slots: dict['Variable', int], var: 'Variable') -> int:
+    """Get the position of a variable, with a clear error if it is not part of the order"""
+    if var not in slots:
+        raise ValueError(
+            f"The variable '{getattr(var, 'name', var)}' is not" +
+            " part of the given variables order.")
+    return slots[var]
+
+
+def linear_form(
+    terms: 'MathematicalTerms',
+    variables: Sequence['Variable']
+) -> tuple[sp.csr_matrix, float]:
+    """Get the coefficients row and the constant of a linear expression.
+
+    Args:
+        terms (MathematicalTerms): The terms of the expression.
+        variables (Sequence[Variable]): The order of the variables (columns).
+
+    Returns:
+        tuple[sp.csr_matrix, float]: The 1 x n row of coefficients and the constant.
+
+    Raises:
+        ValueError: If some term is not linear.
+    """
+    slots = _slots(variables)
+    columns: list[int] = []
+    data: list[float] = []
+    constant = 0.0
+    for term, coef in terms.items():
+        if isinstance(term, str):
+            constant += coef
+        elif isinstance(term, Monomial) or type(term).__name__ == "MathFunction":
+            raise ValueError(f"The term {term} is not linear.")
+        else:
+            columns.append(_slot(slots, term))
+            data.append(coef)
+    row = sp.csr_matrix((np.array(data, dtype=np.float64),
+                         (np.zeros(len(columns), dtype=np.int64), columns)),
+                        shape=(1, len(slots)))
+    return row, constant
+
+
+def quadratic_form(
+    terms: 'MathematicalTerms',
+    variables: Sequence['Variable']
+) -> tuple[sp.csr_matrix, np.ndarray, float]:
+    """Get the matrices of a quadratic expression, as `x^T Q x + c x + k`. The matrix Q
+    is symmetric, so the coefficient of each product `x*y` is split between the
+    positions (x, y) and (y, x).
+
+    Args:
+        terms (MathematicalTerms): The terms of the expression.
+        variables (Sequence[Variable]): The order of the variables.
+
+    Returns:
+        tuple[sp.csr_matrix, np.ndarray, float]: The n x n matrix Q, the linear
+            coefficients c and the constant k.
+
+    Raises:
+        ValueError: If some term has a degree greater than 2 or is a MathFunction.
+    """
+    slots = _slots(variables)
+    rows: list[int] = []
+    columns: list[int] = []
+    data: list[float] = []
+    linear = np.zeros(len(slots), dtype=np.float64)
+    constant = 0.0
+    for term, coef in terms.items():
+        if isinstance(term, str):
+            constant += coef
+        elif isinstance(term, Monomial) and term.degree == 2:
+            if len(term.variables) == 1:
+                i = _slot(slots, term.variables[0])
+                rows.append(i)
+                columns.append(i)
+                data.append(coef)
+            else:
+                i, j = (_slot(slots, var) for var in term.variables)
+                rows.extend((i, j))
+                columns.extend((j, i))
+                data.extend((coef / 2, coef / 2))
+        elif isinstance(term, Monomial) or type(term).__name__ == "MathFunction":
+            raise ValueError(f"The term {term} is not quadratic.")
+        else:
+            linear[_slot(slots, term)] += coef
+    # The repeated positions are added by the conversion into CSR
+    matrix = sp.csr_matrix((np.array(data, dtype=np.float64), (rows, columns)),
+                           shape=(len(slots), len(slots)))
+    return matrix, linear, constant
+
+
+class QuadraticForm:
+    """Evaluator of a linear or quadratic expression from its matrices. The value at a
+    point is `x^T Q x + c x + k`, computed with a single sparse matrix-vector product.
+
+    Attributes:
+        matrix (sp.csr_matrix): The symmetric matrix Q.
+        linear (np.ndarray): The linear coefficients c.
+        constant (float): The constant k.
+        variables (list[Variable]): The order of the variables in the value vector.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        form = QuadraticForm.from_expression(x**2 + 3*x*y + 2*y + 1)
+        form(np.array([1.0, 2.0]))  # <- 12.0
+        ```
+    """
+    matrix: sp.csr_matrix
+    linear: np.ndarray
+    constant: float
+    variables: list['Variable']
+    __slots__ = ["matrix", "linear", "constant", "variables"]
+
+    def __init__(
+        self,
+        matrix: sp.csr_matrix,
+        linear: np.ndarray,
+        constant: float,
+        variables: list['Variable']
+    ) -> None:
+        self.matrix = matrix
+        self.linear = linear
+        self.constant = constant
+        self.variables = variables
+
+    @classmethod
+    def from_expression(
+        cls,
+        expression: 'MathExpression',
+        variables: Optional[list['Variable']] = None
+    ) -> 'QuadraticForm':
+        """Build the quadratic form of a MathExpression.
+
+        Args:
+            expression (MathExpression): The linear or quadratic expression.
+            variables (Optional[list[Variable]]): The order of the variables. By default,
+                it uses the order of `MathExpression.variables`.
+
+        Returns:
+            QuadraticForm: The evaluator of the expression.
+        """
+        variables = list(expression.variables if variables is None else variables)
+        return cls(*quadratic_form(expression.terms, variables), variables)
+
+    def __call__(self, values: Sequence[float] | np.ndarray) -> float:
+        x = np.asarray(values, dtype=np.float64)
+        if x.shape != (len(self.variables),):
+            raise ValueError(
+                f"We're expecting a vector of {len(self.variables)} values," +
+                f" but instead we got an array with shape {x.shape}.")
+        return float(x @ (self.matrix @ x) + self.linear @ x + self.constant)
+
+    def evaluate_batch(self, points: np.ndarray) -> np.ndarray:
+        """Evaluate the form over several points at once.
+
+        Args:
+            points (np.ndarray): A 2-D array where each row is a point and each column
+                is a variable, in the order of `variables`.
+
+        Returns:
+            np.ndarray: The value of the form for each point.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] != len(self.variables):
+            raise ValueError(
+                f"We're expecting a 2-D array with {len(self.variables)} columns," +
+                f" but instead we got an array with shape {points.shape}.")
+        products = np.asarray(self.matrix @ points.T).T
+        return np.einsum("ij,ij->i", points, products) + points @ self.linear + self.constant
+
+    def gradient(self, values: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Get the gradient of the form, `2 Q x + c`, since Q is symmetric.
+
+        Args:
+            values (Sequence[float] | np.ndarray): The value of each variable.
+
+        Returns:
+            np.ndarray: The gradient at the point.
+        """
+        x = np.asarray(values, dtype=np.float64)
+        return 2 * (self.matrix @ x) + self.linear
+
+    def __repr__(self) -> str:
+        return (f"QuadraticForm({len(self.variables)} variables, " +
+                f"{self.matrix.nnz} quadratic nonzeros)")
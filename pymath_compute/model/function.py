@@ -5,10 +5,11 @@ This module provides the implementation of the `MathFunction` class, which allow
 the creation and manipulation of mathematical functions involving variables. The 
 functions can be evaluated given a set of variable values.
 """
-from typing import Callable, TypeVar, TYPE_CHECKING
+from typing import Callable, TypeVar
+import numpy as np
 from pymath_compute.model.expression import MathExpression
-if TYPE_CHECKING:
-    from pymath_compute.model.variable import Variable
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.types import defers_to
 
 FunctionReturn = TypeVar("FunctionReturn", int, float)
 
@@ -61,9 +62,36 @@ class MathFunction:
             )
         return self.function(values[self.variable.name])
 
+    def apply(self, values: np.ndarray) -> np.ndarray:
+        """Apply the function element-wise over an array of values of the variable.
+
+        NumPy ufuncs (such as `np.sin`) are called once with the whole array. Callables
+        that only accept scalars (such as `math.sin`) are applied one value at a time.
+
+        Args:
+            values (np.ndarray): A 1-D array with the values of the variable.
+
+        Returns:
+            np.ndarray: The result of the function for each value.
+        """
+        try:
+            result = np.asarray(self.function(values), dtype=np.float64)
+            if result.shape == values.shape:
+                return result
+        except (TypeError, ValueError):
+            pass
+        return np.vectorize(self.function, otypes=[np.float64])(values)
+
     def __repr__(self) -> str:
         return f"{self.function.__name__}({self.variable.name})"
 
+    def __getstate__(self) -> tuple[Callable[..., FunctionReturn], 'Variable']:
+        # The function should be picklable, such as a NumPy ufunc or a module function
+        return (self.function, self.variable)
+
+    def __setstate__(self, state: tuple[Callable[..., FunctionReturn], 'Variable']) -> None:
+        self.function, self.variable = state
+
     # ============================================= #
     #      MATH OPERATIONS REPLACING SECTION        #
     # ============================================= #
@@ -74,15 +102,28 @@ class MathFunction:
 
     def __add__(self, other) -> MathExpression:
         if isinstance(other, MathFunction):
+            if other is self:
+                return MathExpression({self: 2})
             return MathExpression({self: 1, other: 1})
         if isinstance(other, (int, float)):
             return MathExpression({self: 1, 'const': other})
         # Evaluate the name of the type
-        var_type_name = type(other).__name__
-        if var_type_name == "Variable" or var_type_name == "MathExpression":
+        if isinstance(other, Variable):
             return MathExpression({self: 1, other: 1})
+        if isinstance(other, MathExpression):
+            return other + self
+        # Let the other objects of the package (such as the lazy nodes) handle it
+        if defers_to(other, "__radd__"):
+            return NotImplemented
 
         raise ValueError("There's no implemented addition for this two types.")
 
     def __radd__(self, other):
         return self.__add__(other)
+
+    # ////////////////////////// #
+    #      NEGATIVE METHODS      #
+    # ////////////////////////// #
+
+    def __neg__(self) -> MathExpression:
+        return MathExpression({self: -1})
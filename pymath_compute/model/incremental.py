@@ -0,0 +1,155 @@
+"""
+Incremental evaluation module.
+
+This module provides the `IncrementalEvaluator`, used by local search heuristics that
+change the value of one variable at a time. It keeps the contribution of each term of
+the expression and an index from each variable to the terms that use it, so the change
+of the expression after a move is computed only from the terms of the moved variable.
+"""
+from typing import Any, Callable, Optional
+# Local imports
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.compiler import term_factors
+
+# Factor of a term: the variable, its exponent and the function applied to it (if any)
+_Factor = tuple[Variable, int, Optional[Callable[..., Any]]]
+
+
+class IncrementalEvaluator:
+    """Evaluator of a `MathExpression` that is updated one variable at a time. The
+    cost of `delta` and `commit` is proportional to the number of terms (and their
+    degree) that use the moved variable, instead of the size of the expression.
+
+    Attributes:
+        expression (MathExpression): The evaluated expression. The terms are read when
+            the evaluator is created, so it should be created again if they change.
+        values (dict[Variable, float]): The current value of each variable.
+        contributions (list[float]): The current value of each term, coefficient included.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        evaluator = IncrementalEvaluator(x * y + 2 * x + y ** 2)
+        change = evaluator.delta(y, 3.0)  # <- Only the terms of y are evaluated
+        if change < 0:
+            evaluator.commit()  # <- Also sets y.value = 3.0
+        evaluator.value  # <- The current value of the expression
+        ```
+    """
+    expression: MathExpression
+    values: dict[Variable, float]
+    contributions: list[float]
+    __slots__ = ["expression", "values", "contributions", "_constant", "_total", "_terms",
+                 "_index", "_pending"]
+
+    def __init__(self, expression: MathExpression) -> None:
+        if not isinstance(expression, MathExpression):
+            raise TypeError(
+                f"We're expecting a MathExpression, but instead we got {type(expression)}.")
+        self.expression = expression
+        self._constant = 0.0
+        self._terms: list[tuple[float, list[_Factor]]] = []
+        self._index: dict[Variable, list[int]] = {}
+        for term, coef in expression.terms.items():
+            factors: list[_Factor] = []
+            for factor, exp in term_factors(term):
+                if type(factor).__name__ == "MathFunction":
+                    factors.append((factor.variable, exp, factor.function))
+                else:
+                    factors.append((factor, exp, None))
+            if not factors:
+                self._constant += coef
+                continue
+            position = len(self._terms)
+            self._terms.append((coef, factors))
+            for var in dict.fromkeys(var for var, _, _ in factors):
+                self._index.setdefault(var, []).append(position)
+        self.values = {}
+        self.contributions = []
+        self._total = 0.0
+        self._pending: Optional[tuple[Variable, float, list[tuple[int, float]], float]] = None
+        self.refresh()
+
+    @property
+    def value(self) -> float:
+        """Get the current value of the expression.
+
+        Returns:
+            float: The value with the committed values of the variables.
+        """
+        return self._total
+
+    def refresh(self) -> float:
+        """Read the current value of every variable and evaluate all the terms again.
+        This also removes the rounding errors accumulated by the commits.
+
+        Returns:
+            float: The value of the expression.
+        """
+        self.values = {var: var.value for var in self._index}
+        self.contributions = [self._term_value(position, None, 0.0)
+                              for position in range(len(self._terms))]
+        self._total = self._constant + sum(self.contributions)
+        self._pending = None
+        return self._total
+
+    def delta(self, variable: Variable, new_value: float) -> float:
+        """Get the change of the expression if the variable takes a new value. Only
+        the terms that use the variable are evaluated, and the move is kept so it
+        can be applied with `commit`.
+
+        Args:
+            variable (Variable): The variable to move.
+            new_value (float): The new value of the variable.
+
+        Returns:
+            float: The new value of the expression minus the current one.
+        """
+        changes: list[tuple[int, float]] = []
+        change = 0.0
+        for position in self._index.get(variable, ()):
+            contribution = self._term_value(position, variable, new_value)
+            changes.append((position, contribution))
+            change += contribution - self.contributions[position]
+        self._pending = (variable, new_value, changes, change)
+        return change
+
+    def commit(self) -> float:
+        """Apply the last move evaluated with `delta`. The new value is also set as
+        the value of the variable.
+
+        Returns:
+            float: The new value of the expression.
+
+        Raises:
+            ValueError: If there's no move to commit, or if the new value is outside
+                of the range of the variable.
+        """
+        if self._pending is None:
+            raise ValueError("There's no move to commit. Call `delta` first.")
+        variable, new_value, changes, change = self._pending
+        variable.value = new_value
+        if variable in self.values:
+            self.values[variable] = new_value
+        for position, contribution in changes:
+            self.contributions[position] = contribution
+        self._total += change
+        self._pending = None
+        return self._total
+
+    def _term_value(self, position: int, variable: Optional[Variable], value: float) -> float:
+        """Evaluate a single term, replacing the value of the given variable"""
+        result, factors = self._terms[position]
+        for var, exp, function in factors:
+            current = value if var is variable else self.values[var]
+            if function is not None:
+                result *= function(current)
+            else:
+                result *= current if exp == 1 else current ** exp
+        return result
+
+    def __repr__(self) -> str:
+        return (f"IncrementalEvaluator({len(self._terms)} terms, " +
+                f"{len(self._index)} variables)")
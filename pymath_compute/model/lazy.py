@@ -0,0 +1,334 @@
+"""
+Lazy expression module.
+
+This module provides an opt-in lazy mode for building expressions. Instead of expanding
+the terms on every operation, each operation is recorded as a node of a DAG. The nodes
+are hash-consed, so the same sub-expression is always the same node and it is shared
+by every expression that uses it. The DAG is only expanded or compiled when it is
+evaluated, and the compiled evaluator computes each shared node once per call.
+"""
+from itertools import count
+from typing import Any, Optional
+from weakref import WeakValueDictionary
+# Local imports
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.function import MathFunction
+from pymath_compute.model.compiler import CompiledExpression, _CodeBuilder, _term_products
+
+# Unique id of each node, used to build the keys of the nodes that use it
+_UIDS = count()
+
+
+class LazyExpression:
+    """Represents a node of a lazy expression DAG. The leaves are variables, constants,
+    functions and (eager) MathExpressions, and the inner nodes are sums, products and
+    powers of other nodes.
+
+    The instances are hash-consed: the same operation over the same nodes always
+    returns the same object, so they are compared and hashed by identity.
+
+    Attributes:
+        operation (str): The kind of node. It can be "var", "const", "func", "expr",
+            "add", "mul" or "pow".
+        args (tuple[LazyExpression, ...]): The child nodes of the operation.
+        value (Any): The payload of the node: the Variable, the constant, the
+            MathFunction, the MathExpression or the exponent of the power.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        shared = lazy(x) + y
+        expr = shared ** 2 * (shared + 1)  # <- Nothing is expanded here
+        expr.evaluate({"x": 1, "y": 2})  # <- x + y is computed only once
+        ```
+    """
+    operation: str
+    args: tuple['LazyExpression', ...]
+    value: Any
+    uid: int
+    _compiled: Optional[CompiledExpression]
+    __slots__ = ["operation", "args", "value", "uid", "_compiled", "__weakref__"]
+    # Global table with the interned nodes
+    _table: 'WeakValueDictionary[tuple[Any, ...], LazyExpression]' = WeakValueDictionary()
+
+    def __init__(self, operation: str, args: tuple['LazyExpression', ...], value: Any) -> None:
+        self.operation = operation
+        self.args = args
+        self.value = value
+        self.uid = next(_UIDS)
+        self._compiled = None
+
+    @classmethod
+    def node(
+        cls,
+        operation: str,
+        args: tuple['LazyExpression', ...] = (),
+        value: Any = None
+    ) -> 'LazyExpression':
+        """Get the interned node for the given operation.
+
+        Args:
+            operation (str): The kind of node.
+            args (tuple[LazyExpression, ...]): The child nodes.
+            value (Any): The payload of the node.
+
+        Returns:
+            LazyExpression: The unique node for that operation.
+        """
+        if operation == "var":
+            key: tuple[Any, ...] = (operation, value.uid)
+        elif operation == "const":
+            key = (operation, value)
+        elif operation == "func":
+            key = (operation, id(value.function), value.variable.uid)
+        elif operation == "expr":
+            key = (operation, id(value))
+        elif operation == "pow":
+            key = (operation, args[0].uid, value)
+        else:
+            # The sums and the products are commutative
+            args = tuple(sorted(args, key=lambda arg: arg.uid))
+            key = (operation,) + tuple(arg.uid for arg in args)
+        node = cls._table.get(key)
+        if node is None:
+            node = cls(operation, args, value)
+            cls._table[key] = node
+        return node
+
+    # ============================================= #
+    #                  DAG SECTION                  #
+    # ============================================= #
+
+    def nodes(self) -> list['LazyExpression']:
+        """Get the unique nodes of the DAG, where every node appears after its children.
+
+        Returns:
+            list[LazyExpression]: The nodes in topological order.
+        """
+        order: list[LazyExpression] = []
+        seen: set[int] = set()
+        # Iterative post-order traversal, so deep chains don't reach the recursion limit
+        stack: list[tuple[LazyExpression, bool]] = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+            if node.uid in seen:
+                continue
+            seen.add(node.uid)
+            stack.append((node, True))
+            stack.extend((arg, False) for arg in reversed(node.args) if arg.uid not in seen)
+        return order
+
+    @property
+    def variables(self) -> list[Variable]:
+        """Get the variables used in the expression, in order of appearance.
+
+        Returns:
+            list[Variable]: The unique variables of the expression.
+        """
+        seen: dict[Variable, None] = {}
+        for node in self.nodes():
+            if node.operation == "var":
+                seen[node.value] = None
+            elif node.operation == "func":
+                seen[node.value.variable] = None
+            elif node.operation == "expr":
+                for var in node.value.variables:
+                    seen[var] = None
+        return list(seen)
+
+    def expand(self) -> MathExpression:
+        """Expand the DAG into an eager MathExpression. Each shared node is expanded
+        only once.
+
+        Returns:
+            MathExpression: The expanded expression.
+        """
+        expanded: dict[int, MathExpression] = {}
+        for node in self.nodes():
+            if node.operation == "var":
+                result = MathExpression({node.value: 1})
+            elif node.operation == "const":
+                result = MathExpression({"const": node.value})
+            elif node.operation == "func":
+                result = MathExpression({node.value: 1})
+            elif node.operation == "expr":
+                result = MathExpression(node.value.terms.copy())
+            elif node.operation == "add":
+                result = expanded[node.args[0].uid] + expanded[node.args[1].uid]
+            elif node.operation == "mul":
+                result = expanded[node.args[0].uid] * expanded[node.args[1].uid]
+            else:
+                result = expanded[node.args[0].uid] ** node.value
+            expanded[node.uid] = result
+        return expanded[self.uid]
+
+    def compile(self, variables: Optional[list[Variable]] = None) -> CompiledExpression:
+        """Compile the DAG into a callable evaluator that receives a positional vector
+        of values. The DAG is not expanded: each node is computed once and stored in
+        a local of the generated function, so the shared nodes are reused.
+
+        The evaluator of the default order is cached on the node. An eager
+        MathExpression inside the DAG is read when the evaluator is generated.
+
+        Args:
+            variables (Optional[list[Variable]]): The order of the variables in the value
+                vector. By default, it uses the order of `LazyExpression.variables`.
+
+        Returns:
+            CompiledExpression: The callable evaluator.
+        """
+        if variables is None and self._compiled is not None:
+            return self._compiled
+        builder = _CodeBuilder(self.variables if variables is None else variables)
+        sources: dict[int, str] = {}
+        for node in self.nodes():
+            if node.operation == "var":
+                sources[node.uid] = builder.value(node.value)
+                continue
+            if node.operation == "const":
+                sources[node.uid] = builder.literal(node.value)
+                continue
+            # The sums and products are accumulated one operand per line, since a
+            # single long expression exceeds the recursion limit of the Python compiler
+            operator = "+"
+            if node.operation == "func":
+                parts = [f"{builder.function(node.value.function)}" +
+                         f"({builder.value(node.value.variable)})"]
+            elif node.operation == "expr":
+                constant, products = _term_products(builder, node.value.terms)
+                parts = [builder.literal(float(constant))] + products
+            elif node.operation == "add":
+                parts = [sources[arg.uid] for arg in node.args]
+            elif node.operation == "mul":
+                operator = "*"
+                parts = [sources[arg.uid] for arg in node.args]
+            else:
+                parts = [f"{sources[node.args[0].uid]}**{node.value}"]
+            name = sources[node.uid] = f"n{len(builder.lines)}"
+            # The first line creates a new value, so the in-place updates never
+            # modify the value of another node
+            builder.lines.append(f"    {name} = {f' {operator} '.join(parts[:2])}")
+            builder.lines.extend(f"    {name} {operator}= {part}" for part in parts[2:])
+        builder.lines.append(f"    return {sources[self.uid]}")
+        compiled = CompiledExpression(builder.build("_evaluate", variables is None),
+                                      builder.variables, builder.source)
+        if variables is None:
+            self._compiled = compiled
+        return compiled
+
+    def evaluate(self, values: Optional[dict[str, int | float]] = None) -> float:
+        """Evaluate the expression from a dict of values, using the compiled evaluator.
+
+        Args:
+            values: Optional[dict[str, int | float]]: A dict of values using the variable
+                name as key and the value to set as the corresponding item for that key.
+                By default, it uses the `value` of each variable.
+
+        Returns:
+            float: The value of the expression.
+        """
+        compiled = self.compile()
+        if values is None:
+            return float(compiled.function([var.value for var in compiled.variables]))
+        if not isinstance(values, dict):
+            raise TypeError("We're expecting a dict as {VAR_NAME: MATH_VALUE}," +
+                            f" but instead we got {type(values)}.")
+        return float(compiled.evaluate(values))
+
+    def __repr__(self) -> str:
+        return f"LazyExpression({self.operation}, {len(self.nodes())} nodes)"
+
+    # ============================================= #
+    #      MATH OPERATIONS REPLACING SECTION        #
+    # ============================================= #
+
+    def __add__(self, other: Any) -> 'LazyExpression':
+        other = lazy(other)
+        # Fold the constants
+        if other.operation == "const" and self.operation == "const":
+            return lazy(self.value + other.value)
+        if other.operation == "const" and other.value == 0:
+            return self
+        if self.operation == "const" and self.value == 0:
+            return other
+        return LazyExpression.node("add", (self, other))
+
+    def __radd__(self, other: Any) -> 'LazyExpression':
+        return lazy(other).__add__(self)
+
+    def __sub__(self, other: Any) -> 'LazyExpression':
+        return self.__add__(-lazy(other))
+
+    def __rsub__(self, other: Any) -> 'LazyExpression':
+        return lazy(other).__add__(-self)
+
+    def __neg__(self) -> 'LazyExpression':
+        return self.__mul__(-1)
+
+    def __mul__(self, other: Any) -> 'LazyExpression':
+        other = lazy(other)
+        # Fold the constants
+        if other.operation == "const" and self.operation == "const":
+            return lazy(self.value * other.value)
+        for first, second in ((self, other), (other, self)):
+            if first.operation == "const" and first.value == 1:
+                return second
+            if first.operation == "const" and first.value == 0:
+                return first
+        return LazyExpression.node("mul", (self, other))
+
+    def __rmul__(self, other: Any) -> 'LazyExpression':
+        return lazy(other).__mul__(self)
+
+    def __pow__(self, other: int) -> 'LazyExpression':
+        if not isinstance(other, int):
+            raise ValueError(
+                f"The param {other} of type {type(other)} is not supported.")
+        if other < 0:
+            raise ValueError("The power has to be greater or equal to zero.")
+        if other == 0:
+            return lazy(1.0)
+        if other == 1:
+            return self
+        if self.operation == "const":
+            return lazy(self.value ** other)
+        return LazyExpression.node("pow", (self,), other)
+
+
+def lazy(value: Any) -> LazyExpression:
+    """Get the lazy node of a value, to start building an expression in lazy mode.
+    The operations between a lazy node and any other value return lazy nodes.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        expr = (lazy(x) + 1) ** 8  # <- Recorded, not expanded
+        expr.expand()  # <- Expanded MathExpression
+        ```
+
+    Args:
+        value (Any): A LazyExpression, Variable, MathFunction, MathExpression or number.
+
+    Returns:
+        LazyExpression: The node of the value.
+
+    Raises:
+        ValueError: If the value is not supported.
+    """
+    if isinstance(value, LazyExpression):
+        return value
+    if isinstance(value, Variable):
+        return LazyExpression.node("var", value=value)
+    if isinstance(value, MathFunction):
+        return LazyExpression.node("func", value=value)
+    if isinstance(value, MathExpression):
+        return LazyExpression.node("expr", value=value)
+    if isinstance(value, (int, float)):
+        return LazyExpression.node("const", value=float(value))
+    raise ValueError(
+        f"The param {value} of type {type(value)} is not supported.")
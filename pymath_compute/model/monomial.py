@@ -0,0 +1,188 @@
+"""
+Monomial implementation module.
+
+This module provides the canonical keys used by `MathExpression` for the product terms.
+A `Monomial` is a product of variables raised to positive integer powers. The variables
+are sorted by their unique id and every monomial is interned in a global table, so
+`x*y` and `y*x` are the same object and like terms merge with a simple dict lookup.
+"""
+from typing import Any, TYPE_CHECKING
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from pymath_compute.model.variable import Variable
+
+# Term that can be used as a key of the MathExpression
+PolynomialTerm = Any
+
+
+class Monomial:
+    """Represents a product of variables, such as `x**2*y`.
+
+    The instances are hash-consed: the same product of variables always returns
+    the same object, so they are compared and hashed by identity.
+
+    Attributes:
+        variables (tuple[Variable, ...]): The variables of the product, sorted by uid.
+        exponents (tuple[int, ...]): The exponent of each variable.
+        degree (int): The total degree of the monomial.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        Monomial.from_powers({x: 1, y: 1}) is Monomial.from_powers({y: 1, x: 1})
+        ```
+    """
+    variables: tuple['Variable', ...]
+    exponents: tuple[int, ...]
+    degree: int
+    __slots__ = ["variables", "exponents", "degree", "__weakref__"]
+    # Global table with the interned monomials
+    _table: 'WeakValueDictionary[tuple[int, ...], Monomial]' = WeakValueDictionary()
+
+    def __init__(self, variables: tuple['Variable', ...], exponents: tuple[int, ...]) -> None:
+        self.variables = variables
+        self.exponents = exponents
+        self.degree = sum(exponents)
+
+    @classmethod
+    def from_powers(cls, powers: dict['Variable', int]) -> 'Monomial':
+        """Get the interned monomial for the given powers.
+
+        Args:
+            powers (dict[Variable, int]): The exponent of each variable. The exponents
+                should be positive integers.
+
+        Returns:
+            Monomial: The unique monomial for that product of variables.
+        """
+        ordered = sorted(powers.items(), key=lambda item: item[0].uid)
+        key = tuple(value for var, exp in ordered for value in (var.uid, exp))
+        monomial = cls._table.get(key)
+        if monomial is None:
+            monomial = cls(tuple(var for var, _ in ordered),
+                           tuple(exp for _, exp in ordered))
+            cls._table[key] = monomial
+        return monomial
+
+    @property
+    def powers(self) -> dict['Variable', int]:
+        """Get the exponent of each variable of the monomial.
+
+        Returns:
+            dict[Variable, int]: The powers as {VARIABLE: EXPONENT}.
+        """
+        return dict(zip(self.variables, self.exponents))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Intern the monomial again when it is loaded
+        return (Monomial.from_powers, (self.powers,))
+
+    def __repr__(self) -> str:
+        return "*".join(
+            var.name if exp == 1 else f"{var.name}**{exp}"
+            for var, exp in zip(self.variables, self.exponents)
+        )
+
+
+def term_powers(term: PolynomialTerm) -> dict['Variable', int]:
+    """Get the powers of the variables of a polynomial term.
+
+    Args:
+        term (PolynomialTerm): A Variable, a Monomial or the "const" term.
+
+    Returns:
+        dict[Variable, int]: The powers as {VARIABLE: EXPONENT}.
+    """
+    if isinstance(term, Monomial):
+        return term.powers
+    if isinstance(term, str):
+        return {}
+    return {term: 1}
+
+
+def term_degree(term: Any) -> int:
+    """Get the total degree of a term. The "const" term and the MathFunction terms,
+    that are not polynomial, have degree 0.
+
+    Args:
+        term (Any): A key of a MathExpression.
+
+    Returns:
+        int: The sum of the exponents of the term.
+    """
+    if isinstance(term, Monomial):
+        return term.degree
+    if isinstance(term, str) or type(term).__name__ == "MathFunction":
+        return 0
+    return 1
+
+
+def make_term(powers: dict['Variable', int]) -> PolynomialTerm:
+    """Get the canonical term for the given powers. A product without variables is
+    the "const" term, a single variable with exponent 1 is the variable itself, and
+    anything else is an interned Monomial.
+
+    Args:
+        powers (dict[Variable, int]): The exponent of each variable.
+
+    Returns:
+        PolynomialTerm: The canonical key for a MathExpression.
+    """
+    powers = {var: exp for var, exp in powers.items() if exp}
+    if not powers:
+        return "const"
+    if len(powers) == 1:
+        var, exp = next(iter(powers.items()))
+        if exp == 1:
+            return var
+    return Monomial.from_powers(powers)
+
+
+def multiply_terms(left: PolynomialTerm, right: PolynomialTerm) -> PolynomialTerm:
+    """Get the canonical term of the product of two polynomial terms.
+
+    Args:
+        left (PolynomialTerm): The first term.
+        right (PolynomialTerm): The second term.
+
+    Returns:
+        PolynomialTerm: The canonical key of the product.
+    """
+    if isinstance(left, str):
+        return right
+    if isinstance(right, str):
+        return left
+    powers = term_powers(left)
+    for var, exp in term_powers(right).items():
+        powers[var] = powers.get(var, 0) + exp
+    return make_term(powers)
+
+
+def canonical_term(term: Any) -> Any:
+    """Convert a product tuple, such as `(x, y)` or `((x, y), x)`, into its canonical
+    term. The `"const"` factors are dropped since their value is already part of the
+    coefficient. Any other kind of term is returned as it is.
+
+    Args:
+        term (Any): The term to convert.
+
+    Returns:
+        Any: The canonical key for a MathExpression.
+
+    Raises:
+        ValueError: If the product includes a MathFunction.
+    """
+    if not isinstance(term, tuple):
+        return term
+    result: PolynomialTerm = "const"
+    for factor in term:
+        factor = canonical_term(factor)
+        if type(factor).__name__ == "MathFunction":
+            if len(term) == 1:
+                return factor
+            raise ValueError(
+                f"The product of the MathFunction {factor} with other terms is not supported.")
+        result = multiply_terms(result, factor)
+    return result
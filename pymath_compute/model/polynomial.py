@@ -0,0 +1,401 @@
+"""
+SparsePolynomial implementation module.
+
+This module provides a compact, array-backed representation of polynomial expressions.
+Instead of a dict with one Python key per term, the monomials are stored in CSR style:
+each variable gets an integer id, `indptr` marks where each monomial starts, `indices`
+and `exponents` store the factors of all the monomials and `coefficients` is a float64
+array with one coefficient per monomial.
+
+With this layout the evaluation is a vectorized gather-and-multiply, and large
+polynomials (10^5 - 10^6 monomials) fit in memory.
+"""
+from typing import Mapping, Optional, Sequence
+import numpy as np
+# Local imports
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.compiler import term_factors
+from pymath_compute.model.monomial import make_term
+from pymath_compute.model.variable import Variable
+
+# Id used to pad the rows of the dense monomial representation
+_PAD = np.iinfo(np.int64).max
+
+
+class SparsePolynomial:
+    """Represents a polynomial stored in compact arrays.
+
+    Attributes:
+        variables (list[Variable]): The variables of the polynomial. The integer id
+            of each variable is its position in this list.
+        indptr (np.ndarray): Start of each monomial in `indices` and `exponents`.
+        indices (np.ndarray): The variable id of every factor.
+        exponents (np.ndarray): The exponent of every factor.
+        coefficients (np.ndarray): The float64 coefficient of each monomial.
+        constant (float): The constant term of the polynomial.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        poly = SparsePolynomial.from_expression(x * y + 2 * x + 1)
+        poly.evaluate({"x": 1, "y": 2})
+        ```
+    """
+    variables: list['Variable']
+    indptr: np.ndarray
+    indices: np.ndarray
+    exponents: np.ndarray
+    coefficients: np.ndarray
+    constant: float
+    __slots__ = ["variables", "indptr", "indices",
+                 "exponents", "coefficients", "constant"]
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        variables: list['Variable'],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        exponents: np.ndarray,
+        coefficients: np.ndarray,
+        constant: float = 0.0
+    ) -> None:
+        self.variables = list(variables)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.exponents = np.asarray(exponents, dtype=np.int64)
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self.constant = float(constant)
+        if self.indptr.shape != (self.coefficients.size + 1,) or self.indptr[0] != 0:
+            raise ValueError(
+                "The indptr should have one more element than the coefficients" +
+                " and start with 0.")
+        if self.indices.shape != self.exponents.shape or \
+                self.indices.size != self.indptr[-1]:
+            raise ValueError(
+                "The indices and the exponents should have indptr[-1] elements.")
+        if np.any(np.diff(self.indptr) <= 0):
+            raise ValueError("Every monomial should have at least one factor.")
+
+    @classmethod
+    def from_expression(
+        cls,
+        expression: MathExpression,
+        variables: Optional[list['Variable']] = None
+    ) -> 'SparsePolynomial':
+        """Build the compact representation of a polynomial MathExpression.
+
+        Args:
+            expression (MathExpression): The expression to convert.
+            variables (Optional[list[Variable]]): The variables to use as ids. By default,
+                it uses `MathExpression.variables`.
+
+        Returns:
+            SparsePolynomial: The compact polynomial.
+
+        Raises:
+            ValueError: If the expression has terms that are not polynomial.
+        """
+        if variables is None:
+            variables = expression.variables
+        ids = {var: i for i, var in enumerate(variables)}
+        indptr = [0]
+        indices: list[int] = []
+        exponents: list[int] = []
+        coefficients: list[float] = []
+        constant = 0.0
+        for term, coef in expression.terms.items():
+            factors = term_factors(term)
+            if not factors:
+                constant += coef
+                continue
+            for factor, exp in factors:
+                if factor not in ids:
+                    raise ValueError(
+                        f"The term {factor} of type {type(factor)} is not a" +
+                        " variable of the polynomial.")
+                indices.append(ids[factor])
+                exponents.append(exp)
+            indptr.append(len(indices))
+            coefficients.append(coef)
+        return cls._canonical(
+            variables,
+            *_to_dense(np.array(indptr), np.array(indices, dtype=np.int64),
+                       np.array(exponents, dtype=np.int64)),
+            np.array(coefficients, dtype=np.float64),
+            constant
+        )
+
+    def to_expression(self) -> MathExpression:
+        """Convert the polynomial back into a MathExpression.
+
+        Returns:
+            MathExpression: The expression with the same terms.
+        """
+        terms = {}
+        for i, coef in enumerate(self.coefficients.tolist()):
+            start, end = self.indptr[i], self.indptr[i + 1]
+            powers = {self.variables[var_id]: exp for var_id, exp in
+                      zip(self.indices[start:end].tolist(), self.exponents[start:end].tolist())}
+            terms[make_term(powers)] = coef
+        if self.constant:
+            terms["const"] = self.constant
+        return MathExpression(terms)  # type: ignore
+
+    @property
+    def num_terms(self) -> int:
+        """Get the number of monomials of the polynomial, without the constant.
+
+        Returns:
+            int: The number of monomials.
+        """
+        return self.coefficients.size
+
+    @property
+    def degree(self) -> int:
+        """Get the total degree of the polynomial.
+
+        Returns:
+            int: The greatest degree between all the monomials.
+        """
+        if not self.num_terms:
+            return 0
+        return int(np.add.reduceat(self.exponents, self.indptr[:-1]).max())
+
+    # ============================================= #
+    #               EVALUATION SECTION              #
+    # ============================================= #
+
+    def evaluate(self, values: Mapping[str, int | float] | Sequence[float] | np.ndarray) -> float:
+        """Evaluate the polynomial on a single point.
+
+        Args:
+            values (Mapping[str, int | float] | Sequence[float] | np.ndarray): A dict of
+                values using the variable name as key, or a vector with the value of each
+                variable in the order of `variables`.
+
+        Returns:
+            float: The value of the polynomial.
+        """
+        vector = self._vector(values)
+        if not self.num_terms:
+            return self.constant
+        powers = vector[self.indices] ** self.exponents
+        products = np.multiply.reduceat(powers, self.indptr[:-1])
+        return float(self.constant + self.coefficients @ products)
+
+    def evaluate_batch(self, points: np.ndarray) -> np.ndarray:
+        """Evaluate the polynomial over several points.
+
+        Args:
+            points (np.ndarray): A 2-D array where each row is a point and each
+                column is a variable, in the order of `variables`.
+
+        Returns:
+            np.ndarray: The value of the polynomial for each point.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] != len(self.variables):
+            raise ValueError(
+                f"We're expecting a 2-D array with {len(self.variables)} columns," +
+                f" but instead we got the shape {points.shape}.")
+        if not self.num_terms:
+            return np.full(points.shape[0], self.constant)
+        powers = points[:, self.indices] ** self.exponents
+        products = np.multiply.reduceat(powers, self.indptr[:-1], axis=1)
+        return self.constant + products @ self.coefficients
+
+    def _vector(self, values: Mapping[str, int | float] | Sequence[float] | np.ndarray) -> np.ndarray:
+        """Get the values as a float64 vector in the order of the variables."""
+        if isinstance(values, Mapping):
+            try:
+                return np.array([values[var.name] for var in self.variables],
+                                dtype=np.float64)
+            except KeyError as error:
+                raise ValueError(
+                    "In the given values, we're missing the" +
+                    f" following variable '{error.args[0]}'."
+                ) from error
+        vector = np.asarray(values, dtype=np.float64)
+        if vector.shape != (len(self.variables),):
+            raise ValueError(
+                f"We're expecting a vector of {len(self.variables)} values," +
+                f" but instead we got the shape {vector.shape}.")
+        return vector
+
+    def __repr__(self) -> str:
+        return (f"SparsePolynomial({self.num_terms} terms, " +
+                f"{len(self.variables)} variables, degree {self.degree})")
+
+    # ============================================= #
+    #      MATH OPERATIONS REPLACING SECTION        #
+    # ============================================= #
+
+    def __add__(self, other: 'SparsePolynomial | MathExpression | Variable | int | float') -> 'SparsePolynomial':
+        if isinstance(other, (int, float)):
+            return SparsePolynomial(self.variables, self.indptr, self.indices, self.exponents,
+                                    self.coefficients, self.constant + other)
+        other = self._coerce(other)
+        variables, left, right = _align(self, other)
+        return SparsePolynomial._canonical(
+            variables,
+            *_stack(_to_dense(left.indptr, left.indices, left.exponents),
+                    _to_dense(right.indptr, right.indices, right.exponents)),
+            np.concatenate([left.coefficients, right.coefficients]),
+            left.constant + right.constant
+        )
+
+    def __radd__(self, other: 'SparsePolynomial | MathExpression | Variable | int | float') -> 'SparsePolynomial':
+        return self.__add__(other)
+
+    def __neg__(self) -> 'SparsePolynomial':
+        return self * -1
+
+    def __sub__(self, other: 'SparsePolynomial | MathExpression | Variable | int | float') -> 'SparsePolynomial':
+        if isinstance(other, (int, float)):
+            return self + (-other)
+        return self + (-self._coerce(other))
+
+    def __rsub__(self, other: 'SparsePolynomial | MathExpression | Variable | int | float') -> 'SparsePolynomial':
+        return (-self).__add__(other)
+
+    def __mul__(self, other: 'SparsePolynomial | MathExpression | Variable | int | float') -> 'SparsePolynomial':
+        if isinstance(other, (int, float)):
+            if other == 0:
+                return SparsePolynomial._canonical(
+                    self.variables, np.zeros((0, 1), dtype=np.int64),
+                    np.zeros((0, 1), dtype=np.int64), np.zeros(0), 0.0)
+            return SparsePolynomial(self.variables, self.indptr, self.indices, self.exponents,
+                                    self.coefficients * other, self.constant * other)
+        other = self._coerce(other)
+        variables, left, right = _align(self, other)
+        left_ids, left_exps = _to_dense(left.indptr, left.indices, left.exponents)
+        right_ids, right_exps = _to_dense(right.indptr, right.indices, right.exponents)
+        m, k = left.num_terms, right.num_terms
+        # Cross product of the monomials: row (i, j) is left[i] * right[j]
+        cross_ids = np.hstack([np.repeat(left_ids, k, axis=0), np.tile(right_ids, (m, 1))])
+        cross_exps = np.hstack([np.repeat(left_exps, k, axis=0), np.tile(right_exps, (m, 1))])
+        cross_coefs = np.outer(left.coefficients, right.coefficients).ravel()
+        # The constants multiply the monomials of the other polynomial
+        ids, exps = _stack((cross_ids, cross_exps), (left_ids, left_exps), (right_ids, right_exps))
+        coefficients = np.concatenate([cross_coefs,
+                                       left.coefficients * right.constant,
+                                       right.coefficients * left.constant])
+        return SparsePolynomial._canonical(variables, ids, exps, coefficients,
+                                           left.constant * right.constant)
+
+    def __rmul__(self, other: 'SparsePolynomial | MathExpression | Variable | int | float') -> 'SparsePolynomial':
+        return self.__mul__(other)
+
+    def __pow__(self, power: int) -> 'SparsePolynomial':
+        if not isinstance(power, int) or power < 0:
+            raise ValueError("The power has to be an integer greater or equal to zero.")
+        result = SparsePolynomial(self.variables, np.zeros(1), np.zeros(0), np.zeros(0),
+                                  np.zeros(0), 1.0)
+        base = self
+        while power:
+            if power & 1:
+                result = result * base
+            power >>= 1
+            if power:
+                base = base * base
+        return result
+
+    def _coerce(self, other: 'SparsePolynomial | MathExpression | Variable') -> 'SparsePolynomial':
+        """Convert the other operand into a SparsePolynomial"""
+        if isinstance(other, SparsePolynomial):
+            return other
+        if isinstance(other, MathExpression):
+            return SparsePolynomial.from_expression(other)
+        if isinstance(other, Variable):
+            return SparsePolynomial.from_expression(MathExpression({other: 1}))
+        raise ValueError(
+            f"The param {other} of type {type(other)} is not supported.")
+
+    @classmethod
+    def _canonical(  # pylint: disable=R0913
+        cls,
+        variables: list['Variable'],
+        ids: np.ndarray,
+        exps: np.ndarray,
+        coefficients: np.ndarray,
+        constant: float
+    ) -> 'SparsePolynomial':
+        """Build a polynomial from a dense (padded) monomial representation, merging
+        the repeated factors of each monomial and the monomials with the same factors."""
+        order = np.argsort(ids, axis=1, kind="stable")
+        ids = np.take_along_axis(ids, order, axis=1)
+        exps = np.take_along_axis(exps, order, axis=1)
+        # Merge the repeated variables of each monomial into one factor
+        for col in range(1, ids.shape[1]):
+            same = (ids[:, col] == ids[:, col - 1]) & (ids[:, col] != _PAD)
+            exps[same, col] += exps[same, col - 1]
+            ids[same, col - 1] = _PAD
+            exps[same, col - 1] = 0
+        ids[exps == 0] = _PAD
+        exps[ids == _PAD] = 0
+        order = np.argsort(ids, axis=1, kind="stable")
+        ids = np.take_along_axis(ids, order, axis=1)
+        exps = np.take_along_axis(exps, order, axis=1)
+        # Monomials without factors are part of the constant
+        empty = ids[:, 0] == _PAD
+        constant += float(coefficients[empty].sum())
+        ids, exps, coefficients = ids[~empty], exps[~empty], coefficients[~empty]
+        # Merge the like monomials
+        keys = np.hstack([ids, exps])
+        order = np.lexsort(keys.T[::-1])
+        keys, coefficients = keys[order], coefficients[order]
+        first = np.ones(keys.shape[0], dtype=bool)
+        first[1:] = np.any(keys[1:] != keys[:-1], axis=1)
+        coefficients = np.bincount(np.cumsum(first) - 1, weights=coefficients,
+                                   minlength=int(first.sum()))
+        keys = keys[first]
+        keep = coefficients != 0
+        ids, exps = keys[keep, :ids.shape[1]], keys[keep, ids.shape[1]:]
+        mask = ids != _PAD
+        indptr = np.concatenate([[0], np.cumsum(mask.sum(axis=1))])
+        return cls(variables, indptr, ids[mask], exps[mask], coefficients[keep], constant)
+
+
+def _to_dense(indptr: np.ndarray, indices: np.ndarray, exponents: np.ndarray
+              ) -> tuple[np.ndarray, np.ndarray]:
+    """Convert the CSR arrays into two padded 2-D arrays of (ids, exponents)"""
+    lengths = np.diff(indptr)
+    width = max(int(lengths.max()) if lengths.size else 0, 1)
+    rows = np.repeat(np.arange(lengths.size), lengths)
+    cols = np.arange(indices.size) - np.repeat(indptr[:-1], lengths)
+    ids = np.full((lengths.size, width), _PAD, dtype=np.int64)
+    exps = np.zeros((lengths.size, width), dtype=np.int64)
+    ids[rows, cols] = indices
+    exps[rows, cols] = exponents
+    return ids, exps
+
+
+def _stack(*blocks: tuple[np.ndarray, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Stack several dense monomial blocks, padding them to the same width"""
+    width = max(ids.shape[1] for ids, _ in blocks)
+    all_ids, all_exps = [], []
+    for ids, exps in blocks:
+        pad = width - ids.shape[1]
+        all_ids.append(np.pad(ids, ((0, 0), (0, pad)), constant_values=_PAD))
+        all_exps.append(np.pad(exps, ((0, 0), (0, pad))))
+    return np.vstack(all_ids), np.vstack(all_exps)
+
+
+def _align(
+    left: SparsePolynomial,
+    right: SparsePolynomial
+) -> tuple[list['Variable'], SparsePolynomial, SparsePolynomial]:
+    """Use the same variable ids for both polynomials"""
+    if left.variables == right.variables:
+        return left.variables, left, right
+    ids = {var: i for i, var in enumerate(left.variables)}
+    variables = list(left.variables)
+    for var in right.variables:
+        if var not in ids:
+            ids[var] = len(variables)
+            variables.append(var)
+    remap = np.array([ids[var] for var in right.variables], dtype=np.int64)
+    right = SparsePolynomial(variables, right.indptr, remap[right.indices],
+                             right.exponents, right.coefficients, right.constant)
+    return variables, left, right
@@ -0,0 +1,231 @@
+"""
+Model implementation module.
+
+This module provides the `Model` container. A model registers the variables of a
+problem and gives each one a stable integer index, so the state of the problem is a
+single float64 vector. Every expression attached to the model is compiled against
+that order, and all of them are evaluated from the vector without building any dict.
+"""
+from typing import Iterable, Mapping, Optional
+import numpy as np
+# Local imports
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.compiler import CompiledExpression
+
+
+class Model:
+    """Represents a registry of variables and the expressions that use them.
+
+    Attributes:
+        variables (list[Variable]): The registered variables. The index of each
+            variable is its position in this list.
+        expressions (list[MathExpression]): The attached expressions.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        model = Model()
+        model.add_expression(x + 2 * y)
+        model.add_expression(x * y)
+        model.evaluate(np.array([1.0, 2.0]))  # <- array([5., 2.])
+        ```
+    """
+    variables: list[Variable]
+    expressions: list[MathExpression]
+    _indices: dict[Variable, int]
+    _names: dict[str, int]
+    _compiled: list[CompiledExpression]
+    __slots__ = ["variables", "expressions", "_indices", "_names", "_compiled"]
+
+    def __init__(self, variables: Optional[Iterable[Variable]] = None) -> None:
+        self.variables = []
+        self.expressions = []
+        self._indices = {}
+        self._names = {}
+        self._compiled = []
+        if variables is not None:
+            self.add_variables(variables)
+
+    @property
+    def num_variables(self) -> int:
+        """Get the number of registered variables.
+
+        Returns:
+            int: The size of the value vector.
+        """
+        return len(self.variables)
+
+    def add_variable(self, variable: Variable) -> int:
+        """Register a variable in the model. Registering the same variable
+        again returns its current index.
+
+        Args:
+            variable (Variable): The variable to register.
+
+        Returns:
+            int: The index of the variable in the value vector.
+
+        Raises:
+            TypeError: If the param is not a Variable.
+            ValueError: If there's another variable with the same name.
+        """
+        if variable in self._indices:
+            return self._indices[variable]
+        if not isinstance(variable, Variable):
+            raise TypeError(
+                f"We're expecting a Variable, but instead we got {type(variable)}.")
+        if variable.name in self._names:
+            raise ValueError(
+                f"There's already a variable with the name '{variable.name}' in the model.")
+        index = len(self.variables)
+        self.variables.append(variable)
+        self._indices[variable] = index
+        self._names[variable.name] = index
+        return index
+
+    def add_variables(self, variables: Iterable[Variable]) -> list[int]:
+        """Register several variables in the model, such as a VariableArray.
+
+        Args:
+            variables (Iterable[Variable]): The variables to register.
+
+        Returns:
+            list[int]: The index of each variable.
+        """
+        return [self.add_variable(var) for var in variables]
+
+    def add_expression(self, expression: MathExpression) -> int:
+        """Attach an expression to the model. Its variables are registered and the
+        expression is compiled against the order of the model.
+
+        The compiled evaluator is built at this point, so an expression that is
+        modified in place should be attached again.
+
+        Args:
+            expression (MathExpression): The expression to attach.
+
+        Returns:
+            int: The position of the expression in the evaluation output.
+        """
+        if not isinstance(expression, MathExpression):
+            raise TypeError(
+                f"We're expecting a MathExpression, but instead we got {type(expression)}.")
+        self.add_variables(expression.variables)
+        self.expressions.append(expression)
+        self._compiled.append(expression.compile(self.variables))
+        return len(self.expressions) - 1
+
+    def index(self, variable: Variable | str) -> int:
+        """Get the index of a variable in the value vector.
+
+        Args:
+            variable (Variable | str): The variable or its name.
+
+        Returns:
+            int: The index of the variable.
+
+        Raises:
+            ValueError: If the variable is not part of the model.
+        """
+        try:
+            if isinstance(variable, str):
+                return self._names[variable]
+            return self._indices[variable]
+        except KeyError as error:
+            raise ValueError(
+                f"The variable {variable} is not part of the model.") from error
+
+    # ============================================= #
+    #               EVALUATION SECTION              #
+    # ============================================= #
+
+    def evaluate(self, values: np.ndarray) -> np.ndarray:
+        """Evaluate all the attached expressions from a single value vector.
+
+        Args:
+            values (np.ndarray): The value of each variable, in the order of the indices.
+
+        Returns:
+            np.ndarray: The value of each attached expression.
+        """
+        vector = self._check_vector(values)
+        return np.fromiter((compiled.function(vector) for compiled in self._compiled),
+                           dtype=np.float64, count=len(self._compiled))
+
+    def evaluate_expression(self, position: int, values: np.ndarray) -> float:
+        """Evaluate a single attached expression from the value vector.
+
+        Args:
+            position (int): The position of the expression, as returned by `add_expression`.
+            values (np.ndarray): The value of each variable, in the order of the indices.
+
+        Returns:
+            float: The value of the expression.
+        """
+        return self._compiled[position].function(self._check_vector(values))
+
+    def _check_vector(self, values: np.ndarray) -> list[float]:
+        """Validate the value vector and convert it into Python floats,
+        that are faster to operate one by one than NumPy scalars."""
+        if len(values) != len(self.variables):
+            raise ValueError(
+                f"We're expecting a vector of {len(self.variables)} values," +
+                f" but instead we got {len(values)} values.")
+        if isinstance(values, np.ndarray):
+            return values.tolist()
+        return values  # type: ignore
+
+    # ============================================= #
+    #              VALUE VECTOR SECTION             #
+    # ============================================= #
+
+    def vector(self, values: Optional[Mapping[str, int | float]] = None) -> np.ndarray:
+        """Build the value vector of the model. By default, it uses the current
+        value of each variable.
+
+        Args:
+            values (Optional[Mapping[str, int | float]]): A dict of values using the
+                variable name as key.
+
+        Returns:
+            np.ndarray: The float64 value vector.
+        """
+        if values is None:
+            return np.array([var.value for var in self.variables], dtype=np.float64)
+        vector = np.empty(len(self.variables), dtype=np.float64)
+        for name, value in values.items():
+            vector[self.index(name)] = value
+        if len(values) != len(self.variables):
+            missing = [var.name for var in self.variables if var.name not in values]
+            if missing:
+                raise ValueError(
+                    f"In the given values, we're missing the following variables: {missing}.")
+        return vector
+
+    def bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the bounds of every variable as vectors.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The lower bounds and the upper bounds.
+        """
+        lower = np.array([var.lower_bound for var in self.variables], dtype=np.float64)
+        upper = np.array([var.upper_bound for var in self.variables], dtype=np.float64)
+        return lower, upper
+
+    def set_values(self, values: np.ndarray) -> None:
+        """Set the value of every variable from the value vector.
+
+        Args:
+            values (np.ndarray): The value of each variable, in the order of the indices.
+
+        Raises:
+            ValueError: If some value is outside of the range of its variable.
+        """
+        for var, value in zip(self.variables, self._check_vector(values)):
+            var.value = value
+
+    def __repr__(self) -> str:
+        return (f"Model({len(self.variables)} variables, " +
+                f"{len(self.expressions)} expressions)")
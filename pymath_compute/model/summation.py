@@ -0,0 +1,76 @@
+"""
+Summation builders module.
+
+This module provides helpers to build large expressions in a single pass. Using the
+builtin `sum` creates a new MathExpression (and copies all its terms) on every
+addition, which makes the construction of an expression with n terms O(n^2).
+"""
+from typing import Iterable, Sequence, TYPE_CHECKING
+import numpy as np
+# Local imports
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.types import PosibleOperators
+if TYPE_CHECKING:
+    from pymath_compute.model.variable import Variable
+
+
+def quicksum(terms: Iterable[PosibleOperators]) -> MathExpression:
+    """Add all the given terms into a single MathExpression. Each term is accumulated
+    in place, so the cost is linear in the total number of terms.
+
+    Example:
+        ```
+        x = [Variable(name=f"x{i}", lower_bound=0, upper_bound=10) for i in range(100)]
+        expr = quicksum(2 * x_i for x_i in x)
+        ```
+
+    Args:
+        terms (Iterable[PosibleOperators]): The Variables, MathFunctions,
+            MathExpressions or constants to add.
+
+    Returns:
+        MathExpression: The sum of all the terms.
+    """
+    expression = MathExpression({})
+    for term in terms:
+        expression += term
+    return expression
+
+
+def linear_sum(
+    coefficients: Sequence[int | float] | np.ndarray,
+    variables: Sequence['Variable'],
+    constant: int | float = 0
+) -> MathExpression:
+    """Build the linear expression `sum(coefficients[i] * variables[i]) + constant`
+    in one pass, without creating an intermediate expression for each product.
+
+    Example:
+        ```
+        x = [Variable(name=f"x{i}", lower_bound=0, upper_bound=10) for i in range(100)]
+        expr = linear_sum(np.arange(100), x)
+        ```
+
+    Args:
+        coefficients (Sequence[int | float] | np.ndarray): The coefficient of each variable.
+        variables (Sequence[Variable]): The variables of the expression.
+        constant (int | float): The constant term of the expression.
+
+    Returns:
+        MathExpression: The linear expression.
+
+    Raises:
+        ValueError: If there is not one coefficient per variable.
+    """
+    if isinstance(coefficients, np.ndarray):
+        coefficients = coefficients.tolist()
+    if len(coefficients) != len(variables):
+        raise ValueError(
+            f"We're expecting one coefficient per variable, but we got {len(coefficients)}" +
+            f" coefficients and {len(variables)} variables.")
+    terms: dict = {}
+    for coef, var in zip(coefficients, variables):
+        terms[var] = terms.get(var, 0) + coef
+    if constant:
+        terms["const"] = constant
+    return MathExpression(terms)
@@ -1,11 +1,30 @@
 """
 Get types to use in common around the model definition
 """
-from typing import Union, Dict, TYPE_CHECKING
+from typing import Any, Union, Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pymath_compute.model.variable import Variable
     from pymath_compute.model.expression import MathExpression
+    from pymath_compute.model.function import MathFunction
+    from pymath_compute.model.monomial import Monomial
 
 PosibleOperators = Union['Variable',  'MathExpression',  int, float]
-MathematicalTerms = Dict[Union['Variable', str], float]
+MathematicalTerms = Dict[Union['Variable', 'Monomial', 'MathFunction', str], float]
+
+
+def defers_to(other: Any, method: str) -> bool:
+    """Check if the other operand is an object of this package that implements the
+    reflected operation (such as `__radd__`). In that case, the operators of the eager
+    classes return NotImplemented, so Python calls the reflected method of the other
+    operand, instead of raising an error for an unsupported param.
+
+    Args:
+        other (Any): The other operand.
+        method (str): The name of the reflected method.
+
+    Returns:
+        bool: If the operation should be left to the other operand.
+    """
+    return type(other).__module__.startswith("pymath_compute.") and \
+        hasattr(type(other), method)
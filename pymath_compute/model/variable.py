@@ -5,10 +5,19 @@ to define and create a variable with a specific range [low_bound, upper_bound]
 This variable would have a MathExpression instead of the normal
 mathematical operations.
 """
-from typing import Optional
+from itertools import count
+from typing import Optional, TYPE_CHECKING
+import numpy as np
 # Local imports
-from pymath_compute.model.types import PosibleOperators
+from pymath_compute.model.types import PosibleOperators, defers_to
 from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.monomial import make_term
+from pymath_compute.model.constraint import Constraint, compare
+if TYPE_CHECKING:
+    from pymath_compute.model.variable_array import VariableArray
+
+# Generator of the unique ids of the variables
+_UIDS = count()
 
 
 class Variable:
@@ -18,13 +27,15 @@ class Variable:
         name (str): The name of the variable.
         lower_bound (float): The lower bound of the variable's range.
         upper_bound (float): The upper bound of the variable's range.
+        uid (int): Unique id of the variable, used to sort the factors of the products.
     """
     name: str
     lower_bound: float
     upper_bound: float
+    uid: int
     _value: Optional[float]
     # Define the slots to save memory space
-    __slots__ = ["name", "lower_bound", "upper_bound", "_value"]
+    __slots__ = ["name", "lower_bound", "upper_bound", "uid", "_value"]
 
     def __init__(
         self,
@@ -49,8 +60,41 @@ class Variable:
         self.name = name
         self.lower_bound = lower_bound
         self.upper_bound = upper_bound
+        self.uid = next(_UIDS)
         self._value = None
 
+    @classmethod
+    def array(
+        cls,
+        name: str,
+        shape: int | tuple[int, ...],
+        lower_bound: float | np.ndarray,
+        upper_bound: float | np.ndarray
+    ) -> 'VariableArray':
+        """Create a block of variables whose bounds and values are stored in
+        contiguous NumPy arrays.
+
+        Example:
+            ```
+            x = Variable.array("x", (10, 5), lower_bound=0, upper_bound=10)
+            expr = x[0, 0] + x[0, 1]
+            ```
+
+        Args:
+            name (str): The base name of the variables.
+            shape (int | tuple[int, ...]): The shape of the block.
+            lower_bound (float | np.ndarray): The lower bound of the variables. It can
+                be a single float or an array that broadcasts to the shape.
+            upper_bound (float | np.ndarray): The upper bound of the variables. It can
+                be a single float or an array that broadcasts to the shape.
+
+        Returns:
+            VariableArray: The block of variables.
+        """
+        # The VariableArray module imports this one, so it is imported here
+        from pymath_compute.model.variable_array import VariableArray  # pylint: disable=C0415
+        return VariableArray(name, shape, lower_bound, upper_bound)
+
     @property
     def value(self) -> float:
         """Get the current value of the variable used for mathematical operations.
@@ -86,6 +130,19 @@ class Variable:
             return f"{self.name}: {self.value}"
         return self.name
 
+    # ============================================= #
+    #              SERIALIZATION SECTION            #
+    # ============================================= #
+
+    def __getstate__(self) -> tuple[str, float, float, Optional[float]]:
+        return (self.name, self.lower_bound, self.upper_bound, self._value)
+
+    def __setstate__(self, state: tuple[str, float, float, Optional[float]]) -> None:
+        # The unique ids are only valid inside a process, so the loaded
+        # variable takes a new one
+        self.name, self.lower_bound, self.upper_bound, self._value = state
+        self.uid = next(_UIDS)
+
     # ============================================= #
     #      MATH OPERATIONS REPLACING SECTION        #
     # ============================================= #
@@ -96,13 +153,18 @@ class Variable:
     def __add__(self, other: PosibleOperators) -> 'MathExpression':
         # Evaluate if the other param is a Variable
         if isinstance(other, Variable):
+            if other is self:
+                return MathExpression({self: 2})
             return MathExpression({self: 1, other: 1})
         if isinstance(other, MathExpression):
-            return other + self
+            return MathExpression({self: 1}) + other
         if type(other).__name__ == "MathFunction":
             return MathExpression({self: 1, other: 1})
         if isinstance(other, (int, float)):
             return MathExpression({self: 1, 'const': other})
+        # Let the other objects of the package (such as the lazy nodes) handle it
+        if defers_to(other, "__radd__"):
+            return NotImplemented
         # If there's no one of this parameters, raise an error
         raise TypeError(
             f"Cannot append {other} of type {type(other)} as a expression."
@@ -117,11 +179,16 @@ class Variable:
 
     def __mul__(self, other: PosibleOperators) -> 'MathExpression':
         if isinstance(other, Variable):
-            return MathExpression({(self, other): 1})
+            return MathExpression({make_term({self: 1, other: 1} if other is not self
+                                             else {self: 2}): 1})
         if type(other).__name__ == "MathFunction":
-            return MathExpression({self: 1, other: 1})
+            raise ValueError(
+                f"The product of the MathFunction {other} with other terms is not supported.")
         if isinstance(other, (int, float)):
             return MathExpression({self: other})
+        # Let the other objects of the package (such as the lazy nodes) handle it
+        if defers_to(other, "__rmul__"):
+            return NotImplemented
         # If there's no one of this parameters, raise an error
         raise TypeError(
             f"Cannot append {other} of type {type(other)} as a expression."
@@ -135,10 +202,10 @@ class Variable:
     # ////////////////////////// #
 
     def __sub__(self, other: PosibleOperators) -> 'MathExpression':
-        return self.__add__(other)
+        return self.__add__(-other)
 
     def __rsub__(self, other: PosibleOperators) -> 'MathExpression':
-        return -self.__sub__(other)
+        return (-self).__add__(other)
 
     # ////////////////////////// #
     #      NEGATIVE METHODS      #
@@ -153,8 +220,24 @@ class Variable:
 
     def __pow__(self, power_value: int) -> 'MathExpression':
         if isinstance(power_value, int) and power_value >= 0:
-            return MathExpression({(self,)*power_value: 1})  # type: ignore
+            return MathExpression({make_term({self: power_value}): 1})
         raise TypeError(
             "For the moment, the only power values " +
             "that we have implemented are: [int]."
         )
+
+    # ////////////////////////// #
+    #     COMPARISON METHODS     #
+    # ////////////////////////// #
+
+    # The comparisons build constraints, so the hash is still the identity of the object
+    __hash__ = object.__hash__
+
+    def __eq__(self, other: object) -> 'Constraint':  # type: ignore[override]
+        return compare(self, other, "==")
+
+    def __le__(self, other: PosibleOperators) -> 'Constraint':
+        return compare(self, other, "<=")
+
+    def __ge__(self, other: PosibleOperators) -> 'Constraint':
+        return compare(self, other, ">=")
@@ -0,0 +1,246 @@
+"""
+VariableArray implementation module.
+
+This module provides a block of variables whose bounds and values are stored in
+contiguous float64 arrays. The values can be assigned in bulk with a vectorized bound
+check (or clipping), and each element of the block is a lightweight `Variable` view
+that reads and writes those arrays, so it can be used inside any expression.
+"""
+from typing import Any, Iterator
+import numpy as np
+# Local imports
+from pymath_compute.model.variable import Variable, _UIDS
+
+
+class ArrayVariable(Variable):
+    """Represents a single element of a VariableArray. It behaves as a `Variable`,
+    but its bounds and value are read from (and written to) the arrays of the block.
+
+    Attributes:
+        array (VariableArray): The block that owns the variable.
+        index (int): The flat position of the variable in the block.
+    """
+    array: 'VariableArray'
+    index: int
+    __slots__ = ["array", "index"]
+
+    def __init__(  # pylint: disable=W0231
+        self,
+        name: str,
+        array: 'VariableArray',
+        index: int
+    ) -> None:
+        # The bounds and the value live in the block, so the validation
+        # of the Variable constructor is already done by the VariableArray
+        self.name = name
+        self.uid = next(_UIDS)
+        self.array = array
+        self.index = index
+
+    @property  # type: ignore[override]
+    def lower_bound(self) -> float:  # pylint: disable=W0236
+        """Get the lower bound of the variable.
+
+        Returns:
+            float: The lower bound stored in the block.
+        """
+        return float(self.array.lower_bounds[self.index])
+
+    @lower_bound.setter
+    def lower_bound(self, new_bound: float) -> None:
+        self.array.lower_bounds[self.index] = new_bound
+
+    @property  # type: ignore[override]
+    def upper_bound(self) -> float:  # pylint: disable=W0236
+        """Get the upper bound of the variable.
+
+        Returns:
+            float: The upper bound stored in the block.
+        """
+        return float(self.array.upper_bounds[self.index])
+
+    @upper_bound.setter
+    def upper_bound(self, new_bound: float) -> None:
+        self.array.upper_bounds[self.index] = new_bound
+
+    @property
+    def value(self) -> float:
+        """Get the current value of the variable used for mathematical operations.
+
+        Returns:
+            float: The current value stored in the block.
+        """
+        return float(self.array.flat_values[self.index])
+
+    @value.setter
+    def value(self, new_value: float) -> None:
+        """Set a new value for this variable:
+
+        Args:
+            - new_value (float): New value to set
+
+        Raises:
+            ValueError: If the value set is not in the defined
+                    [lower_bound, upper_bound] range.
+        """
+        if self.lower_bound <= new_value <= self.upper_bound:
+            self.array.flat_values[self.index] = new_value
+            return
+        raise ValueError(
+            f"The new expected value {new_value} is outside the range of" +
+            f" [{self.lower_bound}, {self.upper_bound}]."
+        )
+
+    def __getstate__(self) -> tuple[str, 'VariableArray', int]:  # type: ignore[override]
+        return (self.name, self.array, self.index)
+
+    def __setstate__(self, state: tuple[str, 'VariableArray', int]) -> None:  # type: ignore[override]
+        self.name, self.array, self.index = state
+        self.uid = next(_UIDS)
+
+
+class VariableArray:
+    """Represents a block of variables with NumPy-backed bounds and values.
+
+    Attributes:
+        name (str): The base name of the variables. Each variable is named
+            as `name[i]` (or `name[i,j]` for more dimensions).
+        shape (tuple[int, ...]): The shape of the block.
+        lower_bounds (np.ndarray): The flat float64 array of lower bounds.
+        upper_bounds (np.ndarray): The flat float64 array of upper bounds.
+        flat_values (np.ndarray): The flat float64 array of values.
+        variables (list[ArrayVariable]): The flat list of variable views.
+
+    Example:
+        ```
+        x = Variable.array("x", 1000, lower_bound=0, upper_bound=10)
+        x.values = np.linspace(0, 10, 1000)  # <- Vectorized bound check
+        expr = 2 * x[0] + x[1] * x[2]
+        ```
+    """
+    name: str
+    shape: tuple[int, ...]
+    lower_bounds: np.ndarray
+    upper_bounds: np.ndarray
+    flat_values: np.ndarray
+    variables: list[ArrayVariable]
+    __slots__ = ["name", "shape", "lower_bounds", "upper_bounds",
+                 "flat_values", "variables", "_views"]
+
+    def __init__(
+        self,
+        name: str,
+        shape: int | tuple[int, ...],
+        lower_bound: float | np.ndarray,
+        upper_bound: float | np.ndarray
+    ) -> None:
+        if not isinstance(name, str):
+            raise TypeError("The name should be a string, but instead" +
+                            f" is {type(name)}.")
+        self.name = name
+        self.shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        size = int(np.prod(self.shape))
+        try:
+            self.lower_bounds = np.broadcast_to(
+                np.asarray(lower_bound, dtype=np.float64), self.shape).ravel().copy()
+            self.upper_bounds = np.broadcast_to(
+                np.asarray(upper_bound, dtype=np.float64), self.shape).ravel().copy()
+        except (TypeError, ValueError) as error:
+            raise TypeError(
+                "The lower bound and the upper bound should be floats or arrays" +
+                f" with the shape {self.shape}."
+            ) from error
+        if np.any(self.lower_bounds > self.upper_bounds):
+            raise ValueError("The lower bounds should be lower than the upper bounds.")
+        self.flat_values = np.zeros(size, dtype=np.float64)
+        # Create the views of each variable
+        names = [name + "[" + ",".join(map(str, index)) + "]"
+                 for index in np.ndindex(*self.shape)] if len(self.shape) > 1 else \
+            [f"{name}[{i}]" for i in range(size)]
+        self.variables = [ArrayVariable(names[i], self, i) for i in range(size)]
+        self._views = np.empty(size, dtype=object)
+        self._views[:] = self.variables
+        self._views = self._views.reshape(self.shape)
+
+    @property
+    def size(self) -> int:
+        """Get the number of variables of the block.
+
+        Returns:
+            int: The number of variables.
+        """
+        return self.flat_values.size
+
+    @property
+    def values(self) -> np.ndarray:
+        """Get the values of the variables, with the shape of the block.
+
+        Returns:
+            np.ndarray: A read-only view of the values.
+        """
+        values = self.flat_values.reshape(self.shape)
+        values.flags.writeable = False
+        return values
+
+    @values.setter
+    def values(self, new_values: np.ndarray | float) -> None:
+        """Set the values of all the variables at once.
+
+        Args:
+            - new_values (np.ndarray | float): The new values, with the shape of the block.
+
+        Raises:
+            ValueError: If some value is outside of its [lower_bound, upper_bound] range.
+        """
+        self.set_values(new_values)
+
+    def set_values(self, new_values: np.ndarray | float, clip: bool = False) -> None:
+        """Set the values of all the variables at once, checking the bounds
+        of every variable with a single vectorized operation.
+
+        Args:
+            new_values (np.ndarray | float): The new values, with the shape of the block.
+            clip (bool): If True, the values outside of the bounds are clipped to
+                the nearest bound instead of raising an error.
+
+        Raises:
+            ValueError: If some value is outside of its [lower_bound, upper_bound]
+                range and `clip` is False.
+        """
+        values = np.broadcast_to(
+            np.asarray(new_values, dtype=np.float64), self.shape).ravel()
+        if clip:
+            np.clip(values, self.lower_bounds, self.upper_bounds, out=self.flat_values)
+            return
+        outside = (values < self.lower_bounds) | (values > self.upper_bounds)
+        if np.any(outside):
+            first = int(np.argmax(outside))
+            raise ValueError(
+                f"There are {int(outside.sum())} values outside of their range. For example," +
+                f" the value {values[first]} of {self.variables[first].name} is outside" +
+                f" the range of [{self.lower_bounds[first]}, {self.upper_bounds[first]}]."
+            )
+        self.flat_values[:] = values
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._views[index]
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return (self.name, self.shape, self.lower_bounds, self.upper_bounds,
+                self.flat_values, self.variables)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        (self.name, self.shape, self.lower_bounds, self.upper_bounds,
+         self.flat_values, self.variables) = state
+        self._views = np.empty(len(self.variables), dtype=object)
+        self._views[:] = self.variables
+        self._views = self._views.reshape(self.shape)
+
+    def __iter__(self) -> Iterator[ArrayVariable]:
+        return iter(self.variables)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"VariableArray({self.name}, shape={self.shape})"
@@ -0,0 +1,12 @@
+"""
+Solvers Module.
+
+This module provides the optimization and root finding methods that work directly
+with the Variables and MathExpressions of the model.
+
+Includes:
+    - minimize
+    - newton
+"""
+from pymath_compute.solvers.scipy_bridge import minimize
+from pymath_compute.solvers.newton import newton
@@ -0,0 +1,156 @@
+"""
+Newton's method module.
+
+This module provides a Newton-Raphson root finder for systems of `MathExpression`
+equations. The residuals and the sparse Jacobian are compiled once, and every iteration
+only fills the data array of the Jacobian and factorizes it with `scipy.sparse.linalg`.
+The column ordering of the first factorization is kept for the next iterations, since
+the sparsity pattern of the Jacobian never changes, so the cost of each iteration grows
+with the number of nonzeros instead of the dense O(n³).
+"""
+from typing import Optional, Sequence
+import numpy as np
+from scipy import optimize
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+# Local imports
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.registry import Model
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.compiler import compile_system_terms
+
+
+def newton(  # pylint: disable=R0913, R0914
+    equations: Sequence[MathExpression],
+    variables: Optional[Sequence[Variable]] = None,
+    x0: Optional[np.ndarray] = None,
+    tol: float = 1e-10,
+    max_iter: int = 50,
+    damping: float = 1.0,
+    line_search: bool = False
+) -> optimize.OptimizeResult:
+    """Solve a system of equations, where each expression should be equal to zero,
+    using Newton's method. Every step is clipped to the bounds of the variables, and
+    the solution is written back into the value of each variable.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=0, upper_bound=10)
+        y = Variable(name="y", lower_bound=0, upper_bound=10)
+        result = newton([x**2 + y**2 - 4, x - y])
+        x.value, y.value  # <- (1.4142..., 1.4142...)
+        ```
+
+    Args:
+        equations (Sequence[MathExpression]): The equations of the system.
+        variables (Optional[Sequence[Variable]]): The order of the unknowns. By default,
+            it uses the variables of the equations, in order of appearance.
+        x0 (Optional[np.ndarray]): The initial point. By default, it uses the current
+            value of each variable, clipped to its bounds.
+        tol (float): The tolerance for the maximum absolute residual.
+        max_iter (int): The maximum number of iterations.
+        damping (float): The fraction of the Newton step that is taken, in (0, 1].
+        line_search (bool): If True, the step is halved until the norm of the
+            residuals decreases (backtracking line search).
+
+    Returns:
+        optimize.OptimizeResult: The result, with the solution `x`, the residuals `fun`,
+            the number of iterations `nit`, `success` and `message`.
+
+    Raises:
+        TypeError: If some equation is not a MathExpression.
+        ValueError: If the system is not square or the params are not valid.
+    """
+    for equation in equations:
+        if not isinstance(equation, MathExpression):
+            raise TypeError(
+                f"We're expecting MathExpressions, but instead we got {type(equation)}.")
+    if not 0 < damping <= 1:
+        raise ValueError(f"The damping should be in (0, 1], but instead it is {damping}.")
+    model = Model(variables)
+    if variables is None:
+        for equation in equations:
+            model.add_variables(equation.variables)
+    if len(equations) != model.num_variables:
+        raise ValueError(
+            f"The system should be square, but it has {len(equations)} equations" +
+            f" and {model.num_variables} variables.")
+    lower, upper = model.bounds()
+    if x0 is None:
+        x0 = model.vector()
+    elif len(x0) != model.num_variables:
+        raise ValueError(
+            f"We're expecting an initial point of {model.num_variables} values," +
+            f" but instead we got {len(x0)} values.")
+    system = compile_system_terms([equation.terms for equation in equations], model.variables)
+
+    x = np.clip(np.asarray(x0, dtype=np.float64), lower, upper)
+    residuals = system.residuals(x.tolist())
+    norm = np.linalg.norm(residuals)
+    message = "The maximum number of iterations was reached."
+    permutation: Optional[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+    iteration = 0
+    success = bool(np.max(np.abs(residuals), initial=0.0) <= tol)
+    while not success and iteration < max_iter:
+        iteration += 1
+        # Factorize the Jacobian. The first factorization computes the column ordering,
+        # and the next ones factorize the permuted pattern using that same ordering
+        try:
+            if permutation is None:
+                lu = splu(system.jacobian(x.tolist()), permc_spec="COLAMD")
+                permutation = _permuted_pattern(system.indices, system.indptr, lu.perm_c)
+                step = lu.solve(-residuals)
+            else:
+                columns, gather, indices, indptr = permutation
+                data = system.data(x.tolist())[gather]
+                lu = splu(sp.csc_matrix((data, indices, indptr), shape=system.shape),
+                          permc_spec="NATURAL")
+                step = np.empty_like(x)
+                step[columns] = lu.solve(-residuals)
+        except RuntimeError:
+            message = "The Jacobian is singular."
+            break
+        # Take the (damped) step inside the bounds
+        size = damping
+        candidate = np.clip(x + size * step, lower, upper)
+        new_residuals = system.residuals(candidate.tolist())
+        new_norm = np.linalg.norm(new_residuals)
+        while line_search and not new_norm < (1 - 1e-4 * size) * norm and size > 1e-10:
+            size /= 2
+            candidate = np.clip(x + size * step, lower, upper)
+            new_residuals = system.residuals(candidate.tolist())
+            new_norm = np.linalg.norm(new_residuals)
+        if np.array_equal(candidate, x):
+            message = "The step can't move the solution inside the bounds."
+            break
+        x, residuals, norm = candidate, new_residuals, new_norm
+        success = bool(np.max(np.abs(residuals), initial=0.0) <= tol)
+    if success:
+        message = "The solution converged."
+    # Write the solution back into the variables
+    model.set_values(x)
+    return optimize.OptimizeResult(x=x, fun=residuals, nit=iteration, success=success,
+                                   message=message)
+
+
+def _permuted_pattern(
+    indices: np.ndarray,
+    indptr: np.ndarray,
+    perm_c: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Get the CSC pattern of the Jacobian with its columns permuted by the ordering
+    of a factorization, and the positions of the data array that fill it.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The original column of
+            each permuted column, the gather index of the data array, and the indices
+            and the pointers of the permuted pattern.
+    """
+    columns = np.argsort(perm_c)
+    lengths = np.diff(indptr)[columns]
+    new_indptr = np.zeros(indptr.size, dtype=indptr.dtype)
+    np.cumsum(lengths, out=new_indptr[1:])
+    # Each permuted column is a contiguous block of the original data array
+    gather = np.arange(indices.size, dtype=np.int64) + \
+        np.repeat(indptr[columns] - new_indptr[:-1], lengths)
+    return columns, gather, indices[gather], new_indptr
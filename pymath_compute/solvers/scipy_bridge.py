@@ -0,0 +1,102 @@
+"""
+scipy.optimize bridge module.
+
+This module connects the MathExpressions with `scipy.optimize.minimize`. The objective,
+its gradient and its Hessian are compiled into array-in/array-out functions, and the
+bounds are built directly from the Variables, so no dict is created inside the loop
+of the solver.
+"""
+from typing import Any, Optional
+import numpy as np
+from scipy import optimize
+# Local imports
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.registry import Model
+from pymath_compute.model.variable import Variable
+
+# Methods of scipy.optimize.minimize that accept bounds
+_BOUNDED_METHODS = {"nelder-mead", "l-bfgs-b", "tnc", "slsqp", "powell", "trust-constr", "cobyla",
+                    "cobyqa"}
+# Methods that use the gradient
+_GRADIENT_METHODS = {"cg", "bfgs", "newton-cg", "l-bfgs-b", "tnc", "slsqp", "dogleg",
+                     "trust-ncg", "trust-krylov", "trust-exact", "trust-constr"}
+# Methods that use the Hessian, and the ones that need it as a dense array
+_HESSIAN_METHODS = {"newton-cg", "dogleg", "trust-ncg", "trust-krylov", "trust-exact",
+                    "trust-constr"}
+_DENSE_HESSIAN_METHODS = {"dogleg", "trust-ncg", "trust-krylov", "trust-exact"}
+
+
+def minimize(  # pylint: disable=R0913
+    expression: MathExpression,
+    method: Optional[str] = None,
+    variables: Optional[list[Variable]] = None,
+    x0: Optional[np.ndarray] = None,
+    tol: Optional[float] = None,
+    options: Optional[dict[str, Any]] = None
+) -> optimize.OptimizeResult:
+    """Minimize a MathExpression using `scipy.optimize.minimize`. After the solver
+    finishes, the optimum is written back into the value of each Variable.
+
+    Example:
+        ```
+        x = Variable(name="x", lower_bound=-10, upper_bound=10)
+        y = Variable(name="y", lower_bound=1, upper_bound=10)
+        result = minimize((x - 1) ** 2 + y ** 2, method="L-BFGS-B")
+        x.value, y.value  # <- (1.0, 1.0)
+        ```
+
+    Args:
+        expression (MathExpression): The objective to minimize.
+        method (Optional[str]): The method of `scipy.optimize.minimize`. By default,
+            scipy chooses it (L-BFGS-B, since there are bounds).
+        variables (Optional[list[Variable]]): The order of the variables in the vector
+            of the solver. By default, it uses `MathExpression.variables`.
+        x0 (Optional[np.ndarray]): The initial point. By default, it uses the current
+            value of each variable, clipped to its bounds.
+        tol (Optional[float]): The tolerance for the termination.
+        options (Optional[dict[str, Any]]): The options of the method.
+
+    Returns:
+        optimize.OptimizeResult: The result of the optimization.
+
+    Raises:
+        ValueError: If some variable has a finite bound and the method can't enforce
+            the bounds (such as BFGS or the trust-region methods).
+    """
+    if not isinstance(expression, MathExpression):
+        raise TypeError(
+            f"We're expecting a MathExpression, but instead we got {type(expression)}.")
+    model = Model(expression.variables if variables is None else variables)
+    model.add_expression(expression)
+    lower, upper = model.bounds()
+    if x0 is None:
+        x0 = np.clip(model.vector(), lower, upper)
+    elif len(x0) != model.num_variables:
+        raise ValueError(
+            f"We're expecting an initial point of {model.num_variables} values," +
+            f" but instead we got {len(x0)} values.")
+    # Compile the objective and its derivatives. The default order uses
+    # the evaluators cached on the expression
+    order = None if variables is None else model.variables
+    name = method.lower() if method is not None else "l-bfgs-b"
+    if name not in _BOUNDED_METHODS and \
+            (np.isfinite(lower).any() or np.isfinite(upper).any()):
+        raise ValueError(
+            f"The method {method} can't enforce the bounds of the variables. Use a method" +
+            " that accepts bounds (such as L-BFGS-B) or variables without finite bounds.")
+    kwargs: dict[str, Any] = {"fun": expression.compile(order).function}
+    if name in _GRADIENT_METHODS:
+        kwargs["jac"] = expression.compile_gradient(order).function
+    if name in _HESSIAN_METHODS:
+        hessian = expression.hessian(order)
+        kwargs["hess"] = (lambda x: hessian(x).toarray()) \
+            if name in _DENSE_HESSIAN_METHODS else hessian
+    if name in _BOUNDED_METHODS:
+        kwargs["bounds"] = optimize.Bounds(lower, upper)
+    result = optimize.minimize(x0=np.asarray(x0, dtype=np.float64), method=method, tol=tol,
+                               options=options, **kwargs)
+    # Write the optimum back into the variables. The bounded methods can step over
+    # a bound by a rounding error, so the optimum is clipped into the bounds
+    result.x = np.clip(result.x, lower, upper)
+    model.set_values(result.x)
+    return result
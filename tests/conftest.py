@@ -7,7 +7,23 @@ import pytest
 test_marks = [
     "variable",
     "function",
-    "expression"
+    "expression",
+    "polynomial",
+    "monomial",
+    "summation",
+    "variable_array",
+    "registry",
+    "derivatives",
+    "solvers",
+    "lazy",
+    "incremental",
+    "expression_set",
+    "forms",
+    "constraint",
+    "serialization",
+    "engine",
+    "columns",
+    "asynchronous"
 ]
 
 
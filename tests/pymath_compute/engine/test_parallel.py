@@ -0,0 +1,61 @@
+"""
+Test the parallel evaluation module
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.engine import evaluate_parallel
+from pymath_compute.model.expression_set import ExpressionSet
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+
+
+@pytest.mark.engine
+def test_parallel_expression():
+    """Test the parallel evaluation of an expression.
+
+    This test checks that the values computed by the worker processes are the same
+    as the values of the vectorized evaluation, for a number of rows that is not
+    a multiple of the chunk size.
+    """
+    expr = x * y + 2 * x + (MathFunction(np.sin, y) + 0) * 3 + 1
+    points = np.random.default_rng(0).uniform(-10, 10, size=(1_003, 2))
+    values = evaluate_parallel(expr, points, workers=2, chunk_size=100)
+    expected = expr.evaluate_batch(points, [x, y])
+    assert values.shape == (1_003,)
+    np.testing.assert_allclose(values, expected)
+    # The order of the columns can be given
+    values = evaluate_parallel(expr, points[:, ::-1], variables=[y, x], workers=2)
+    np.testing.assert_allclose(values, expected)
+
+
+@pytest.mark.engine
+def test_parallel_expression_set():
+    """Test the parallel evaluation of an ExpressionSet.
+
+    This test checks that the output has a column per expression, and that a
+    single worker evaluates the points in the current process.
+    """
+    expressions = ExpressionSet([x * y + 1, x - y, MathFunction(np.cos, x) + 0])
+    points = np.random.default_rng(1).uniform(-10, 10, size=(500, 2))
+    values = evaluate_parallel(expressions, points, workers=2)
+    assert values.shape == (500, 3)
+    np.testing.assert_allclose(values, expressions.evaluate_batch(points))
+    np.testing.assert_allclose(evaluate_parallel(expressions, points, workers=1), values)
+
+
+@pytest.mark.engine
+def test_parallel_errors():
+    """Test the errors of the parallel evaluation.
+
+    This test checks that the invalid expressions, points and workers raise an error.
+    """
+    with pytest.raises(TypeError):
+        evaluate_parallel(x, np.zeros((3, 1)))
+    with pytest.raises(ValueError):
+        evaluate_parallel(x + y, np.zeros((3, 3)), workers=2)
+    with pytest.raises(ValueError):
+        evaluate_parallel(x + y, np.zeros((3, 2)), workers=0)
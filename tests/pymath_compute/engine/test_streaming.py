@@ -0,0 +1,76 @@
+"""
+Test the streaming evaluation module
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.engine import evaluate_stream, evaluate_to_memmap, iter_chunks
+from pymath_compute.model.expression_set import ExpressionSet
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+
+
+@pytest.mark.engine
+def test_stream_from_npy(tmp_path):
+    """Test the streaming evaluation of a `.npy` file.
+
+    This test checks that the file is read by chunks of the given size, and that the
+    values of all the chunks are the values of the vectorized evaluation.
+    """
+    expr = x * y + (MathFunction(np.sin, x) + 0) * 2 - 1
+    points = np.random.default_rng(0).uniform(-10, 10, size=(1_050, 2))
+    np.save(tmp_path / "points.npy", points)
+    chunks = list(iter_chunks(tmp_path / "points.npy", chunk_size=200))
+    assert [chunk.shape[0] for chunk in chunks] == [200] * 5 + [50]
+    assert isinstance(chunks[0], np.memmap)
+    values = list(evaluate_stream(expr, str(tmp_path / "points.npy"), chunk_size=200))
+    assert len(values) == 6
+    np.testing.assert_allclose(np.concatenate(values), expr.evaluate_batch(points, [x, y]))
+
+
+@pytest.mark.engine
+def test_stream_from_iterator():
+    """Test the streaming evaluation of an iterator of chunks.
+
+    This test checks that the chunks of a generator are evaluated as they are, with
+    the given order of the columns, and for an ExpressionSet.
+    """
+    expr = x - 2 * y
+    rng = np.random.default_rng(1)
+    chunks = [rng.uniform(-10, 10, size=(rows, 2)) for rows in (10, 3, 7)]
+    values = list(evaluate_stream(expr, (chunk for chunk in chunks), variables=[y, x]))
+    for chunk, value in zip(chunks, values):
+        np.testing.assert_allclose(value, chunk[:, 1] - 2 * chunk[:, 0])
+    expressions = ExpressionSet([x * y, x + y])
+    values = list(evaluate_stream(expressions, iter(chunks)))
+    assert [value.shape for value in values] == [(10, 2), (3, 2), (7, 2)]
+    with pytest.raises(ValueError):
+        list(evaluate_stream(expr, [np.zeros((2, 3))]))
+
+
+@pytest.mark.engine
+def test_stream_to_memmap(tmp_path):
+    """Test the streaming evaluation into an output memmap.
+
+    This test checks that the output `.npy` file is created with the values of each
+    point, and that a preallocated output must have the same number of rows.
+    """
+    expr = x * x + y
+    points = np.random.default_rng(2).uniform(-10, 10, size=(333, 2))
+    np.save(tmp_path / "points.npy", points)
+    output = evaluate_to_memmap(expr, tmp_path / "points.npy", tmp_path / "values.npy",
+                                chunk_size=100)
+    assert isinstance(output, np.memmap)
+    np.testing.assert_allclose(np.load(tmp_path / "values.npy"),
+                               points[:, 0] ** 2 + points[:, 1])
+    # The output can be given, even for an iterator of chunks
+    output = np.zeros(333)
+    evaluate_to_memmap(expr, iter([points[:300], points[300:]]), output)
+    np.testing.assert_allclose(output, points[:, 0] ** 2 + points[:, 1])
+    with pytest.raises(ValueError):
+        evaluate_to_memmap(expr, iter([points]), tmp_path / "other.npy")
+    with pytest.raises(ValueError):
+        evaluate_to_memmap(expr, points, np.zeros(10))
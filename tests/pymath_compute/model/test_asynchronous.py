@@ -0,0 +1,88 @@
+"""
+Test the asynchronous evaluation module
+"""
+import asyncio
+import threading
+import time
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.asynchronous import call_function
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+
+
+async def _slow_double(value: float) -> float:
+    await asyncio.sleep(0.1)
+    return 2 * value
+
+
+def _slow_increment(value: float) -> float:
+    time.sleep(0.1)
+    return value + 1
+
+
+@pytest.mark.asynchronous
+def test_evaluate_async():
+    """Test the asynchronous evaluation of an expression.
+
+    This test checks that the coroutine functions and the sync callables are called
+    concurrently, and that the value is the same as the sync evaluation.
+    """
+    expr = (MathFunction(_slow_double, x) + MathFunction(_slow_increment, y)) + \
+        (MathFunction(np.sin, x) + 0) * 3 + x * y - 1
+    expected = 2 * 1.5 + (-2 + 1) + 3 * np.sin(1.5) + 1.5 * -2 - 1
+    start = time.perf_counter()
+    value = asyncio.run(expr.evaluate_async({"x": 1.5, "y": -2}))
+    assert time.perf_counter() - start < 0.19
+    assert value == pytest.approx(expected)
+    x.value, y.value = 1.5, -2
+    assert asyncio.run(expr.evaluate_async()) == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        asyncio.run(expr.evaluate_async({"x": 1.5}))
+
+
+@pytest.mark.asynchronous
+def test_evaluate_batch_async():
+    """Test the asynchronous evaluation of several points.
+
+    This test checks that the points are evaluated concurrently, and that the number
+    of functions running at the same time is limited by `max_concurrency`.
+    """
+    running = [0, 0]
+    lock = threading.Lock()
+
+    def tracked(value: float) -> float:
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return value ** 2
+
+    expr = MathFunction(tracked, x) + 2 * y
+    points = [{"x": float(i), "y": 1.0} for i in range(12)]
+    values = asyncio.run(expr.evaluate_batch_async(points, max_concurrency=3))
+    assert values == pytest.approx([i ** 2 + 2 for i in range(12)])
+    assert running[1] <= 3
+    start = time.perf_counter()
+    expr = MathFunction(_slow_double, x) + 0
+    values = asyncio.run(expr.evaluate_batch_async(points))
+    assert time.perf_counter() - start < 0.5
+    assert values == pytest.approx([2 * i for i in range(12)])
+
+
+@pytest.mark.asynchronous
+def test_call_function_awaitable_result():
+    """Test the call of a function that returns an awaitable.
+
+    This test checks that the awaitable returned by a sync callable is awaited.
+    """
+    def deferred(value: float):
+        return _slow_double(value)
+
+    assert asyncio.run(call_function(deferred, 4.0)) == 8.0
@@ -0,0 +1,116 @@
+"""
+Test the column sources module
+"""
+import array
+from types import MappingProxyType
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.columns import as_column, is_column_source, resolve_columns
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+
+
+class _Columns:
+    """Mapping-like object, that is not a Mapping"""
+
+    def __init__(self, columns: dict) -> None:
+        self.columns = columns
+
+    def keys(self):
+        """Get the names of the columns"""
+        return self.columns.keys()
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+
+def _expression():
+    return x * y + 2 * x + (MathFunction(np.sin, y) + 0) - 1
+
+
+def _expected(x_values, y_values):
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    return x_values * y_values + 2 * x_values + np.sin(y_values) - 1
+
+
+@pytest.mark.columns
+def test_resolve_columns_zero_copy():
+    """Test the columns resolved from the sources.
+
+    This test checks that the fields of a structured array and the buffers are
+    read in place, without copying their memory.
+    """
+    points = np.zeros(5, dtype=[("x", "f8"), ("y", "f8"), ("id", "i4")])
+    columns, size = resolve_columns(points, [x, y])
+    assert size == 5
+    assert np.shares_memory(columns[x], points)
+    buffer = array.array("d", [1.0, 2.0, 3.0])
+    column = as_column(memoryview(buffer))
+    buffer[0] = 7.0
+    assert column[0] == 7.0
+    assert as_column(3).shape == ()
+    assert is_column_source(points) and is_column_source(_Columns({}))
+    assert not is_column_source(np.zeros((2, 2))) and not is_column_source([1, 2])
+    with pytest.raises(ValueError):
+        resolve_columns({"x": [1, 2], "y": [1, 2, 3]}, [x, y])
+
+
+@pytest.mark.columns
+def test_evaluate_structured_array():
+    """Test the evaluation from a structured array.
+
+    This test checks that the expression is evaluated for each record, using the
+    fields named as the variables, and that a single record returns a number.
+    """
+    expr = _expression()
+    points = np.zeros(4, dtype=[("y", "f4"), ("x", "f8"), ("other", "i8")])
+    points["x"] = [1, 2, 3, 4]
+    points["y"] = [0.5, -1, 2, 3]
+    expected = _expected(points["x"], points["y"])
+    np.testing.assert_allclose(expr.evaluate(points), expected, rtol=1e-6)
+    np.testing.assert_allclose(expr.evaluate_batch(points), expected, rtol=1e-6)
+    assert expr.evaluate(points[1]) == pytest.approx(expected[1])
+    with pytest.raises(ValueError):
+        (x + 1).evaluate(np.zeros(2, dtype=[("z", "f8")]))
+
+
+@pytest.mark.columns
+def test_evaluate_column_buffers():
+    """Test the evaluation from mapping-like sources of buffers.
+
+    This test checks that the buffer-protocol columns, the mappings that are not a
+    dict and the mapping-like objects are accepted by `evaluate`.
+    """
+    expr = _expression()
+    expected = _expected([1, 2], [3, 4])
+    values = {"x": memoryview(array.array("d", [1, 2])), "y": array.array("d", [3, 4])}
+    np.testing.assert_allclose(expr.evaluate(values), expected)
+    np.testing.assert_allclose(expr.evaluate(_Columns(values)), expected)
+    np.testing.assert_allclose(expr.evaluate_batch(_Columns(values)), expected)
+    assert expr.evaluate(MappingProxyType({"x": 1.0, "y": 3.0})) == \
+        pytest.approx(expected[0])
+    assert expr.evaluate({"x": np.int64(1), "y": 3}) == pytest.approx(expected[0])
+    with pytest.raises(TypeError):
+        expr.evaluate([1, 3])
+
+
+@pytest.mark.columns
+def test_evaluate_dict_checks_only_its_variables():
+    """Test the choice between the scalar and the column evaluation of a dict.
+
+    This test checks that only the values of the variables of the expression decide
+    the path, so the other entries of a large dict (even non numeric) are ignored.
+    """
+    expr = x * y + 1
+    values = {f"other_{i}": np.zeros(3) for i in range(1000)}
+    values.update({"x": 2.0, "y": 3.0})
+    assert expr.evaluate(values) == 7.0
+    values.update({"x": np.array([2.0, 1.0]), "y": np.array([3.0, 4.0])})
+    np.testing.assert_allclose(expr.evaluate(values), [7.0, 5.0])
+    with pytest.raises(ValueError):
+        expr.evaluate({"x": 2.0})
@@ -0,0 +1,133 @@
+"""
+Test the Constraint module
+"""
+import pytest
+import numpy as np
+from scipy import optimize
+# Local imports
+from pymath_compute.model.constraint import Constraint, ConstraintMatrix
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+x = Variable("x", 0, 10)
+y = Variable("y", 0, 10)
+z = Variable("z", 0, 10)
+
+
+@pytest.mark.constraint
+def test_comparisons_build_constraints():
+    """Test the comparison operators of the Variables and the MathExpressions.
+
+    This test checks the sense and the bounds of each constraint.
+    """
+    constraint = 2 * x + y <= 10
+    assert isinstance(constraint, Constraint)
+    assert constraint.sense == "<="
+    assert (constraint.lower, constraint.upper) == (-np.inf, 10)
+    constraint = 3 <= x + 1
+    assert constraint.sense == ">="
+    assert (constraint.lower, constraint.upper) == (2, np.inf)
+    constraint = x == y - 4
+    assert constraint.sense == "=="
+    assert (constraint.lower, constraint.upper) == (-4, -4)
+    assert (x <= y).expression.terms == {x: 1, y: -1}
+
+
+@pytest.mark.constraint
+def test_constraint_truth_value():
+    """Test the truth value of the constraints.
+
+    This test checks that the identity comparisons keep working, and that the
+    inequalities can't be used as booleans.
+    """
+    assert x in [y, x]
+    assert x not in [y, z]
+    assert bool(x == x)
+    assert not x == y
+    assert x != y
+    assert not x == 1
+    assert x != "x"
+    assert len({x, y, x}) == 2
+    expr = x + y
+    assert expr in [expr]
+    with pytest.raises(TypeError):
+        bool(x <= y)
+    with pytest.raises(TypeError):
+        _ = x <= "x"  # type: ignore
+
+
+@pytest.mark.constraint
+def test_constraint_is_satisfied():
+    """Test the check of a constraint.
+
+    This test checks the constraints with the given values and with the values
+    stored in the variables.
+    """
+    constraint = x * y + MathFunction(np.exp, z) <= 5
+    assert constraint.is_satisfied({"x": 1, "y": 2, "z": 0})
+    assert not constraint.is_satisfied({"x": 3, "y": 2, "z": 0})
+    x.value = 3.0
+    assert (x == 3).is_satisfied()
+    assert (x >= 3).is_satisfied()
+    assert not (x >= 3.5).is_satisfied()
+
+
+@pytest.mark.constraint
+def test_constraint_matrix():
+    """Test the builder of the constraint matrix.
+
+    This test checks the matrix and the bounds built from a generator, and that
+    they can be used by scipy.
+    """
+    constraints = ConstraintMatrix.from_constraints(
+        c for c in [x + y <= 4, x - 2 * z == 1, 1 <= y + z, 2 * x <= 3 + z])
+    assert constraints.shape == (4, 3)
+    assert constraints.variables == [x, y, z]
+    np.testing.assert_allclose(constraints.matrix.toarray(),
+                               [[1, 1, 0], [1, 0, -2], [0, 1, 1], [2, 0, -1]])
+    np.testing.assert_allclose(constraints.lower, [-np.inf, 1, 1, -np.inf])
+    np.testing.assert_allclose(constraints.upper, [4, 1, np.inf, 3])
+    # Maximize x + y + z with the bounds of the variables
+    result = optimize.milp(-np.ones(3), constraints=constraints.to_scipy(),
+                           bounds=optimize.Bounds(0, 10))
+    assert result.success
+    assert result.fun == pytest.approx(-13 / 3)
+    coo = ConstraintMatrix.from_constraints([x <= 1], variables=[y, x], sparse_format="coo")
+    assert coo.matrix.format == "coo"
+    np.testing.assert_allclose(coo.matrix.toarray(), [[0, 1]])
+    with pytest.raises(ValueError):
+        ConstraintMatrix.from_constraints([x * y <= 1])
+    with pytest.raises(ValueError):
+        ConstraintMatrix.from_constraints([x <= 1], variables=[y])
+
+
+@pytest.mark.constraint
+def test_constraint_matrix_invalid_format():
+    """Test the builder of the constraint matrix with an invalid sparse format.
+
+    This test checks that any format other than "csr" and "coo" raises an error.
+    """
+    for sparse_format in ("csc", "csr ", "dense"):
+        with pytest.raises(ValueError):
+            ConstraintMatrix.from_constraints(
+                [x <= 1], sparse_format=sparse_format)  # type: ignore[arg-type]
+
+
+@pytest.mark.constraint
+def test_constraint_lazy_expression():
+    """Test the expression of the constraints built by a comparison.
+
+    This test checks that the identity comparisons don't build any expression, and
+    that the expression is built once, on its first use.
+    """
+    constraint = x + 1 == y
+    assert constraint._expression is None  # pylint: disable=W0212
+    assert not constraint
+    assert constraint._expression is None  # pylint: disable=W0212
+    expression = constraint.expression
+    assert expression is constraint.expression
+    assert expression.terms == {x: 1, y: -1, "const": 1}
+    assert constraint.upper == -1
+    assert (x + 1 <= y).is_satisfied({"x": 1, "y": 2})
+    with pytest.raises(ValueError):
+        Constraint(None, "==")
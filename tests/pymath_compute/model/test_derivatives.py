@@ -0,0 +1,204 @@
+"""
+Test the derivatives of the expressions
+"""
+import math
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.derivatives import NumericDerivative, differentiate, \
+    function_derivative, negative_sin, register_derivative
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+from pymath_compute.model.monomial import Monomial
+
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+z = Variable("z", -10, 10)
+expr_to_test = x ** 2 * y * z ** 3 + 3 * x * y + MathFunction(np.sin, z) + 2 * x + 7
+point = {"x": 1.5, "y": -2.0, "z": 0.7}
+
+
+@pytest.mark.derivatives
+def test_differentiate_polynomial_terms():
+    """Test the symbolic derivative of the polynomial terms.
+
+    This test checks the exponents and the coefficients of the derivative.
+    """
+    terms = differentiate((x ** 2 * y + 3 * x + 5).terms, x)
+    assert terms == {Monomial.from_powers({x: 1, y: 1}): 2, "const": 3}
+    assert not differentiate((y + 5).terms, x)
+
+
+@pytest.mark.derivatives
+def test_numeric_derivative():
+    """Test the finite difference derivative.
+
+    This test checks the result with scalars and arrays.
+    """
+    derivative = NumericDerivative(np.sin)
+    assert derivative(0.5) == pytest.approx(np.cos(0.5))
+    values = np.array([0.0, 1.0, 100.0])
+    assert np.allclose(derivative(values), np.cos(values), atol=1e-6)
+    assert derivative.__name__ == "d_sin"
+
+
+@pytest.mark.derivatives
+def test_gradient_expressions():
+    """Test the gradient of an expression.
+
+    This test checks that there's one derivative expression per variable.
+    """
+    gradient = expr_to_test.gradient()
+    assert list(gradient) == [x, y, z]
+    assert gradient[y].evaluate(point) == pytest.approx(1.5 ** 2 * 0.7 ** 3 + 4.5)
+    assert gradient[z].evaluate(point) == pytest.approx(
+        3 * 1.5 ** 2 * -2.0 * 0.7 ** 2 + np.cos(0.7))
+
+
+@pytest.mark.derivatives
+def test_compiled_gradient():
+    """Test the compiled gradient.
+
+    This test checks that the compiled gradient matches the derivative
+    expressions, and that it is cached on the expression.
+    """
+    grad = expr_to_test.compile_gradient()
+    expected = [derivative.evaluate(point) for derivative in expr_to_test.gradient().values()]
+    assert np.allclose(grad([1.5, -2.0, 0.7]), expected)
+    assert np.allclose(expr_to_test.grad(np.array([1.5, -2.0, 0.7])), expected)
+    assert expr_to_test.compile_gradient() is grad
+
+
+@pytest.mark.derivatives
+def test_compiled_gradient_with_order():
+    """Test the compiled gradient with a custom order of variables.
+
+    This test checks that the partial derivatives are written in the slot of
+    each variable, and that the unused variables have a zero derivative.
+    """
+    w = Variable("w", 0, 1)
+    grad = (x * y + 2 * x).compile_gradient([y, w, x])
+    assert grad([2.0, 0.5, 1.0]).tolist() == [1.0, 0.0, 4.0]
+
+
+@pytest.mark.derivatives
+def test_hessian_pattern():
+    """Test the sparsity pattern of the Hessian.
+
+    This test checks that only the pairs of variables that share a term
+    are part of the pattern, and that the pattern is symmetric.
+    """
+    w = Variable("w", -10, 10)
+    hessian = (x * y + z ** 2 + w).hessian()
+    assert hessian.variables == [x, y, z, w]
+    assert hessian.pattern.toarray().tolist() == [
+        [0, 1, 0, 0],
+        [1, 0, 0, 0],
+        [0, 0, 1, 0],
+        [0, 0, 0, 0],
+    ]
+    assert hessian.nnz == 3
+    assert expr_to_test.hessian() is expr_to_test.hessian()
+
+
+@pytest.mark.derivatives
+def test_hessian_values():
+    """Test the evaluation of the Hessian.
+
+    This test checks the second derivatives of the polynomial and the
+    MathFunction terms, and that only the data array changes between points.
+    """
+    hessian = expr_to_test.hessian()
+    values = [1.5, -2.0, 0.7]
+    expected = np.array([
+        [2 * -2.0 * 0.7 ** 3, 2 * 1.5 * 0.7 ** 3 + 3, 6 * 1.5 * -2.0 * 0.7 ** 2],
+        [2 * 1.5 * 0.7 ** 3 + 3, 0, 3 * 1.5 ** 2 * 0.7 ** 2],
+        [6 * 1.5 * -2.0 * 0.7 ** 2, 3 * 1.5 ** 2 * 0.7 ** 2,
+         6 * 1.5 ** 2 * -2.0 * 0.7 - np.sin(0.7)],
+    ])
+    assert np.allclose(hessian(values).toarray(), expected, atol=1e-6)
+    data = hessian.data([1.0, 1.0, 1.0])
+    assert data.shape == (hessian.nnz,)
+    assert np.array_equal(hessian([1.0, 1.0, 1.0]).indices, hessian.indices)
+
+
+@pytest.mark.derivatives
+def test_registered_derivatives():
+    """Test the derivatives of the registered NumPy ufuncs.
+
+    This test checks that the MathFunction terms use the exact derivative,
+    also for the second derivatives of the Hessian.
+    """
+    assert function_derivative(np.sin) is np.cos
+    assert function_derivative(np.exp, order=2) is np.exp
+    derivative = (MathFunction(np.cos, x) + MathFunction(np.log, y)).derivative(x)
+    term = next(iter(derivative.terms))
+    assert term.function is negative_sin
+    hessian = (MathFunction(np.sin, x) + MathFunction(np.log, y)).hessian()
+    assert np.array_equal(hessian([0.3, 2.0]).toarray(),
+                          np.diag([-np.sin(0.3), -1 / 4.0]))
+
+
+@pytest.mark.derivatives
+@pytest.mark.parametrize("function, second_derivative", [
+    (np.tan, lambda v: 2 * np.tan(v) / np.cos(v) ** 2),
+    (np.reciprocal, lambda v: 2 / v ** 3),
+    (np.log, lambda v: -1 / v ** 2),
+    (np.log2, lambda v: -1 / (v ** 2 * np.log(2))),
+    (np.log10, lambda v: -1 / (v ** 2 * np.log(10))),
+    (np.log1p, lambda v: -1 / (1 + v) ** 2),
+    (np.sqrt, lambda v: -1 / (4 * v ** 1.5)),
+    (np.tanh, lambda v: -2 * np.tanh(v) / np.cosh(v) ** 2),
+    (np.arctan, lambda v: -2 * v / (1 + v ** 2) ** 2),
+    (np.arcsin, lambda v: v / (1 - v ** 2) ** 1.5),
+    (np.arccos, lambda v: -v / (1 - v ** 2) ** 1.5),
+    (np.square, lambda v: 2.0),
+    (np.abs, lambda v: 0.0),
+    (math.tan, lambda v: 2 * np.tan(v) / np.cos(v) ** 2),
+    (math.log2, lambda v: -1 / (v ** 2 * np.log(2))),
+    (math.log10, lambda v: -1 / (v ** 2 * np.log(10))),
+    (math.log1p, lambda v: -1 / (1 + v) ** 2),
+    (math.sqrt, lambda v: -1 / (4 * v ** 1.5)),
+    (math.tanh, lambda v: -2 * np.tanh(v) / np.cosh(v) ** 2),
+    (math.atan, lambda v: -2 * v / (1 + v ** 2) ** 2),
+    (math.asin, lambda v: v / (1 - v ** 2) ** 1.5),
+    (math.acos, lambda v: -v / (1 - v ** 2) ** 1.5),
+    (abs, lambda v: 0.0),
+])
+def test_registered_second_derivatives(function, second_derivative):
+    """Test the second derivatives of the registered functions.
+
+    This test checks that the second derivative is exact instead of a finite
+    difference, and that the Hessian matches the analytic value.
+    """
+    assert not isinstance(function_derivative(function, order=2), NumericDerivative)
+    u = Variable("u", -1, 1)
+    hessian = (MathFunction(function, u) + 0).hessian()
+    for value in (0.3, 0.6):
+        assert hessian([value]).toarray()[0, 0] == \
+            pytest.approx(second_derivative(value), rel=1e-12, abs=1e-12)
+    values = np.array([0.3, 0.6])
+    np.testing.assert_allclose(function_derivative(function, order=2)(values),
+                               np.broadcast_to(second_derivative(values), (2,)), rtol=1e-12)
+
+
+@pytest.mark.derivatives
+def test_register_custom_derivative():
+    """Test the registration of the derivative of a custom function.
+
+    This test checks that the registered derivative is used by the
+    compiled gradient instead of the finite differences.
+    """
+    def cube(value):
+        return value ** 3
+
+    def cube_derivative(value):
+        return 3 * value ** 2
+
+    assert isinstance(function_derivative(cube), NumericDerivative)
+    register_derivative(cube, cube_derivative)
+    assert function_derivative(cube) is cube_derivative
+    grad = (MathFunction(cube, x) + 1).compile_gradient()
+    assert grad([2.0]).tolist() == [12.0]
+    with pytest.raises(TypeError):
+        register_derivative(cube, 3)  # type: ignore
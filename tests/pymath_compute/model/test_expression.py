@@ -1,11 +1,14 @@
 """
 Test the MathExpression module
 """
+import math
 import pytest
+import numpy as np
 # Local imports
 from pymath_compute.model.expression import MathExpression
 from pymath_compute.model.variable import Variable
 from pymath_compute.model.function import MathFunction
+from pymath_compute.model.monomial import Monomial, term_degree
 
 # Create the dummy expression
 x = Variable("x", 0, 10)
@@ -303,3 +306,266 @@ def test_pow_method_invalid_value():
     expr = expr_to_test
     with pytest.raises(ValueError):
         _ = expr ** -2  # type: ignore
+
+
+@pytest.mark.expression
+def test_compile_expression():
+    """Test the compile method.
+
+    This test checks that the compiled evaluator returns the same values
+    as the evaluate method, using the order of the expression variables.
+    """
+    expr = x * y + 2 * x + MathFunction(abs, y) - 3
+    evaluator = expr.compile()
+    assert evaluator.variables == [x, y]
+    assert evaluator([2, -4]) == expr.evaluate({"x": 2, "y": -4})
+    assert evaluator.evaluate({"x": 2, "y": -4}) == evaluator([2, -4])
+
+
+@pytest.mark.expression
+def test_compile_with_variables_order():
+    """Test the compile method with a custom order of variables.
+
+    This test checks that the evaluator reads each variable from the
+    slot given by the order, even if that order has unused variables.
+    """
+    z = Variable("z", -10, 10)
+    evaluator = (x + 2 * y).compile([z, y, x])
+    assert evaluator([100, 1, 3]) == 5
+
+
+@pytest.mark.expression
+def test_compile_is_cached():
+    """Test that the compiled evaluator is cached.
+
+    This test checks that the evaluator is reused between calls and
+    that it is discarded when the terms of the expression change.
+    """
+    expr = x + y
+    evaluator = expr.compile()
+    assert expr.compile() is evaluator
+    expr.terms = {x: 3}
+    assert expr.compile() is not evaluator
+    assert expr.compile()([2]) == 6
+
+
+@pytest.mark.expression
+def test_compile_invalid_vector():
+    """Test the compiled evaluator with a vector of a wrong size.
+
+    This test checks that the evaluator validates the length of the vector.
+    """
+    evaluator = (x + y).compile()
+    with pytest.raises(ValueError):
+        evaluator([1, 2, 3])
+
+
+@pytest.mark.expression
+def test_evaluate_batch_mapping():
+    """Test the evaluate_batch method with a mapping of arrays.
+
+    This test checks that the batch evaluation returns the same values
+    as evaluating each point on its own.
+    """
+    expr = x * y + 2 * x + MathFunction(np.sin, y) + 1
+    x_values = np.array([0.0, 1.5, 3.0])
+    y_values = np.array([-1.0, 0.5, 2.0])
+    result = expr.evaluate_batch({"x": x_values, "y": y_values})
+    expected = [expr.evaluate({"x": a, "y": b}) for a, b in zip(x_values, y_values)]
+    assert np.allclose(result, expected)
+
+
+@pytest.mark.expression
+def test_evaluate_batch_array():
+    """Test the evaluate_batch method with a 2-D array.
+
+    This test checks that each column is read as the given variable and that
+    callables that only accept scalars are applied element-wise.
+    """
+    expr = MathFunction(math.sqrt, x) + 3 * y
+    points = np.array([[1.0, 4.0], [4.0, 1.0]])
+    result = expr.evaluate_batch(points[:, ::-1], variables=[y, x])
+    assert np.allclose(result, [13.0, 5.0])
+
+
+@pytest.mark.expression
+def test_evaluate_batch_missing_variable():
+    """Test the evaluate_batch method with a missing variable.
+
+    This test checks that a missing variable raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        (x + y).evaluate_batch({"x": np.array([1.0])})
+
+
+@pytest.mark.expression
+def test_iadd_method():
+    """Test the __iadd__ method.
+
+    This test checks that the terms are accumulated in the same expression
+    and that the compiled evaluator is discarded.
+    """
+    expr = x + 1
+    evaluator = expr.compile()
+    same_expr = expr
+    expr += y
+    expr += x
+    expr += 2
+    assert expr is same_expr
+    assert expr.terms == {x: 2, y: 1, "const": 3}
+    assert expr.compile() is not evaluator
+    with pytest.raises(ValueError):
+        expr += "invalid"  # type: ignore
+
+
+@pytest.mark.expression
+def test_isub_method():
+    """Test the __isub__ method.
+
+    This test checks that the subtracted terms are removed when they cancel.
+    """
+    expr = x + y
+    expr -= x
+    assert expr.terms == {y: 1}
+    with pytest.raises(ValueError):
+        expr -= "invalid"  # type: ignore
+
+
+@pytest.mark.expression
+def test_imul_method():
+    """Test the __imul__ method.
+
+    This test checks the in place product with constants and expressions.
+    """
+    expr = x + 1
+    same_expr = expr
+    expr *= 2
+    assert expr is same_expr
+    assert expr.terms == {x: 2, "const": 2}
+    expr *= y
+    assert expr is same_expr
+    assert expr.evaluate({"x": 1, "y": 3}) == 12
+
+
+@pytest.mark.expression
+def test_pow_by_squaring():
+    """Test the __pow__ method with several exponents.
+
+    This test checks that the exponentiation by squaring merges the like terms and
+    returns the same values as the repeated products, without modifying the base.
+    """
+    x = Variable("x", -10, 10)
+    y = Variable("y", -10, 10)
+    base = x + 2 * y + 1
+    expected = MathExpression({"const": 1})
+    for exponent in range(1, 8):
+        expected = expected * base
+        result = base ** exponent
+        assert result is not base
+        assert result.terms == pytest.approx(expected.terms)
+        assert result.evaluate({"x": 0.5, "y": -1.5}) == pytest.approx((0.5 - 3 + 1) ** exponent)
+    # The binomial expansion of degree 7 has 36 merged terms
+    assert len((base ** 7).terms) == 36
+    assert (base ** 0).terms == {"const": 1}
+    assert base.evaluate({"x": 1, "y": 1}) == 4
+
+
+@pytest.mark.expression
+def test_power_cache():
+    """Test the cache of powers of an expression.
+
+    This test checks that the cached powers are reused, that the returned expressions
+    are copies and that the cache is discarded when the terms change.
+    """
+    x = Variable("x", -10, 10)
+    y = Variable("y", -10, 10)
+    base = x + y
+    fourth = base.power(4, cache=True)
+    square = base._powers[2]  # pylint: disable=W0212
+    fourth += 1
+    assert base.power(4, cache=True).terms == (base ** 4).terms
+    # The eighth power squares the cached fourth power
+    eighth = base.power(8, cache=True)
+    assert base._powers[2] is square  # pylint: disable=W0212
+    assert eighth.evaluate({"x": 1, "y": 1}) == 256
+    base += 1
+    assert not base._powers  # pylint: disable=W0212
+    assert base.power(2, cache=True).evaluate({"x": 1, "y": 1}) == 9
+
+
+@pytest.mark.expression
+def test_truncated_multiplication():
+    """Test the multiplication with a maximum degree and a tolerance.
+
+    This test checks that the truncated product keeps only the low degree terms
+    with a large enough coefficient, and that it matches the full product on them.
+    """
+    x = Variable("x", -1, 1)
+    y = Variable("y", -1, 1)
+    base = 1 + x + 0.001 * y
+    full = base * base * base
+    series = MathExpression({"const": 1})
+    for _ in range(3):
+        series = series.multiply(base, max_degree=2)
+    assert max(term_degree(term) for term in series.terms) == 2
+    for term, coef in series.terms.items():
+        assert coef == pytest.approx(full.terms[term])
+    # The repeated products keep a fixed size
+    for _ in range(20):
+        series = series.multiply(1 + x, max_degree=2)
+    assert len(series.terms) == 6
+    # The tolerance removes the small coefficients
+    pruned = base.multiply(base, drop_below=1e-4)
+    assert set(pruned.terms) == {"const", x, Monomial.from_powers({x: 2}), y,
+                                 Monomial.from_powers({x: 1, y: 1})}
+    assert base.multiply(2).terms == (base * 2).terms
+    with pytest.raises(ValueError):
+        base.multiply("invalid")  # type: ignore
+
+
+@pytest.mark.expression
+def test_function_products_not_supported():
+    """Test the products of MathFunction terms with other terms.
+
+    This test checks that the products of a MathFunction term with a non constant
+    term raise an error, since the product terms only hold Variables, and that the
+    products with constants are still supported.
+    """
+    sin_x = MathFunction(np.sin, x) + 0
+    with pytest.raises(ValueError):
+        _ = sin_x * (y + 1)
+    with pytest.raises(ValueError):
+        _ = (y + 1) * sin_x
+    with pytest.raises(ValueError):
+        sin_x.multiply(y + 1)
+    with pytest.raises(ValueError):
+        _ = sin_x ** 2
+    # The MathFunction objects are not added to the other operand either
+    sin = MathFunction(np.sin, x)
+    for left, right in ((x, sin), (sin, x), (x + 1, sin), (sin, x + 1)):
+        with pytest.raises(ValueError):
+            _ = left * right
+    assert (MathExpression({"const": 2}) * sin).evaluate({"x": 1.0}) == \
+        pytest.approx(2 * np.sin(1.0))
+    assert (sin_x * 3).evaluate({"x": 1.0}) == pytest.approx(3 * np.sin(1.0))
+    assert (sin_x * MathExpression({"const": 2}) + 1).evaluate({"x": 1.0}) == \
+        pytest.approx(2 * np.sin(1.0) + 1)
+
+
+@pytest.mark.expression
+def test_evaluate_current_values():
+    """Test the evaluation with the values stored in the variables.
+
+    This test checks that `evaluate()` without values reads the current value of
+    each variable, also after the values change.
+    """
+    x = Variable("x", -10, 10)
+    y = Variable("y", -10, 10)
+    block = Variable.array("b", 2, -10, 10)
+    expr = x * y + 2 * x + MathFunction(math.exp, y) + block[1] - 1
+    x.value, y.value = 1.0, 0.0
+    block.values = [0.0, 3.0]
+    assert expr.evaluate() == pytest.approx(expr.evaluate({"x": 1, "y": 0, "b[1]": 3}))
+    y.value = 2.0
+    assert expr.evaluate() == pytest.approx(2 + 2 + math.exp(2) + 3 - 1)
+    assert MathExpression({"const": 4}).evaluate() == 4
@@ -0,0 +1,79 @@
+"""
+Test the ExpressionSet module
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.expression_set import ExpressionSet
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+z = Variable("z", -10, 10)
+
+
+def _expressions() -> list[MathExpression]:
+    return [
+        x * y + 1,
+        2 * x * y - x + MathFunction(np.sin, z),
+        x * y + y ** 2 + (MathFunction(np.sin, z) + 0) * 3,
+        MathExpression({"const": 5}),
+    ]
+
+
+@pytest.mark.expression_set
+def test_expression_set_shares_terms():
+    """Test that the terms are shared between the expressions.
+
+    This test checks the unique terms and the sparse matrix of coefficients.
+    """
+    expressions = ExpressionSet(_expressions())
+    assert len(expressions) == 4
+    # x*y, x, sin(z) and y**2
+    assert len(expressions.terms) == 4
+    assert expressions.coefficients.shape == (4, 4)
+    assert expressions.coefficients.nnz == 7
+    np.testing.assert_allclose(expressions.constants, [1, 0, 0, 5])
+    assert expressions.variables == [x, y, z]
+
+
+@pytest.mark.expression_set
+def test_expression_set_evaluate():
+    """Test the evaluation of the set at a single point.
+
+    This test checks that each output matches the evaluation of its expression,
+    with a dict, a vector and the values of the variables.
+    """
+    members = _expressions()
+    expressions = ExpressionSet(members)
+    values = {"x": 1.5, "y": -2.0, "z": 0.5}
+    expected = [expr.evaluate(values) for expr in members]
+    np.testing.assert_allclose(expressions.evaluate(values), expected)
+    np.testing.assert_allclose(expressions.evaluate(np.array([1.5, -2.0, 0.5])), expected)
+    x.value, y.value, z.value = 1.5, -2.0, 0.5
+    np.testing.assert_allclose(expressions.evaluate(), expected)
+    with pytest.raises(ValueError):
+        expressions.evaluate({"x": 1.0})
+    with pytest.raises(ValueError):
+        expressions.evaluate([1.0, 2.0])
+
+
+@pytest.mark.expression_set
+def test_expression_set_evaluate_batch():
+    """Test the evaluation of the set over several points.
+
+    This test checks that each row matches the evaluation at that point.
+    """
+    members = _expressions()
+    expressions = ExpressionSet(members)
+    points = np.random.default_rng(0).uniform(-2, 2, size=(10, 3))
+    result = expressions.evaluate_batch(points)
+    assert result.shape == (10, 4)
+    for point, row in zip(points, result):
+        np.testing.assert_allclose(row, expressions.evaluate(point))
+    with pytest.raises(ValueError):
+        expressions.evaluate_batch(points[:, :2])
+    with pytest.raises(TypeError):
+        ExpressionSet([x])  # type: ignore
@@ -0,0 +1,71 @@
+"""
+Test the linear and quadratic forms
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.forms import QuadraticForm
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+z = Variable("z", -10, 10)
+
+
+@pytest.mark.forms
+def test_to_linear():
+    """Test the linear form of an expression.
+
+    This test checks the row of coefficients and the constant, also with a
+    custom order of the variables.
+    """
+    row, constant = (2 * x - y + 3).to_linear()
+    assert row.shape == (1, 2)
+    np.testing.assert_allclose(row.toarray(), [[2, -1]])
+    assert constant == 3
+    row, _ = (2 * x - y + 3).to_linear([z, y, x])
+    np.testing.assert_allclose(row.toarray(), [[0, -1, 2]])
+    with pytest.raises(ValueError):
+        (x * y).to_linear()
+    with pytest.raises(ValueError):
+        (2 * x).to_linear([y])
+
+
+@pytest.mark.forms
+def test_to_quadratic():
+    """Test the quadratic form of an expression.
+
+    This test checks that the matrix is symmetric and that the form returns the
+    same value as the expression.
+    """
+    expr = x ** 2 + 3 * x * y - 2 * z * z + y - z + 1
+    matrix, linear, constant = expr.to_quadratic()
+    np.testing.assert_allclose(matrix.toarray(), [[1, 1.5, 0], [1.5, 0, 0], [0, 0, -2]])
+    np.testing.assert_allclose(linear, [0, 1, -1])
+    assert constant == 1
+    point = np.array([1.5, -2.0, 0.5])
+    assert point @ matrix @ point + linear @ point + constant == pytest.approx(
+        expr.evaluate({"x": 1.5, "y": -2.0, "z": 0.5}))
+    with pytest.raises(ValueError):
+        (x * y * z).to_quadratic()
+    with pytest.raises(ValueError):
+        (MathFunction(np.sin, x) + 1).to_quadratic()
+
+
+@pytest.mark.forms
+def test_quadratic_form_evaluator():
+    """Test the evaluator of the quadratic form.
+
+    This test checks the single point, batch and gradient evaluation against
+    the expression.
+    """
+    expr = x ** 2 + 3 * x * y - 2 * z * z + y - z + 1
+    form = QuadraticForm.from_expression(expr)
+    points = np.random.default_rng(0).uniform(-2, 2, size=(5, 3))
+    expected = [expr.evaluate(dict(zip("xyz", point))) for point in points]
+    np.testing.assert_allclose([form(point) for point in points], expected)
+    np.testing.assert_allclose(form.evaluate_batch(points), expected)
+    np.testing.assert_allclose(form.gradient(points[0]), expr.grad(points[0]))
+    with pytest.raises(ValueError):
+        form([1.0, 2.0])
@@ -0,0 +1,83 @@
+"""
+Test the incremental evaluator
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.incremental import IncrementalEvaluator
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+
+def _variables() -> tuple[Variable, Variable, Variable]:
+    x = Variable("x", -10, 10)
+    y = Variable("y", -10, 10)
+    z = Variable("z", -10, 10)
+    x.value, y.value, z.value = 1.0, 2.0, 3.0
+    return x, y, z
+
+
+@pytest.mark.incremental
+def test_incremental_delta_and_commit():
+    """Test the delta and the commit of a move.
+
+    This test checks that the delta matches the full evaluation and that the
+    commit updates the value of the expression and of the variable.
+    """
+    x, y, z = _variables()
+    expr = x * y + 2 * x + y ** 2 * z + MathFunction(np.sin, z) + 5
+    evaluator = IncrementalEvaluator(expr)
+    values = {"x": 1.0, "y": 2.0, "z": 3.0}
+    assert evaluator.value == pytest.approx(expr.evaluate(values))
+    change = evaluator.delta(y, -1.5)
+    assert change == pytest.approx(expr.evaluate({**values, "y": -1.5}) - expr.evaluate(values))
+    # The delta doesn't change anything until it is committed
+    assert y.value == 2.0
+    assert evaluator.commit() == pytest.approx(expr.evaluate({**values, "y": -1.5}))
+    assert y.value == -1.5
+    evaluator.delta(z, 0.5)
+    evaluator.commit()
+    assert evaluator.value == pytest.approx(expr.evaluate({"x": 1.0, "y": -1.5, "z": 0.5}))
+
+
+@pytest.mark.incremental
+def test_incremental_only_evaluates_the_moved_terms():
+    """Test that the delta only evaluates the terms of the moved variable.
+
+    This test checks the index between the variables and the terms.
+    """
+    x, y, z = _variables()
+    calls = []
+
+    def tracked(value):
+        calls.append(value)
+        return value
+
+    evaluator = IncrementalEvaluator(x * y + MathFunction(tracked, z))
+    calls.clear()
+    evaluator.delta(x, 4.0)
+    assert not calls
+    evaluator.delta(z, 4.0)
+    assert calls == [4.0]
+
+
+@pytest.mark.incremental
+def test_incremental_refresh_and_errors():
+    """Test the refresh of the evaluator and the invalid moves.
+
+    This test checks that the values set directly in the variables are read by
+    `refresh`, and the errors of the commit.
+    """
+    x, y, _ = _variables()
+    evaluator = IncrementalEvaluator(x * y + 1)
+    x.value = 3.0
+    assert evaluator.value == 3.0
+    assert evaluator.refresh() == 7.0
+    with pytest.raises(ValueError):
+        evaluator.commit()
+    evaluator.delta(x, 20.0)
+    with pytest.raises(ValueError):
+        evaluator.commit()
+    assert evaluator.value == 7.0
+    with pytest.raises(TypeError):
+        IncrementalEvaluator(x)  # type: ignore
@@ -0,0 +1,148 @@
+"""
+Test the lazy expression module
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.lazy import LazyExpression, lazy
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+
+
+@pytest.mark.lazy
+def test_lazy_nodes_are_interned():
+    """Test that the lazy nodes are hash-consed.
+
+    This test checks that the same operation over the same nodes always returns
+    the same node, whatever the order of the operands.
+    """
+    shared = lazy(x) + y
+    assert isinstance(shared, LazyExpression)
+    assert lazy(y) + x is shared
+    assert shared * 2 is 2 * shared
+    assert lazy(x) ** 2 is lazy(x) ** 2
+    # The shared sub-expression appears only once in the DAG
+    expr = shared ** 2 * (shared + 1)
+    assert sum(node is shared for node in expr.nodes()) == 1
+    assert expr.variables == [x, y]
+
+
+@pytest.mark.lazy
+def test_lazy_constant_folding():
+    """Test the constant folding of the lazy nodes.
+
+    This test checks that the operations with neutral constants return the same node.
+    """
+    node = lazy(x)
+    assert node + 0 is node
+    assert node * 1 is node
+    assert node ** 1 is node
+    assert (node * 0).value == 0
+    assert (node ** 0).value == 1
+    assert (lazy(-2) ** 2).value == 4
+
+
+@pytest.mark.lazy
+def test_lazy_evaluate_and_compile():
+    """Test the evaluation of a lazy expression.
+
+    This test checks that the compiled DAG computes each shared node once and
+    that it returns the same value as the expanded expression.
+    """
+    shared = lazy(x) + y
+    expr = shared ** 2 * (shared + 1) - 3 * lazy(MathFunction(np.sin, x)) + lazy(x * y)
+    expected = 9 * 4 - 3 * np.sin(1) + 2
+    assert expr.evaluate({"x": 1, "y": 2}) == pytest.approx(expected)
+    assert expr.compile().source.count("v0 + v1") == 1
+    assert expr.compile() is expr.compile()
+    assert expr.compile([y, x])([2, 1]) == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        expr.evaluate({"x": 1})
+    x.value, y.value = 1.0, 2.0
+    assert expr.evaluate() == pytest.approx(expected)
+
+
+@pytest.mark.lazy
+def test_lazy_expand():
+    """Test the expansion of a lazy expression.
+
+    This test checks that the expanded MathExpression has the merged terms.
+    """
+    expr = (lazy(x) + y) ** 2 - y * y
+    expanded = expr.expand()
+    assert isinstance(expanded, MathExpression)
+    assert expanded.evaluate({"x": 3, "y": 2}) == pytest.approx(9 + 12)
+    assert len(expanded.terms) == 2
+    assert ((lazy(x) + 1) ** 3).expand().evaluate({"x": 2}) == 27
+
+
+@pytest.mark.lazy
+def test_lazy_deep_chain():
+    """Test a long chain of lazy operations.
+
+    This test checks that the traversal of the DAG doesn't reach the recursion limit.
+    """
+    expr = lazy(0)
+    for i in range(5000):
+        expr = expr + x * i
+    assert expr.evaluate({"x": 1.0}) == pytest.approx(sum(range(5000)))
+
+
+@pytest.mark.lazy
+def test_lazy_reflected_operands():
+    """Test the operations with the lazy node on the right.
+
+    This test checks that the eager Variables, MathFunctions and MathExpressions
+    leave the operation to the lazy node, so both operand orders return lazy nodes.
+    """
+    values = {"x": 2.0, "y": 3.0}
+    cases = [
+        (x + lazy(y), lazy(x) + y, 5.0),
+        (x * lazy(y), lazy(x) * y, 6.0),
+        (x - lazy(y), lazy(x) - y, -1.0),
+        ((x + 1) + lazy(y), lazy(y) + (x + 1), 6.0),
+        ((x + 1) * lazy(y), lazy(y) * (x + 1), 9.0),
+        ((x + 1) - lazy(y), -(lazy(y) - (x + 1)), 0.0),
+        (MathFunction(np.sin, x) + lazy(y), lazy(y) + MathFunction(np.sin, x),
+         np.sin(2.0) + 3.0),
+    ]
+    for left, right, expected in cases:
+        assert isinstance(left, LazyExpression)
+        assert isinstance(right, LazyExpression)
+        assert left.evaluate(values) == pytest.approx(expected)
+        assert right.evaluate(values) == pytest.approx(expected)
+    expr = x + 1
+    expr += lazy(y)
+    assert isinstance(expr, LazyExpression)
+    assert expr.evaluate(values) == pytest.approx(6.0)
+
+
+@pytest.mark.lazy
+def test_lazy_long_expression():
+    """Test a lazy node of an eager expression with thousands of terms.
+
+    This test checks that the terms are compiled one per line, without reaching the
+    recursion limit of the Python compiler.
+    """
+    u = Variable.array("u", 6000, -10, 10)
+    expr = MathExpression({u[i]: 1 for i in range(u.size)}) + 1
+    values = {u[i].name: 1.0 for i in range(u.size)}
+    assert (lazy(expr) * 2).evaluate(values) == pytest.approx(2 * (u.size + 1))
+
+
+@pytest.mark.lazy
+def test_lazy_invalid_params():
+    """Test the lazy nodes with invalid params.
+
+    This test checks the errors for the unsupported values and powers.
+    """
+    with pytest.raises(ValueError):
+        lazy("x")
+    with pytest.raises(ValueError):
+        lazy(x) ** -1
+    with pytest.raises(ValueError):
+        lazy(x) ** 1.5  # type: ignore
@@ -0,0 +1,104 @@
+"""
+Test the Monomial module
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.monomial import Monomial, make_term, multiply_terms
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+z = Variable("z", -10, 10)
+
+
+@pytest.mark.monomial
+def test_monomial_is_interned():
+    """Test that the monomials are hash-consed.
+
+    This test checks that the same powers always return the same object,
+    whatever the order of the variables.
+    """
+    monomial = Monomial.from_powers({x: 1, y: 2})
+    assert Monomial.from_powers({y: 2, x: 1}) is monomial
+    assert monomial.variables == (x, y)
+    assert monomial.exponents == (1, 2)
+    assert monomial.degree == 3
+    assert repr(monomial) == "x*y**2"
+
+
+@pytest.mark.monomial
+def test_make_term():
+    """Test the canonical terms.
+
+    This test checks that the products without variables are the constant,
+    and that a single variable with exponent 1 is the variable itself.
+    """
+    assert make_term({}) == "const"
+    assert make_term({x: 1}) is x
+    assert make_term({x: 0, y: 1}) is y
+    assert isinstance(make_term({x: 2}), Monomial)
+
+
+@pytest.mark.monomial
+def test_multiply_terms():
+    """Test the product of two terms.
+
+    This test checks that the exponents of the same variable are added.
+    """
+    assert multiply_terms("const", x) is x
+    assert multiply_terms(x, y) is multiply_terms(y, x)
+    assert multiply_terms(multiply_terms(x, y), x) is Monomial.from_powers({x: 2, y: 1})
+
+
+@pytest.mark.monomial
+def test_like_terms_are_merged():
+    """Test that the like terms of an expression are merged.
+
+    This test checks that x*y and y*x, or x*x*y and x*y*x, are one term.
+    """
+    expr = x * y + y * x
+    assert len(expr.terms) == 1
+    assert expr.terms[Monomial.from_powers({x: 1, y: 1})] == 2
+    expr = (x * x) * y + (x * y) * x
+    assert len(expr.terms) == 1
+    assert expr.evaluate({"x": 2, "y": 3}) == 24
+
+
+@pytest.mark.monomial
+def test_expression_product_is_expanded():
+    """Test the product of two expressions.
+
+    This test checks that the product is expanded into canonical terms,
+    including the products with the constants.
+    """
+    expr = (x + y + 1) * (x - y + 2)
+    # x**2 - y**2 + 3x + y + 2
+    assert len(expr.terms) == 5
+    assert expr.evaluate({"x": 2, "y": 3}) == (2 + 3 + 1) * (2 - 3 + 2)
+    assert ((x + 1) * (x - 1)).evaluate({"x": 3}) == 8
+
+
+@pytest.mark.monomial
+def test_tuple_terms_are_canonical():
+    """Test that the product tuples given to a MathExpression are converted.
+
+    This test checks that the nested tuples are flattened into one monomial.
+    """
+    expr = MathExpression({((x, y), z): 2, (z, y, x): 1, ("const", x): 3})
+    assert len(expr.terms) == 2
+    assert expr.terms[Monomial.from_powers({x: 1, y: 1, z: 1})] == 3
+    assert expr.terms[x] == 3
+
+
+@pytest.mark.monomial
+def test_product_with_function_not_supported():
+    """Test the product of a MathFunction with other terms.
+
+    This test checks that the unsupported products raise a ValueError.
+    """
+    expr = MathFunction(np.sin, x) + 1
+    with pytest.raises(ValueError):
+        _ = expr * (y + 1)
@@ -0,0 +1,150 @@
+"""
+Test the SparsePolynomial module
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.polynomial import SparsePolynomial
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+# Create the dummy polynomial
+x = Variable("x", -10, 10)
+y = Variable("y", -10, 10)
+z = Variable("z", -10, 10)
+poly_to_test = SparsePolynomial.from_expression(x * y + 2 * x + 1)
+
+
+@pytest.mark.polynomial
+def test_create_from_expression():
+    """Test the creation of a SparsePolynomial from a MathExpression.
+
+    This test checks that the CSR arrays are built with one row per monomial.
+    """
+    poly = poly_to_test
+    assert poly.variables == [x, y]
+    assert poly.num_terms == 2
+    assert poly.indptr.tolist() == [0, 2, 3]
+    assert poly.indices.tolist() == [0, 1, 0]
+    assert poly.exponents.tolist() == [1, 1, 1]
+    assert poly.coefficients.tolist() == [1.0, 2.0]
+    assert poly.constant == 1.0
+    assert poly.degree == 2
+
+
+@pytest.mark.polynomial
+def test_merge_repeated_factors():
+    """Test that the repeated variables of a monomial are merged.
+
+    This test checks that x*x is stored as one factor with exponent 2.
+    """
+    poly = SparsePolynomial.from_expression(x ** 2)
+    assert poly.indices.tolist() == [0]
+    assert poly.exponents.tolist() == [2]
+
+
+@pytest.mark.polynomial
+def test_not_polynomial_expression():
+    """Test the conversion of an expression that is not a polynomial.
+
+    This test checks that the MathFunction terms raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        SparsePolynomial.from_expression(MathFunction(np.sin, x) + y)
+
+
+@pytest.mark.polynomial
+def test_evaluate_polynomial():
+    """Test the evaluation of a SparsePolynomial.
+
+    This test checks that the dict and the vector evaluation give the same
+    value as the original expression.
+    """
+    poly = poly_to_test
+    assert poly.evaluate({"x": 2, "y": 3}) == 11
+    assert poly.evaluate(np.array([2.0, 3.0])) == 11
+    with pytest.raises(ValueError):
+        poly.evaluate({"x": 2})
+
+
+@pytest.mark.polynomial
+def test_evaluate_batch_polynomial():
+    """Test the batch evaluation of a SparsePolynomial.
+
+    This test checks that every row of the array is evaluated as one point.
+    """
+    result = poly_to_test.evaluate_batch(np.array([[2.0, 3.0], [0.0, 5.0]]))
+    assert result.tolist() == [11.0, 1.0]
+
+
+@pytest.mark.polynomial
+def test_add_and_sub_polynomials():
+    """Test the addition and subtraction of SparsePolynomials.
+
+    This test checks that the like terms are merged and that the
+    cancelled terms are removed.
+    """
+    poly = poly_to_test + poly_to_test
+    assert poly.num_terms == 2
+    assert poly.coefficients.tolist() == [2.0, 4.0]
+    assert poly.constant == 2.0
+    assert (poly_to_test - poly_to_test).num_terms == 0
+    assert (poly_to_test + z).variables == [x, y, z]
+
+
+@pytest.mark.polynomial
+def test_mul_polynomials():
+    """Test the multiplication of SparsePolynomials.
+
+    This test checks that the product is expanded with like terms merged,
+    including the products with the constant terms.
+    """
+    poly = (poly_to_test + z) * (poly_to_test - z)
+    values = {"x": 2, "y": 3, "z": 4}
+    assert poly.evaluate(values) == 11 ** 2 - 4 ** 2
+    assert (poly_to_test * poly_to_test).num_terms == 5
+    assert (poly_to_test * 0).num_terms == 0
+
+
+@pytest.mark.polynomial
+def test_reflected_operands():
+    """Test the operations with an eager Variable or MathExpression on the left.
+
+    This test checks that the eager operators leave the operation to the
+    SparsePolynomial, so `x + poly` and `(x + 1) * poly` return polynomials.
+    """
+    values = {"x": 2, "y": 3, "z": 4}
+    cases = [
+        (z + poly_to_test, 15),
+        (z * poly_to_test, 44),
+        (z - poly_to_test, -7),
+        ((z + 1) + poly_to_test, 16),
+        ((z + 1) * poly_to_test, 55),
+        ((z + 1) - poly_to_test, -6),
+    ]
+    for poly, expected in cases:
+        assert isinstance(poly, SparsePolynomial)
+        assert poly.evaluate(values) == expected
+
+
+@pytest.mark.polynomial
+def test_pow_polynomial():
+    """Test the power of a SparsePolynomial.
+
+    This test checks the result of the power and the invalid powers.
+    """
+    assert (poly_to_test ** 3).evaluate([2, 3]) == 11 ** 3
+    assert (poly_to_test ** 0).evaluate([2, 3]) == 1
+    with pytest.raises(ValueError):
+        _ = poly_to_test ** -1
+
+
+@pytest.mark.polynomial
+def test_to_expression():
+    """Test the conversion of a SparsePolynomial into a MathExpression.
+
+    This test checks that the expression has the same value.
+    """
+    poly = poly_to_test * poly_to_test
+    expr = poly.to_expression()
+    assert expr.evaluate({"x": 2, "y": 3}) == poly.evaluate([2, 3])
@@ -0,0 +1,78 @@
+"""
+Test the Model registry
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.registry import Model
+from pymath_compute.model.variable import Variable
+
+x = Variable("x", 0, 10)
+y = Variable("y", -5, 5)
+z = Variable("z", -5, 5)
+
+
+@pytest.mark.registry
+def test_register_variables():
+    """Test the registration of variables.
+
+    This test checks that each variable gets a stable index, and that
+    registering it again returns the same index.
+    """
+    model = Model([x, y])
+    assert model.add_variable(z) == 2
+    assert model.add_variable(x) == 0
+    assert model.index(y) == 1
+    assert model.index("z") == 2
+    assert model.num_variables == 3
+    with pytest.raises(ValueError):
+        model.index(Variable("w", 0, 1))
+
+
+@pytest.mark.registry
+def test_register_invalid_variables():
+    """Test the registration of invalid variables.
+
+    This test checks that the repeated names and the wrong types raise errors.
+    """
+    model = Model([x])
+    with pytest.raises(ValueError):
+        model.add_variable(Variable("x", 0, 1))
+    with pytest.raises(TypeError):
+        model.add_variable("x")  # type: ignore
+
+
+@pytest.mark.registry
+def test_evaluate_expressions():
+    """Test the evaluation of the attached expressions.
+
+    This test checks that every expression is evaluated from one vector, and
+    that the variables of the expressions are registered automatically.
+    """
+    model = Model([z])
+    assert model.add_expression(x + 2 * y) == 0
+    assert model.add_expression(x * y + z) == 1
+    assert model.variables == [z, x, y]
+    result = model.evaluate(np.array([3.0, 1.0, 2.0]))
+    assert result.tolist() == [5.0, 5.0]
+    assert model.evaluate_expression(1, [3.0, 1.0, 2.0]) == 5.0
+    with pytest.raises(ValueError):
+        model.evaluate(np.array([1.0, 2.0]))
+
+
+@pytest.mark.registry
+def test_value_vectors():
+    """Test the conversion between values and vectors.
+
+    This test checks the vector built from a dict, the bounds and the
+    assignment of the values of the variables.
+    """
+    model = Model([x, y])
+    assert model.vector({"y": 2, "x": 1}).tolist() == [1.0, 2.0]
+    with pytest.raises(ValueError):
+        model.vector({"x": 1})
+    lower, upper = model.bounds()
+    assert lower.tolist() == [0, -5] and upper.tolist() == [10, 5]
+    model.set_values(np.array([4.0, -1.0]))
+    assert x.value == 4.0 and y.value == -1.0
+    assert model.vector().tolist() == [4.0, -1.0]
@@ -0,0 +1,73 @@
+"""
+Test the serialization of the model classes
+"""
+import pickle
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.expression_set import ExpressionSet
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+from pymath_compute.model.monomial import Monomial
+
+
+@pytest.mark.serialization
+def test_pickle_variable():
+    """Test the serialization of a Variable.
+
+    This test checks that the bounds and the value are kept, and that the loaded
+    variable takes a new unique id.
+    """
+    x = Variable("x", -1, 5)
+    x.value = 2.5
+    loaded = pickle.loads(pickle.dumps(x))
+    assert (loaded.name, loaded.lower_bound, loaded.upper_bound, loaded.value) == \
+        ("x", -1, 5, 2.5)
+    assert loaded is not x
+    assert loaded.uid != x.uid
+
+
+@pytest.mark.serialization
+def test_pickle_expressions_share_variables():
+    """Test the serialization of several expressions at once.
+
+    This test checks that the variables are shared between the loaded expressions,
+    that the monomials are interned again and that the values are the same.
+    """
+    x = Variable("x", -10, 10)
+    y = Variable("y", -10, 10)
+    block = Variable.array("b", 3, 0, 1)
+    first = x * y * y + 2 * x + MathFunction(np.sin, y) + 3 + block[1] * x
+    second = x ** 2 - y
+    first.compile()
+    loaded_x, loaded_first, loaded_second, loaded_block = pickle.loads(
+        pickle.dumps([x, first, second, block]))
+    values = {"x": 1.5, "y": -2.0, "b[1]": 0.5}
+    assert loaded_first.evaluate(values) == pytest.approx(first.evaluate(values))
+    assert loaded_second.evaluate(values) == pytest.approx(second.evaluate(values))
+    loaded_y = loaded_second.variables[1]
+    assert loaded_first.variables[0] is loaded_second.variables[0] is loaded_x
+    assert loaded_block[1] in loaded_first.variables
+    # The products are the canonical keys of the process that loads them
+    assert Monomial.from_powers({loaded_x: 1, loaded_y: 2}) in loaded_first.terms
+    assert (loaded_x * loaded_y * loaded_y).terms.keys() <= loaded_first.terms.keys()
+    assert loaded_first._compiled is None  # pylint: disable=W0212
+    # The block keeps its arrays and its views
+    assert loaded_block.shape == (3,)
+    loaded_block.values = [0.1, 0.2, 0.3]
+    assert loaded_block[2].value == 0.3
+
+
+@pytest.mark.serialization
+def test_pickle_expression_set():
+    """Test the serialization of an ExpressionSet.
+
+    This test checks that the loaded set generates its evaluator again.
+    """
+    x = Variable("x", -10, 10)
+    y = Variable("y", -10, 10)
+    expressions = ExpressionSet([x * y + 1, MathExpression({x: 2, "const": 1}),
+                                 MathFunction(np.cos, y) + x])
+    loaded = pickle.loads(pickle.dumps(expressions))
+    np.testing.assert_allclose(loaded.evaluate([1.0, 2.0]), expressions.evaluate([1.0, 2.0]))
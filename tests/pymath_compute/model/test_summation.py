@@ -0,0 +1,55 @@
+"""
+Test the summation builders
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.summation import quicksum, linear_sum
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.expression import MathExpression
+
+variables = [Variable(f"x{i}", -10, 10) for i in range(5)]
+
+
+@pytest.mark.summation
+def test_quicksum():
+    """Test the quicksum builder.
+
+    This test checks that every kind of term is added into one expression.
+    """
+    expr = quicksum([variables[0], 2 * variables[1], 3, variables[0]])
+    assert isinstance(expr, MathExpression)
+    assert expr.terms == {variables[0]: 2, variables[1]: 2, "const": 3}
+
+
+@pytest.mark.summation
+def test_quicksum_empty():
+    """Test the quicksum builder without terms.
+
+    This test checks that the empty sum is evaluated as zero.
+    """
+    assert quicksum([]).evaluate({}) == 0
+
+
+@pytest.mark.summation
+def test_linear_sum():
+    """Test the linear_sum builder.
+
+    This test checks that the coefficients can be a NumPy array and that
+    the repeated variables are merged.
+    """
+    expr = linear_sum(np.arange(5), variables, constant=1)
+    assert expr.terms[variables[3]] == 3
+    assert expr.evaluate({var.name: 1 for var in variables}) == 11
+    expr = linear_sum([1, 2], [variables[0], variables[0]])
+    assert expr.terms == {variables[0]: 3}
+
+
+@pytest.mark.summation
+def test_linear_sum_invalid_length():
+    """Test the linear_sum builder with different lengths.
+
+    This test checks that a ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        linear_sum([1, 2], variables)
@@ -0,0 +1,96 @@
+"""
+Test the VariableArray module
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.variable_array import VariableArray, ArrayVariable
+from pymath_compute.model.expression import MathExpression
+from pymath_compute.model.summation import linear_sum
+
+
+@pytest.mark.variable_array
+def test_create_variable_array():
+    """Test the creation of a VariableArray.
+
+    This test checks that the bounds are broadcast into flat arrays and that
+    each element is a Variable view.
+    """
+    x = Variable.array("x", 3, lower_bound=0, upper_bound=np.array([1, 2, 3]))
+    assert isinstance(x, VariableArray)
+    assert x.size == 3
+    assert x.lower_bounds.tolist() == [0, 0, 0]
+    assert x.upper_bounds.tolist() == [1, 2, 3]
+    assert isinstance(x[1], ArrayVariable)
+    assert isinstance(x[1], Variable)
+    assert x[1].name == "x[1]"
+    assert x[1].upper_bound == 2
+
+
+@pytest.mark.variable_array
+def test_multidimensional_array():
+    """Test a VariableArray with more than one dimension.
+
+    This test checks the names and the indexing of the views.
+    """
+    x = Variable.array("x", (2, 3), lower_bound=-1, upper_bound=1)
+    assert x.values.shape == (2, 3)
+    assert x[1, 2].name == "x[1,2]"
+    assert x[1, 2] is x.variables[5]
+
+
+@pytest.mark.variable_array
+def test_invalid_bounds():
+    """Test a VariableArray with invalid bounds.
+
+    This test checks that the wrong bounds raise errors.
+    """
+    with pytest.raises(ValueError):
+        Variable.array("x", 2, lower_bound=[0, 5], upper_bound=1)
+    with pytest.raises(TypeError):
+        Variable.array("x", 2, lower_bound=[0, 1, 2], upper_bound=1)
+
+
+@pytest.mark.variable_array
+def test_set_values_in_bulk():
+    """Test the bulk assignment of values.
+
+    This test checks that the views read the values of the block, and that
+    the values outside of the bounds raise an error or are clipped.
+    """
+    x = Variable.array("x", 3, lower_bound=0, upper_bound=10)
+    x.values = np.array([1.0, 2.0, 3.0])
+    assert x[2].value == 3.0
+    with pytest.raises(ValueError):
+        x.values = np.array([1.0, 20.0, 3.0])
+    assert x.values.tolist() == [1.0, 2.0, 3.0]
+    x.set_values(np.array([-5.0, 5.0, 15.0]), clip=True)
+    assert x.values.tolist() == [0.0, 5.0, 10.0]
+
+
+@pytest.mark.variable_array
+def test_set_single_value():
+    """Test the assignment of the value of a single view.
+
+    This test checks that the value is written in the block and that
+    the bounds are checked.
+    """
+    x = Variable.array("x", 3, lower_bound=0, upper_bound=10)
+    x[0].value = 4.0
+    assert x.values[0] == 4.0
+    with pytest.raises(ValueError):
+        x[0].value = 11.0
+
+
+@pytest.mark.variable_array
+def test_views_in_expressions():
+    """Test the views inside mathematical expressions.
+
+    This test checks that the views work as Variable terms.
+    """
+    x = Variable.array("x", 3, lower_bound=0, upper_bound=10)
+    expr = 2 * x[0] + x[1] * x[2] + 1
+    assert isinstance(expr, MathExpression)
+    assert expr.evaluate({"x[0]": 1, "x[1]": 2, "x[2]": 3}) == 9
+    assert linear_sum(np.ones(3), x).evaluate({var.name: 2 for var in x}) == 6
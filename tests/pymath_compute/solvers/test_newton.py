@@ -0,0 +1,115 @@
+"""
+Test the Newton's method solver
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.solvers import newton
+from pymath_compute.model.summation import quicksum
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+from pymath_compute.model.compiler import compile_system_terms
+
+
+@pytest.mark.solvers
+def test_compiled_system():
+    """Test the compiled residuals and sparse Jacobian of a system.
+
+    This test checks the residuals and the Jacobian against the exact values.
+    """
+    x = Variable("x", 0, 10)
+    y = Variable("y", 0, 10)
+    z = Variable("z", 0, 10)
+    system = compile_system_terms(
+        [(x ** 2 * y + 1).terms, (y - z).terms, (MathFunction(np.sin, z) + 0).terms], [x, y, z])
+    assert system.shape == (3, 3)
+    assert system.nnz == 5
+    np.testing.assert_allclose(system.residuals([1, 2, 3]), [3, -1, np.sin(3)])
+    np.testing.assert_allclose(system.jacobian([1, 2, 3]).toarray(),
+                               [[4, 1, 0], [0, 1, -1], [0, 0, np.cos(3)]])
+
+
+@pytest.mark.solvers
+def test_newton_system():
+    """Test the Newton's method for a nonlinear system.
+
+    This test checks that the solution is found and written back into the variables.
+    """
+    x = Variable("x", 0, 10)
+    y = Variable("y", 0, 10)
+    x.value = 1
+    y.value = 3
+    result = newton([x ** 2 + y ** 2 - 4, x - y])
+    assert result.success
+    assert x.value == pytest.approx(np.sqrt(2))
+    assert y.value == pytest.approx(np.sqrt(2))
+
+
+@pytest.mark.solvers
+def test_newton_large_sparse_system():
+    """Test the Newton's method for a large tridiagonal system.
+
+    This test checks that the factorization with the reused ordering converges.
+    """
+    u = Variable.array("u", 2000, -10, 10)
+    equations = []
+    for i in range(u.size):
+        equation = 3 * u[i] + u[i] ** 3 - 1
+        if i > 0:
+            equation = equation - u[i - 1]
+        if i < u.size - 1:
+            equation = equation - u[i + 1]
+        equations.append(equation)
+    result = newton(equations, line_search=True)
+    assert result.success
+    assert result.nit > 1
+    assert np.max(np.abs(result.fun)) <= 1e-10
+
+
+@pytest.mark.solvers
+def test_newton_long_equation():
+    """Test the Newton's method for a system with a dense equation.
+
+    This test checks that an equation with thousands of terms is compiled, one
+    term at a time, and that the system converges.
+    """
+    u = Variable.array("u", 6000, -10, 10)
+    equations = [quicksum(u[i] for i in range(u.size)) - u.size]
+    equations.extend(u[i] - u[i + 1] for i in range(u.size - 1))
+    result = newton(equations)
+    assert result.success
+    np.testing.assert_allclose(result.x, np.ones(u.size))
+
+
+@pytest.mark.solvers
+def test_newton_bounds_and_damping():
+    """Test the Newton's method with the damping and the bounds.
+
+    This test checks that the root inside the bounds is found, and that every
+    step stays inside the bounds.
+    """
+    x = Variable("x", 0, 5)
+    x.value = 4
+    result = newton([x ** 2 - 4], damping=0.5, line_search=True)
+    assert result.success
+    assert x.value == pytest.approx(2)
+    x.value = 0.1
+    result = newton([x + 1], max_iter=5)
+    assert not result.success
+    assert x.value == 0
+
+
+@pytest.mark.solvers
+def test_newton_invalid_params():
+    """Test the Newton's method with invalid params.
+
+    This test checks the errors for non square systems and wrong params.
+    """
+    x = Variable("x", 0, 5)
+    y = Variable("y", 0, 5)
+    with pytest.raises(ValueError):
+        newton([x + y])
+    with pytest.raises(ValueError):
+        newton([x - 1], damping=0)
+    with pytest.raises(TypeError):
+        newton([x])  # type: ignore
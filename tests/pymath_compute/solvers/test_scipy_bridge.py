@@ -0,0 +1,105 @@
+"""
+Test the scipy.optimize bridge
+"""
+import pytest
+import numpy as np
+# Local imports
+from pymath_compute.solvers import minimize
+from pymath_compute.model.variable import Variable
+from pymath_compute.model.function import MathFunction
+
+
+@pytest.mark.solvers
+def test_minimize_default_method():
+    """Test the minimization with the default method.
+
+    This test checks that the optimum is written back into the variables.
+    """
+    x = Variable("x", -10, 10)
+    y = Variable("y", -10, 10)
+    result = minimize((x - 1) ** 2 + (y + 2) ** 2 + x * y)
+    assert result.success
+    assert x.value == pytest.approx(8 / 3, abs=1e-5)
+    assert y.value == pytest.approx(-10 / 3, abs=1e-5)
+
+
+@pytest.mark.solvers
+def test_minimize_respects_bounds():
+    """Test the minimization with an optimum outside of the bounds.
+
+    This test checks that the bounds are built from the variables.
+    """
+    x = Variable("x", 2, 10)
+    result = minimize(x ** 2 - 2 * x, method="L-BFGS-B")
+    assert result.x[0] == pytest.approx(2)
+    assert x.value == pytest.approx(2)
+
+
+@pytest.mark.solvers
+@pytest.mark.parametrize("method", ["BFGS", "Newton-CG", "trust-exact", "trust-constr"])
+def test_minimize_methods(method):
+    """Test the minimization with methods that use the gradient and the Hessian.
+
+    This test checks that the compiled derivatives are used by each method.
+    """
+    x = Variable("x", -np.inf, np.inf)
+    y = Variable("y", -np.inf, np.inf)
+    x.value = 1.0
+    expr = (x - 0.5) ** 2 + (y - 1) ** 4 + MathFunction(np.cos, x)
+    minimize(expr, method=method)
+    assert 2 * (x.value - 0.5) - np.sin(x.value) == pytest.approx(0, abs=1e-4)
+    assert y.value == pytest.approx(1, abs=5e-2)
+
+
+@pytest.mark.solvers
+@pytest.mark.parametrize("method", ["Newton-CG", "dogleg", "trust-ncg", "trust-krylov",
+                                    "trust-exact", "trust-constr"])
+def test_minimize_hessian_methods(method):
+    """Test the minimization with every method that uses the Hessian.
+
+    This test checks that each method receives the Hessian in a format it accepts
+    (sparse or dense) and that it reaches the optimum.
+    """
+    x = Variable("x", -np.inf, np.inf)
+    y = Variable("y", -np.inf, np.inf)
+    x.value, y.value = 2.0, -1.0
+    expr = (x - 0.5) ** 2 + 2 * (y - 1) ** 2 + 0.5 * x * y + MathFunction(np.cos, x)
+    result = minimize(expr, method=method)
+    assert result.success
+    # The gradient is zero at the optimum
+    assert 2 * (x.value - 0.5) + 0.5 * y.value - np.sin(x.value) == pytest.approx(0, abs=1e-4)
+    assert 4 * (y.value - 1) + 0.5 * x.value == pytest.approx(0, abs=1e-4)
+    np.testing.assert_allclose(result.x, [x.value, y.value])
+
+
+@pytest.mark.solvers
+def test_minimize_active_bound():
+    """Test the minimization with an active bound.
+
+    This test checks that a bounded method reaches the optimum on the bound, and that
+    the methods that can't enforce the bounds raise an error instead of clipping
+    their unconstrained optimum.
+    """
+    x = Variable("x", -10, 10)
+    y = Variable("y", 1, 10)
+    expr = (x - 1) ** 2 + (y + 1) ** 2 + x * y
+    result = minimize(expr, method="L-BFGS-B")
+    assert x.value == pytest.approx(0.5, abs=1e-5)
+    assert y.value == pytest.approx(1)
+    np.testing.assert_allclose(result.x, [x.value, y.value])
+    for method in ("BFGS", "CG", "Newton-CG", "dogleg", "trust-ncg"):
+        with pytest.raises(ValueError):
+            minimize(expr, method=method)
+
+
+@pytest.mark.solvers
+def test_minimize_invalid_params():
+    """Test the minimization with invalid params.
+
+    This test checks the errors for the wrong objective or initial point.
+    """
+    x = Variable("x", -5, 5)
+    with pytest.raises(TypeError):
+        minimize(x)  # type: ignore
+    with pytest.raises(ValueError):
+        minimize(x ** 2, x0=np.array([1.0, 2.0]))